@@ -9,15 +9,86 @@ Version: 1.0.0
 
 import sqlite3
 import json
+import functools
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
+
+
+def _locked(method):
+    """
+    Run a DatabaseManager method while holding the manager's lock
+    
+    Args:
+        method: Method to wrap
+        
+    Returns:
+        Wrapped method
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+def casefold(value: Any) -> Any:
+    """
+    Fold the case of text values the way the CASEFOLD SQL function does
+    
+    SQLite's own lower() only folds ASCII, which misses accented letters.
+    
+    Args:
+        value: Column or parameter value
+        
+    Returns:
+        Case-folded string, or the value unchanged if it is not text
+    """
+    return value.casefold() if isinstance(value, str) else value
+
+def _casefold_collation(left: str, right: str) -> int:
+    """
+    Compare two strings after case folding (the CASEFOLD SQL collation)
+    
+    Orders the same way as sorting in Python with casefold() as the key.
+    
+    Args:
+        left: First string
+        right: Second string
+        
+    Returns:
+        Negative, zero or positive like a classic cmp function
+    """
+    left, right = left.casefold(), right.casefold()
+    return (left > right) - (left < right)
 
 class DatabaseManager:
     """
     Manages SQLite database operations for property data
     """
     
+    # Sortable property columns and their ORDER BY expressions
+    SORTABLE_COLUMNS = {
+        'id': 'id',
+        'title': 'title COLLATE CASEFOLD',
+        'property_type': 'property_type COLLATE CASEFOLD',
+        'price': 'price',
+        'surface_area': 'surface_area',
+        'rooms': 'rooms',
+        'bedrooms': 'bedrooms',
+        'bathrooms': 'bathrooms',
+        'city': 'city COLLATE CASEFOLD',
+        'status': 'status COLLATE CASEFOLD',
+        'created_at': 'created_at',
+        'updated_at': 'updated_at'
+    }
+    
+    # Columns returned for property list views
+    SUMMARY_COLUMNS = (
+        'id, title, property_type, price, currency, surface_area, rooms, '
+        'bedrooms, bathrooms, city, status, created_at, updated_at'
+    )
+    
     def __init__(self, db_path: str = None):
         """
         Initialize database manager
@@ -30,7 +101,12 @@ class DatabaseManager:
         
         self.db_path = str(db_path)
         self.connection = None
+        
+        # The connection is shared by the Tk thread and background workers,
+        # so every operation holds this lock
+        self._lock = threading.RLock()
     
+    @_locked
     def connect(self) -> sqlite3.Connection:
         """
         Create database connection
@@ -39,10 +115,14 @@ class DatabaseManager:
             SQLite connection object
         """
         if self.connection is None:
-            self.connection = sqlite3.connect(self.db_path)
+            # Also used from GUI background worker threads (calls are serialized by _lock)
+            self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
             self.connection.row_factory = sqlite3.Row
+            self.connection.create_function("casefold", 1, casefold, deterministic=True)
+            self.connection.create_collation("CASEFOLD", _casefold_collation)
         return self.connection
     
+    @_locked
     def close(self):
         """
         Close database connection
@@ -51,6 +131,22 @@ class DatabaseManager:
             self.connection.close()
             self.connection = None
     
+    @_locked
+    def backup(self, backup_path: str):
+        """
+        Write a consistent copy of the database to another file
+        
+        Args:
+            backup_path: Destination database file
+        """
+        conn = self.connect()
+        backup_conn = sqlite3.connect(backup_path)
+        try:
+            conn.backup(backup_conn)
+        finally:
+            backup_conn.close()
+    
+    @_locked
     def initialize_database(self):
         """
         Create database tables if they don't exist
@@ -120,6 +216,18 @@ class DatabaseManager:
             )
         """)
         
+        # Indexes used for sorting and filtering the property list
+        # (the id tie-breaker is the implicit last index column, so plain
+        # ascending indexes serve both sort directions, and text indexes must
+        # use the same collation as SORTABLE_COLUMNS to be usable at all)
+        cursor.execute("DROP INDEX IF EXISTS idx_properties_updated_at")
+        cursor.execute("DROP INDEX IF EXISTS idx_properties_city")
+        cursor.execute("DROP INDEX IF EXISTS idx_properties_type")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_properties_updated ON properties (updated_at)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_properties_price ON properties (price)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_properties_city_casefold ON properties (city COLLATE CASEFOLD)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_properties_type_casefold ON properties (property_type COLLATE CASEFOLD)")
+        
         # Insert default templates
         self._insert_default_templates(cursor)
         
@@ -197,6 +305,7 @@ class DatabaseManager:
                 template['config']
             ))
     
+    @_locked
     def create_property(self, property_data: Dict[str, Any]) -> int:
         """
         Create a new property record
@@ -255,6 +364,7 @@ class DatabaseManager:
         
         return property_id
     
+    @_locked
     def get_property(self, property_id: int) -> Optional[Dict[str, Any]]:
         """
         Retrieve a property by ID
@@ -282,6 +392,7 @@ class DatabaseManager:
         
         return None
     
+    @_locked
     def get_all_properties(self) -> List[Dict[str, Any]]:
         """
         Retrieve all properties
@@ -307,6 +418,145 @@ class DatabaseManager:
         
         return properties
     
+    def _build_property_filters(self, filters: Optional[Dict[str, Any]]) -> Tuple[str, List[Any]]:
+        """
+        Build the WHERE clause for property list filters
+        
+        Args:
+            filters: Dictionary of filters to apply
+            
+        Returns:
+            Tuple of (WHERE clause, query parameters)
+        """
+        clauses = []
+        params = []
+        filters = filters or {}
+        
+        # Search filter (searches in title and city)
+        if filters.get('search'):
+            clauses.append("instr(casefold(coalesce(title, '') || ' ' || coalesce(city, '')), casefold(?)) > 0")
+            params.append(filters['search'])
+        
+        if filters.get('property_type'):
+            clauses.append("casefold(property_type) = casefold(?)")
+            params.append(filters['property_type'])
+        
+        if filters.get('min_price') is not None:
+            clauses.append("coalesce(price, 0) >= ?")
+            params.append(filters['min_price'])
+        
+        if filters.get('max_price') is not None:
+            clauses.append("coalesce(price, 0) <= ?")
+            params.append(filters['max_price'])
+        
+        if filters.get('city'):
+            clauses.append("instr(casefold(coalesce(city, '')), casefold(?)) > 0")
+            params.append(filters['city'])
+        
+        if filters.get('status'):
+            clauses.append("casefold(status) = casefold(?)")
+            params.append(filters['status'])
+        
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+    
+    def _build_properties_page_query(self, filters: Optional[Dict[str, Any]],
+                                     sort_column: str, sort_direction: str,
+                                     limit: Optional[int], offset: int) -> Tuple[str, List[Any]]:
+        """
+        Build the SELECT query used by get_properties_page
+        
+        Args:
+            filters: Dictionary of filters to apply
+            sort_column: Column to sort by (must be in SORTABLE_COLUMNS)
+            sort_direction: Sort direction (asc/desc)
+            limit: Maximum number of rows to return (None for all)
+            offset: Number of rows to skip
+            
+        Returns:
+            Tuple of (query, query parameters)
+        """
+        where, params = self._build_property_filters(filters)
+        
+        # Only whitelisted expressions are formatted into the query
+        order_by = self.SORTABLE_COLUMNS.get(sort_column, self.SORTABLE_COLUMNS['updated_at'])
+        direction = "ASC" if (sort_direction or "").lower() == "asc" else "DESC"
+        
+        query = (f"SELECT {self.SUMMARY_COLUMNS} FROM properties {where} "
+                 f"ORDER BY {order_by} {direction}, id {direction}")
+        if limit is not None:
+            query += " LIMIT ? OFFSET ?"
+            params = params + [limit, offset]
+        
+        return query, params
+    
+    @_locked
+    def get_properties_page(self, filters: Optional[Dict[str, Any]] = None,
+                            sort_column: str = "updated_at",
+                            sort_direction: str = "desc",
+                            limit: Optional[int] = None,
+                            offset: int = 0) -> List[Dict[str, Any]]:
+        """
+        Retrieve filtered, sorted property rows for list views
+        
+        Args:
+            filters: Dictionary of filters to apply
+            sort_column: Column to sort by (must be in SORTABLE_COLUMNS)
+            sort_direction: Sort direction (asc/desc)
+            limit: Maximum number of rows to return (None for all)
+            offset: Number of rows to skip
+            
+        Returns:
+            List of property row dictionaries
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        query, params = self._build_properties_page_query(filters, sort_column, sort_direction, limit, offset)
+        cursor.execute(query, params)
+        return [dict(row) for row in cursor.fetchall()]
+    
+    @_locked
+    def count_properties(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Count properties matching the given filters
+        
+        Args:
+            filters: Dictionary of filters to apply
+            
+        Returns:
+            Number of matching properties
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        where, params = self._build_property_filters(filters)
+        cursor.execute(f"SELECT COUNT(*) FROM properties {where}", params)
+        return cursor.fetchone()[0]
+    
+    @_locked
+    def count_property_media(self, property_id: int) -> int:
+        """
+        Count the media files of a property without decoding them
+        
+        Args:
+            property_id: Property ID
+            
+        Returns:
+            Number of media files (0 if the property doesn't exist)
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        cursor.execute(
+            "SELECT json_array_length(coalesce(media_files, '[]')) FROM properties WHERE id = ?",
+            (property_id,)
+        )
+        row = cursor.fetchone()
+        
+        return row[0] if row else 0
+    
+    @_locked
     def update_property(self, property_id: int, property_data: Dict[str, Any]) -> bool:
         """
         Update an existing property
@@ -368,6 +618,7 @@ class DatabaseManager:
         
         return success
     
+    @_locked
     def delete_property(self, property_id: int) -> bool:
         """
         Delete a property
@@ -388,6 +639,7 @@ class DatabaseManager:
         
         return success
     
+    @_locked
     def get_templates(self) -> List[Dict[str, Any]]:
         """
         Retrieve all available templates
@@ -409,6 +661,7 @@ class DatabaseManager:
         
         return templates
     
+    @_locked
     def create_project(self, project_data: Dict[str, Any]) -> int:
         """
         Create a new project
@@ -444,6 +697,7 @@ class DatabaseManager:
         
         return project_id
     
+    @_locked
     def get_projects(self) -> List[Dict[str, Any]]:
         """
         Retrieve all projects
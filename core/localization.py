@@ -20,8 +20,11 @@ class LocalizationManager:
         """
         self.current_language = 'fr'  # Default to French
         self.translations = {}
+        # Current language merged over English, rebuilt when the language changes
+        self._catalog = {}
         self.locales_dir = Path(__file__).parent.parent / 'locales'
         self.load_translations()
+        self._build_catalog()
     
     def load_translations(self) -> None:
         """
@@ -83,6 +86,18 @@ class LocalizationManager:
         else:
             print(f"Language '{language}' not supported. Using English.")
             self.current_language = 'en'
+        self._build_catalog()
+    
+    def _build_catalog(self) -> None:
+        """
+        Merge the current language over English so lookups need a single dict access.
+        """
+        catalog = dict(self.translations.get('en', {}))
+        catalog.update(
+            (key, text) for key, text in self.translations.get(self.current_language, {}).items()
+            if text is not None
+        )
+        self._catalog = catalog
     
     def get_language(self) -> str:
         """
@@ -104,23 +119,31 @@ class LocalizationManager:
         Returns:
             Translated text
         """
-        try:
-            # Get translation from current language
-            translation = self.translations[self.current_language].get(key)
-            
-            # Fallback to English if not found
-            if translation is None:
-                translation = self.translations['en'].get(key, key)
-            
-            # Format with parameters if provided
-            if kwargs:
+        # Current language, falling back to English, then to the key itself
+        translation = self._catalog.get(key, key)
+        
+        # Format with parameters if provided
+        if kwargs:
+            try:
                 return translation.format(**kwargs)
-            
-            return translation
-            
-        except Exception as e:
-            print(f"Error translating key '{key}': {e}")
-            return key
+            except Exception as e:
+                print(f"Error translating key '{key}': {e}")
+                return key
+        
+        return translation
+    
+    def translate_many(self, *keys: str) -> Dict[str, str]:
+        """
+        Get translated texts for several keys at once.
+        
+        Args:
+            *keys: Translation keys
+        
+        Returns:
+            Dictionary mapping each key to its translated text
+        """
+        catalog = self._catalog
+        return {key: catalog.get(key, key) for key in keys}
     
     def _get_default_english_translations(self) -> Dict[str, str]:
         """
@@ -544,6 +567,18 @@ def translate(key: str, **kwargs) -> str:
     """
     return get_localization_manager().translate(key, **kwargs)
 
+def translate_many(*keys: str) -> Dict[str, str]:
+    """
+    Convenience function to translate several keys at once.
+    
+    Args:
+        *keys: Translation keys
+    
+    Returns:
+        Dictionary mapping each key to its translated text
+    """
+    return get_localization_manager().translate_many(*keys)
+
 def set_language(language: str) -> None:
     """
     Convenience function to set the language.
@@ -8,10 +8,12 @@ Version: 1.0.0
 """
 
 import os
+import copy
 import shutil
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import List, Dict, Optional, Any, Tuple
-from datetime import datetime
 
 from .database import DatabaseManager
 from .media_handler import MediaHandler
@@ -21,6 +23,9 @@ class PropertyManager:
     Manages property-related business logic and operations
     """
     
+    # Number of full property records kept in memory
+    PROPERTY_CACHE_SIZE = 128
+    
     def __init__(self, db_manager: DatabaseManager = None):
         """
         Initialize property manager
@@ -33,8 +38,15 @@ class PropertyManager:
         self.project_root = Path(__file__).parent.parent
         self.projects_dir = self.project_root / "data" / "projects"
         
+        # Recently read properties by ID, least recent first
+        self._property_cache = OrderedDict()
+        self._property_cache_lock = threading.Lock()
+        
         # Ensure projects directory exists
         self.projects_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Incremented on every property change, lets callers cache derived data
+        self.revision = 0
     
     def create_property(self, property_data: Dict[str, Any]) -> int:
         """
@@ -46,7 +58,9 @@ class PropertyManager:
         Returns:
             Property ID
         """
-        return self.db_manager.create_property(property_data)
+        property_id = self.db_manager.create_property(property_data)
+        self._property_changed(property_id)
+        return property_id
     
     def create_property_with_media(self, property_data: Dict[str, Any], 
                                  media_files: List[str] = None) -> Tuple[int, str]:
@@ -103,6 +117,7 @@ class PropertyManager:
             property_data['media_files'] = processed_media
             self.db_manager.update_property(property_id, property_data)
         
+        self._property_changed(property_id)
         return property_id, str(media_dir)
     
     def update_property_media(self, property_id: int, 
@@ -157,7 +172,9 @@ class PropertyManager:
         
         # Update property with new media information
         property_data['media_files'] = existing_media
-        return self.db_manager.update_property(property_id, property_data)
+        success = self.db_manager.update_property(property_id, property_data)
+        self._property_changed(property_id)
+        return success
     
     def remove_media_file(self, property_id: int, filename: str) -> bool:
         """
@@ -205,7 +222,9 @@ class PropertyManager:
         
         # Update property
         property_data['media_files'] = updated_media
-        return self.db_manager.update_property(property_id, property_data)
+        success = self.db_manager.update_property(property_id, property_data)
+        self._property_changed(property_id)
+        return success
     
     def get_property_by_id(self, property_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -217,7 +236,71 @@ class PropertyManager:
         Returns:
             Property data dictionary or None if not found
         """
-        return self.db_manager.get_property(property_id)
+        with self._property_cache_lock:
+            cached = self._property_cache.get(property_id)
+            if cached is not None:
+                self._property_cache.move_to_end(property_id)
+                return copy.deepcopy(cached)
+        
+        property_data = self.db_manager.get_property(property_id)
+        if property_data:
+            # Callers may modify the returned dictionary, so cache a copy
+            with self._property_cache_lock:
+                self._property_cache[property_id] = copy.deepcopy(property_data)
+                if len(self._property_cache) > self.PROPERTY_CACHE_SIZE:
+                    self._property_cache.popitem(last=False)
+        return property_data
+    
+    def invalidate_property_cache(self, property_id: Optional[int] = None):
+        """
+        Drop cached property records after they changed
+        
+        Args:
+            property_id: Property to drop (None for all)
+        """
+        with self._property_cache_lock:
+            if property_id is None:
+                self._property_cache.clear()
+            else:
+                self._property_cache.pop(property_id, None)
+    
+    def _property_changed(self, property_id: int):
+        """
+        Record a change to a property
+        
+        Args:
+            property_id: Changed property ID
+        """
+        self.invalidate_property_cache(property_id)
+        self.revision += 1
+    
+    def get_property_media(self, property_id: int) -> List[Dict[str, Any]]:
+        """
+        Get the media files of a property
+        
+        Args:
+            property_id: Property ID
+            
+        Returns:
+            List of media file dictionaries
+        """
+        property_data = self.get_property_by_id(property_id)
+        if not property_data:
+            return []
+        
+        return property_data.get('media_files', [])
+    
+    def get_property_media_count(self, property_id: int) -> int:
+        """
+        Get the number of media files of a property
+        
+        Args:
+            property_id: Property ID
+            
+        Returns:
+            Number of media files
+        """
+        return self.db_manager.count_property_media(property_id)
     
     def update_property(self, property_id: int, property_data: Dict[str, Any]) -> bool:
         """
@@ -230,7 +313,9 @@ class PropertyManager:
         Returns:
             True if successful, False otherwise
         """
-        return self.db_manager.update_property(property_id, property_data)
+        success = self.db_manager.update_property(property_id, property_data)
+        self._property_changed(property_id)
+        return success
     
     def delete_property(self, property_id: int) -> bool:
         """
@@ -242,7 +327,9 @@ class PropertyManager:
         Returns:
             True if successful, False otherwise
         """
-        return self.db_manager.delete_property(property_id)
+        success = self.db_manager.delete_property(property_id)
+        self._property_changed(property_id)
+        return success
     
     def get_property_summary(self, property_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -312,97 +399,40 @@ class PropertyManager:
     
     def get_filtered_properties(self, filters: Dict[str, Any] = None, 
                               sort_column: str = "updated_at", 
-                              sort_direction: str = "desc") -> List[Dict[str, Any]]:
+                              sort_direction: str = "desc",
+                              limit: Optional[int] = None,
+                              offset: int = 0) -> List[Dict[str, Any]]:
         """
         Get filtered and sorted properties
         
+        Filtering, sorting and paging are done by SQLite so only the
+        requested page of rows is materialized.
+        
         Args:
             filters: Dictionary of filters to apply
             sort_column: Column to sort by
             sort_direction: Sort direction (asc/desc)
+            limit: Maximum number of properties to return (None for all)
+            offset: Number of properties to skip
             
         Returns:
-            List of filtered property summaries
+            List of filtered property rows
         """
-        # Get all properties
-        properties = self.get_all_property_summaries()
-        
-        # Apply filters if provided
-        if filters:
-            filtered_properties = []
-            
-            for prop in properties:
-                include_property = True
-                
-                # Search filter (searches in title, description, city)
-                if 'search' in filters and filters['search']:
-                    search_term = filters['search'].lower()
-                    searchable_text = f"{prop.get('title', '')} {prop.get('city', '')}".lower()
-                    if search_term not in searchable_text:
-                        include_property = False
-                
-                # Property type filter
-                if 'property_type' in filters and filters['property_type']:
-                    if prop.get('property_type', '').lower() != filters['property_type'].lower():
-                        include_property = False
-                
-                # Price range filters
-                if 'min_price' in filters and filters['min_price'] is not None:
-                    prop_price = prop.get('price', 0) or 0
-                    if prop_price < filters['min_price']:
-                        include_property = False
-                
-                if 'max_price' in filters and filters['max_price'] is not None:
-                    prop_price = prop.get('price', 0) or 0
-                    if prop_price > filters['max_price']:
-                        include_property = False
-                
-                # City filter
-                if 'city' in filters and filters['city']:
-                    prop_city = prop.get('city', '').lower()
-                    filter_city = filters['city'].lower()
-                    if filter_city not in prop_city:
-                        include_property = False
-                
-                # Status filter
-                if 'status' in filters and filters['status']:
-                    if prop.get('status', '').lower() != filters['status'].lower():
-                        include_property = False
-                
-                if include_property:
-                    filtered_properties.append(prop)
-            
-            properties = filtered_properties
+        return self.db_manager.get_properties_page(
+            filters, sort_column, sort_direction, limit, offset
+        )
+    
+    def count_filtered_properties(self, filters: Dict[str, Any] = None) -> int:
+        """
+        Count properties matching the given filters
         
-        # Apply sorting
-        if sort_column and properties:
-            reverse_sort = sort_direction.lower() == 'desc'
-            
-            # Define sort key function
-            def sort_key(prop):
-                value = prop.get(sort_column)
-                
-                # Handle different data types
-                if value is None:
-                    return '' if sort_column in ['title', 'city', 'property_type', 'status'] else 0
-                
-                if sort_column in ['price', 'surface_area', 'bedrooms', 'bathrooms', 'rooms']:
-                    try:
-                        return float(value) if value else 0
-                    except (ValueError, TypeError):
-                        return 0
-                
-                if sort_column in ['updated_at', 'created_at']:
-                    try:
-                        return datetime.fromisoformat(value.replace('Z', '+00:00')) if value else datetime.min
-                    except (ValueError, TypeError):
-                        return datetime.min
-                
-                return str(value).lower() if value else ''
+        Args:
+            filters: Dictionary of filters to apply
             
-            properties.sort(key=sort_key, reverse=reverse_sort)
-        
-        return properties
+        Returns:
+            Number of matching properties
+        """
+        return self.db_manager.count_properties(filters)
     
     def duplicate_property(self, property_id: int, new_title: str = None) -> Optional[int]:
         """
@@ -481,6 +511,7 @@ class PropertyManager:
             except Exception as e:
                 print(f"Error copying media files: {e}")
         
+        self._property_changed(new_property_id)
         return new_property_id
     
     def delete_property_with_media(self, property_id: int) -> bool:
@@ -502,7 +533,9 @@ class PropertyManager:
                 print(f"Error removing property directory: {e}")
         
         # Delete from database
-        return self.db_manager.delete_property(property_id)
+        success = self.db_manager.delete_property(property_id)
+        self._property_changed(property_id)
+        return success
     
     def export_property_data(self, property_id: int, export_path: str) -> bool:
         """
@@ -580,6 +613,7 @@ class PropertyManager:
                 property_media_dir = self.projects_dir / f"property_{property_id}" / "media"
                 shutil.copytree(import_media_dir, property_media_dir, dirs_exist_ok=True)
             
+            self._property_changed(property_id)
             return property_id
             
         except Exception as e:
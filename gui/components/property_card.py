@@ -9,21 +9,87 @@ Version: 1.0.0
 
 import tkinter as tk
 from tkinter import ttk
-from pathlib import Path
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, Tuple
 from PIL import Image, ImageTk
-import threading
+import queue
+import io
+import os
+import base64
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# Shared pool for PIL decodes, leaving a core for the Tk thread
+_DECODE_EXECUTOR = ThreadPoolExecutor(max_workers=max(1, (os.cpu_count() or 2) - 1))
+
+# Base64-encoded PNG thumbnails by (source path, mtime), least recently used first
+# (only touched from the Tk thread)
+_THUMB_CACHE: "OrderedDict[Tuple[str, int], bytes]" = OrderedDict()
+_THUMB_CACHE_SIZE = 256
+
+# Maximum number of finished thumbnails applied per drain tick
+_THUMBNAILS_PER_TICK = 10
+
+# ttk styles of the status badge, by property status
+_STATUS_STYLES = {
+    'draft': 'Status.Draft.TLabel',
+    'published': 'Status.Published.TLabel',
+    'archived': 'Status.Archived.TLabel'
+}
+
+# Fonts used for the text drawn on the card canvases
+_FONTS = {
+    'title': ('Segoe UI', 14, 'bold'),
+    'subtitle': ('Segoe UI', 10),
+    'price': ('Segoe UI', 16, 'bold'),
+    'details': ('Segoe UI', 9),
+    'small': ('Segoe UI', 8)
+}
+
+def _cache_thumbnail(cache_key: Tuple[str, int], data: bytes):
+    """
+    Store an encoded thumbnail, evicting the least recently used ones
+    
+    Args:
+        cache_key: (source path, mtime) of the image
+        data: Base64-encoded PNG thumbnail
+    """
+    _THUMB_CACHE[cache_key] = data
+    _THUMB_CACHE.move_to_end(cache_key)
+    while len(_THUMB_CACHE) > _THUMB_CACHE_SIZE:
+        _THUMB_CACHE.popitem(last=False)
+
+def _index_first_image(property_data: Dict[str, Any]) -> Optional[str]:
+    """
+    Resolve and cache the path of the first image of a property
+    
+    Args:
+        property_data: Property data dictionary
+        
+    Returns:
+        Path of the first image or None
+    """
+    if '_first_image_path' not in property_data:
+        property_data['_first_image_path'] = next(
+            (f.get('path') for f in property_data.get('media_files') or ()
+             if f.get('type') == 'image'),
+            None
+        )
+    return property_data['_first_image_path']
 
 class PropertyCard:
     """
     Custom property card widget for displaying property summaries
     """
     
+    # Background shared by all text canvases (resolved once from the ttk theme)
+    _canvas_bg = None
+    
     def __init__(self, parent, property_data: Dict[str, Any], 
                  on_click: Optional[Callable] = None,
                  on_edit: Optional[Callable] = None,
                  on_delete: Optional[Callable] = None,
-                 on_generate: Optional[Callable] = None):
+                 on_generate: Optional[Callable] = None,
+                 result_queue: Optional[queue.Queue] = None):
         """
         Initialize property card
         
@@ -34,6 +100,7 @@ class PropertyCard:
             on_edit: Callback when edit button is clicked
             on_delete: Callback when delete button is clicked
             on_generate: Callback when generate button is clicked
+            result_queue: Shared queue receiving (card, decoded thumbnail) results
         """
         self.parent = parent
         self.property_data = property_data
@@ -41,8 +108,11 @@ class PropertyCard:
         self.on_edit = on_edit
         self.on_delete = on_delete
         self.on_generate = on_generate
+        self.result_queue = result_queue
         
         self.thumbnail_image = None
+        self._pending_thumb_key = None
+        self._decoded = None
         
         self.create_card()
         self.load_thumbnail()
@@ -120,14 +190,8 @@ class PropertyCard:
         info_frame = ttk.Frame(parent)
         info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 15))
         
-        # Property title
-        title_label = ttk.Label(
-            info_frame,
-            text=self.property_data.get('title', 'Untitled Property'),
-            font=('Segoe UI', 14, 'bold'),
-            foreground='#2c3e50'
-        )
-        title_label.pack(anchor=tk.W)
+        # Each entry: (text, font key, color, top padding, wrap width)
+        lines = [(self.property_data.get('title', 'Untitled Property'), 'title', '#2c3e50', 0, 0)]
         
         # Property type and location
         type_location = []
@@ -137,29 +201,11 @@ class PropertyCard:
             type_location.append(self.property_data['city'])
         
         if type_location:
-            type_location_text = " • ".join(type_location)
-            type_label = ttk.Label(
-                info_frame,
-                text=type_location_text,
-                font=('Segoe UI', 10),
-                foreground='#7f8c8d'
-            )
-            type_label.pack(anchor=tk.W, pady=(2, 0))
+            lines.append((" • ".join(type_location), 'subtitle', '#7f8c8d', 2, 0))
         
         # Price
         if self.property_data.get('price'):
-            price_text = f"€{self.property_data['price']:,.0f}"
-            price_label = ttk.Label(
-                info_frame,
-                text=price_text,
-                font=('Segoe UI', 16, 'bold'),
-                foreground='#27ae60'
-            )
-            price_label.pack(anchor=tk.W, pady=(5, 0))
-        
-        # Property details
-        details_frame = ttk.Frame(info_frame)
-        details_frame.pack(anchor=tk.W, pady=(8, 0))
+            lines.append((f"€{self.property_data['price']:,.0f}", 'price', '#27ae60', 5, 0))
         
         # Rooms, surface area, etc.
         details = []
@@ -171,29 +217,14 @@ class PropertyCard:
             details.append(f"{self.property_data['surface_area']} m²")
         
         if details:
-            details_text = " • ".join(details)
-            details_label = ttk.Label(
-                details_frame,
-                text=details_text,
-                font=('Segoe UI', 9),
-                foreground='#95a5a6'
-            )
-            details_label.pack(side=tk.LEFT)
+            lines.append((" • ".join(details), 'details', '#95a5a6', 8, 0))
         
         # Description preview
         if self.property_data.get('description'):
             desc_text = self.property_data['description'][:100]
             if len(self.property_data['description']) > 100:
                 desc_text += "..."
-            
-            desc_label = ttk.Label(
-                info_frame,
-                text=desc_text,
-                font=('Segoe UI', 9),
-                foreground='#7f8c8d',
-                wraplength=300
-            )
-            desc_label.pack(anchor=tk.W, pady=(8, 0))
+            lines.append((desc_text, 'details', '#7f8c8d', 8, 300))
         
         # Features preview
         features = self.property_data.get('features', [])
@@ -201,14 +232,12 @@ class PropertyCard:
             features_text = ", ".join(features[:3])
             if len(features) > 3:
                 features_text += f" +{len(features) - 3} more"
-            
-            features_label = ttk.Label(
-                info_frame,
-                text=f"Features: {features_text}",
-                font=('Segoe UI', 8),
-                foreground='#95a5a6'
-            )
-            features_label.pack(anchor=tk.W, pady=(5, 0))
+            lines.append((f"Features: {features_text}", 'small', '#95a5a6', 5, 0))
+        
+        # Draw all text on a single canvas instead of one label per line
+        info_canvas = self._create_text_canvas(info_frame)
+        self._draw_text_lines(info_canvas, lines)
+        info_canvas.pack(anchor=tk.W)
     
     def create_actions_section(self, parent):
         """
@@ -220,25 +249,16 @@ class PropertyCard:
         actions_frame = ttk.Frame(parent)
         actions_frame.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Status badge
+        # Status badge (styles are registered once in MainWindow.setup_styles)
         status = self.property_data.get('status', 'draft')
-        status_colors = {
-            'draft': '#f39c12',
-            'published': '#27ae60',
-            'archived': '#95a5a6'
-        }
         
         status_frame = ttk.Frame(actions_frame)
         status_frame.pack(anchor=tk.NE, pady=(0, 10))
         
-        status_label = tk.Label(
+        status_label = ttk.Label(
             status_frame,
             text=status.upper(),
-            font=('Segoe UI', 8, 'bold'),
-            fg='white',
-            bg=status_colors.get(status, '#95a5a6'),
-            padx=8,
-            pady=2
+            style=_STATUS_STYLES.get(status, 'Status.Archived.TLabel')
         )
         status_label.pack()
         
@@ -288,78 +308,212 @@ class PropertyCard:
             )
             delete_btn.pack(pady=2)
         
-        # Quick stats
-        stats_frame = ttk.Frame(actions_frame)
-        stats_frame.pack(anchor=tk.NE, pady=(15, 0))
+        # Quick stats (property ID and creation date)
+        stats_lines = [(f"ID: {self.property_data.get('id', 'N/A')}", 'small', '#bdc3c7', 0, 0)]
+        if self.property_data.get('created_at'):
+            stats_lines.append((f"Created: {self.property_data['created_at'][:10]}", 'small', '#bdc3c7', 0, 0))
         
-        # Property ID
-        id_label = ttk.Label(
-            stats_frame,
-            text=f"ID: {self.property_data.get('id', 'N/A')}",
-            font=('Segoe UI', 8),
-            foreground='#bdc3c7'
+        stats_canvas = self._create_text_canvas(actions_frame)
+        self._draw_text_lines(stats_canvas, stats_lines, anchor=tk.NE, justify=tk.RIGHT)
+        stats_canvas.pack(anchor=tk.NE, pady=(15, 0))
+    
+    def _create_text_canvas(self, parent) -> tk.Canvas:
+        """
+        Create a borderless canvas blending with the card background
+        
+        Args:
+            parent: Parent widget
+            
+        Returns:
+            tk.Canvas: Canvas used to draw card text
+        """
+        if PropertyCard._canvas_bg is None:
+            PropertyCard._canvas_bg = ttk.Style(parent).lookup('TFrame', 'background') or 'white'
+        
+        return tk.Canvas(
+            parent,
+            bg=PropertyCard._canvas_bg,
+            highlightthickness=0,
+            borderwidth=0
         )
-        id_label.pack(anchor=tk.E)
+    
+    def _draw_text_lines(self, canvas: tk.Canvas, lines: list,
+                         anchor: str = tk.NW, justify: str = tk.LEFT):
+        """
+        Draw stacked text lines on a canvas and size it to fit
         
-        # Creation date
-        if self.property_data.get('created_at'):
-            created_label = ttk.Label(
-                stats_frame,
-                text=f"Created: {self.property_data['created_at'][:10]}",
-                font=('Segoe UI', 8),
-                foreground='#bdc3c7'
+        Args:
+            canvas: Target canvas
+            lines: List of (text, font key, color, top padding, wrap width) tuples
+            anchor: Anchor of each text item
+            justify: Justification of multi-line text items
+        """
+        y = 0
+        for text, font_key, color, pad, wrap in lines:
+            item = canvas.create_text(
+                0, y + pad,
+                text=text,
+                font=_FONTS[font_key],
+                fill=color,
+                anchor=anchor,
+                justify=justify,
+                width=wrap
             )
-            created_label.pack(anchor=tk.E)
+            y = canvas.bbox(item)[3]
+        
+        # Shift everything into the visible area and shrink the canvas to the content
+        x1, y1, x2, y2 = canvas.bbox("all")
+        canvas.move("all", -x1, 0)
+        canvas.configure(width=x2 - x1, height=y2)
     
     def load_thumbnail(self):
         """
         Load property thumbnail image
         """
-        # Get first image from property
-        thumbnail_path = self.property_data.get('thumbnail_path')
-        if not thumbnail_path and self.property_data.get('media_files'):
-            # Use first image as thumbnail
-            media_files = self.property_data['media_files']
-            image_files = [f for f in media_files if f.get('type') == 'image']
-            if image_files:
-                thumbnail_path = image_files[0].get('path')
-        
-        if thumbnail_path and Path(thumbnail_path).exists():
-            # Load thumbnail in background thread
-            threading.Thread(
-                target=self._load_thumbnail_thread,
-                args=(thumbnail_path,),
-                daemon=True
-            ).start()
-    
-    def _load_thumbnail_thread(self, image_path: str):
+        # Use explicit thumbnail, falling back to the first image
+        thumbnail_path = (self.property_data.get('thumbnail_path')
+                          or _index_first_image(self.property_data))
+        
+        if not thumbnail_path:
+            return
+        
+        try:
+            mtime = os.stat(thumbnail_path).st_mtime_ns
+        except OSError:
+            return
+        
+        # Cached thumbnails are only reused while the file is unchanged, and
+        # decode synchronously without reading the image file
+        cache_key = (thumbnail_path, mtime)
+        thumb_data = _THUMB_CACHE.get(cache_key)
+        if thumb_data:
+            _THUMB_CACHE.move_to_end(cache_key)
+            self._set_thumbnail(tk.PhotoImage(master=self.image_label, data=thumb_data))
+            return
+        
+        # Defer decoding until the card is actually shown on screen
+        self._pending_thumb_key = cache_key
+        self.card_frame.bind("<Visibility>", self._on_visible)
+        self.card_frame.bind("<Map>", self._on_visible)
+    
+    def _in_viewport(self) -> bool:
+        """
+        Check whether part of the card is actually on screen
+        
+        Every card packed in a scrolled frame is mapped, so the card is also
+        checked against the viewport of the nearest enclosing canvas.
+        
+        Returns:
+            True if the card is visible
+        """
+        if not self.card_frame.winfo_viewable():
+            return False
+        
+        viewport = self.card_frame.master
+        while viewport is not None and not isinstance(viewport, tk.Canvas):
+            viewport = viewport.master
+        if viewport is None:
+            return True
+        
+        top = self.card_frame.winfo_rooty()
+        view_top = viewport.winfo_rooty()
+        return (top + self.card_frame.winfo_height() > view_top
+                and top < view_top + viewport.winfo_height())
+    
+    def _on_visible(self, event=None):
+        """
+        Start loading the pending thumbnail once the card is on screen
+        
+        Also called by PropertyGrid after scrolling, since cards scrolled
+        into view get no further Map event.
+        
+        Args:
+            event: Visibility or Map event
+        """
+        # Cards scrolled outside the canvas viewport are reported as fully obscured
+        if getattr(event, 'state', None) == 'VisibilityFullyObscured':
+            return
+        
+        cache_key = self._pending_thumb_key
+        if not cache_key or not self._in_viewport():
+            return
+        
+        self._pending_thumb_key = None
+        self.card_frame.unbind("<Visibility>")
+        self.card_frame.unbind("<Map>")
+        
+        # Decode on the shared worker pool
+        _DECODE_EXECUTOR.submit(self._load_thumbnail_thread, cache_key)
+        
+        # Without a grid drain loop, pick the result up from the main thread
+        if self.result_queue is None:
+            self.card_frame.after(50, self._poll_decoded)
+    
+    def _poll_decoded(self):
+        """
+        Apply the decoded thumbnail once the worker has produced it (main thread)
+        """
+        decoded = self._decoded
+        if decoded is None:
+            self.card_frame.after(50, self._poll_decoded)
+            return
+        
+        self._decoded = None
+        if decoded is not False:
+            try:
+                self._apply_decoded(*decoded)
+            except tk.TclError:
+                # Card was destroyed while its thumbnail was loading
+                pass
+    
+    def _apply_decoded(self, cache_key: Tuple[str, int], img, encoded: bytes):
+        """
+        Cache and show a decoded thumbnail (main thread)
+        
+        Args:
+            cache_key: (source path, mtime) of the image
+            img: Decoded PIL thumbnail
+            encoded: Base64-encoded PNG copy of the thumbnail
+        """
+        _cache_thumbnail(cache_key, encoded)
+        # PhotoImages must be created on the Tk thread
+        self._set_thumbnail(ImageTk.PhotoImage(img, master=self.image_label))
+    
+    def _load_thumbnail_thread(self, cache_key: Tuple[str, int]):
         """
         Load thumbnail in background thread
         
         Args:
-            image_path: Path to image file
+            cache_key: (path to image file, mtime) of the image
         """
+        image_path = cache_key[0]
         try:
             # Load and resize image
             with Image.open(image_path) as img:
-                # Convert to RGB if necessary
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
+                # Let the JPEG decoder downscale while decoding
+                img.draft('RGB', (80, 80))
+                
+                # Convert to RGB (always a copy, which outlives the closed file)
+                img = img.convert('RGB')
                 
-                # Create thumbnail
-                img.thumbnail((80, 80), Image.Resampling.LANCZOS)
+                # Create thumbnail (BOX is indistinguishable from LANCZOS at 80x80)
+                img.thumbnail((80, 80), Image.Resampling.BOX)
                 
-                # Convert to PhotoImage
-                photo = ImageTk.PhotoImage(img)
+                # Keep an encoded copy so rebuilt cards skip the decode entirely
+                buffer = io.BytesIO()
+                img.save(buffer, 'PNG')
+                decoded = (cache_key, img, base64.b64encode(buffer.getvalue()))
                 
-                # Update UI in main thread
-                self.parent.after(
-                    0,
-                    lambda: self._set_thumbnail(photo)
-                )
+                # Hand the results to the main thread, which caches them and creates the PhotoImage
+                if self.result_queue is not None:
+                    self.result_queue.put((self, decoded))
+                else:
+                    self._decoded = decoded
                 
         except Exception as e:
             print(f"Error loading thumbnail for {image_path}: {e}")
+            # Stop the main-thread poll
+            self._decoded = False
     
     def _set_thumbnail(self, photo):
         """
@@ -427,6 +581,8 @@ class PropertyGrid:
         """
         self.parent = parent
         self.properties = properties or []
+        for property_data in self.properties:
+            _index_first_image(property_data)
         self.on_property_click = on_property_click
         self.on_property_edit = on_property_edit
         self.on_property_delete = on_property_delete
@@ -434,6 +590,19 @@ class PropertyGrid:
         
         self.property_cards = []
         
+        # Pending scrollregion / mousewheel updates (coalesced per frame)
+        self._sr_dirty = False
+        self._sr_after_id = None
+        self._wheel_delta = 0
+        self._wheel_after_id = None
+        
+        # Finished thumbnails, applied in batches from the main thread
+        self._result_q = queue.Queue()
+        self._drain_after_id = None
+        
+        # Pending check for cards scrolled into view (coalesced per frame)
+        self._visible_after_id = None
+        
         self.create_grid()
     
     def create_grid(self):
@@ -445,13 +614,10 @@ class PropertyGrid:
         self.scrollbar = ttk.Scrollbar(self.parent, orient="vertical", command=self.canvas.yview)
         self.scrollable_frame = ttk.Frame(self.canvas)
         
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+        self.scrollable_frame.bind("<Configure>", self._schedule_scrollregion)
         
         self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.canvas.configure(yscrollcommand=self._on_canvas_yview)
         
         # Pack canvas and scrollbar
         self.canvas.pack(side="left", fill="both", expand=True)
@@ -460,9 +626,86 @@ class PropertyGrid:
         # Bind mousewheel
         self.canvas.bind("<MouseWheel>", self._on_mousewheel)
         
+        # Start the thumbnail drain loop and stop it with the canvas
+        self.canvas.bind("<Destroy>", self._stop_drain)
+        self._drain_after_id = self.canvas.after(16, self._drain_results)
+        
         # Load properties
         self.load_properties()
     
+    def _drain_results(self):
+        """
+        Apply finished thumbnails in a single main-thread pass
+        """
+        for _ in range(_THUMBNAILS_PER_TICK):
+            try:
+                card, decoded = self._result_q.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                card._apply_decoded(*decoded)
+            except tk.TclError:
+                # Card was destroyed while its thumbnail was loading
+                pass
+        
+        self._drain_after_id = self.canvas.after(16, self._drain_results)
+    
+    def _stop_drain(self, event=None):
+        """
+        Cancel the thumbnail drain loop
+        
+        Args:
+            event: Destroy event
+        """
+        if event is not None and event.widget is not self.canvas:
+            return
+        if self._drain_after_id is not None:
+            self.canvas.after_cancel(self._drain_after_id)
+            self._drain_after_id = None
+        if self._visible_after_id is not None:
+            self.canvas.after_cancel(self._visible_after_id)
+            self._visible_after_id = None
+    
+    def _on_canvas_yview(self, first, last):
+        """
+        Update the scrollbar and look for cards scrolled into view
+        
+        Args:
+            first: Top of the visible fraction
+            last: Bottom of the visible fraction
+        """
+        self.scrollbar.set(first, last)
+        if self._visible_after_id is None:
+            self._visible_after_id = self.canvas.after_idle(self._load_visible_thumbnails)
+    
+    def _load_visible_thumbnails(self):
+        """
+        Start thumbnail decoding for cards now inside the viewport
+        """
+        self._visible_after_id = None
+        for card in self.property_cards:
+            card._on_visible()
+    
+    def _schedule_scrollregion(self, event=None):
+        """
+        Schedule a scrollregion update once the geometry has settled
+        
+        Args:
+            event: Configure event
+        """
+        self._sr_dirty = True
+        if self._sr_after_id is None:
+            self._sr_after_id = self.canvas.after_idle(self._update_scrollregion)
+    
+    def _update_scrollregion(self):
+        """
+        Apply the pending scrollregion update in a single pass
+        """
+        self._sr_after_id = None
+        if self._sr_dirty:
+            self._sr_dirty = False
+            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+    
     def _on_mousewheel(self, event):
         """
         Handle mouse wheel scrolling
@@ -470,7 +713,21 @@ class PropertyGrid:
         Args:
             event: Mouse wheel event
         """
-        self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        # Accumulate wheel ticks and scroll at most once per frame (~16 ms)
+        self._wheel_delta += event.delta
+        if self._wheel_after_id is None:
+            self._wheel_after_id = self.canvas.after(16, self._flush_mousewheel)
+    
+    def _flush_mousewheel(self):
+        """
+        Apply the accumulated mouse wheel delta
+        """
+        self._wheel_after_id = None
+        units = int(-1*(self._wheel_delta/120))
+        # Keep the sub-unit remainder for the next frame
+        self._wheel_delta += units * 120
+        if units:
+            self.canvas.yview_scroll(units, "units")
     
     def load_properties(self):
         """
@@ -486,15 +743,27 @@ class PropertyGrid:
         
         # Create property cards
         for property_data in self.properties:
-            card = PropertyCard(
-                self.scrollable_frame,
-                property_data,
-                on_click=self.on_property_click,
-                on_edit=self.on_property_edit,
-                on_delete=self.on_property_delete,
-                on_generate=self.on_property_generate
-            )
-            self.property_cards.append(card)
+            self.property_cards.append(self._create_card(property_data))
+    
+    def _create_card(self, property_data: Dict[str, Any]) -> PropertyCard:
+        """
+        Create a property card wired to the grid callbacks
+        
+        Args:
+            property_data: Property data dictionary
+            
+        Returns:
+            PropertyCard: Created card
+        """
+        return PropertyCard(
+            self.scrollable_frame,
+            property_data,
+            on_click=self.on_property_click,
+            on_edit=self.on_property_edit,
+            on_delete=self.on_property_delete,
+            on_generate=self.on_property_generate,
+            result_queue=self._result_q
+        )
     
     def show_empty_state(self):
         """
@@ -549,8 +818,43 @@ class PropertyGrid:
         Args:
             properties: Updated list of property data
         """
+        for property_data in properties:
+            _index_first_image(property_data)
+        
+        # Full rebuild when switching from/to the empty state
+        if not self.property_cards or not properties:
+            self.properties = properties
+            self.load_properties()
+            return
+        
+        existing = {card.property_data.get('id'): card for card in self.property_cards}
+        new_ids = {p.get('id') for p in properties}
+        
+        # Destroy only the cards of removed properties
+        for property_id, card in existing.items():
+            if property_id not in new_ids:
+                card.destroy()
+        
+        # Reuse unchanged cards, refresh changed ones and create new ones
+        cards = []
+        for property_data in properties:
+            card = existing.get(property_data.get('id'))
+            if card is None:
+                card = self._create_card(property_data)
+            elif card.property_data != property_data:
+                card.update_data(property_data)
+            cards.append(card)
+        
         self.properties = properties
-        self.load_properties()
+        self.property_cards = cards
+        
+        # Restore display order only if it changed
+        frames = [card.get_widget() for card in cards]
+        if self.scrollable_frame.pack_slaves() != frames:
+            for frame in frames:
+                frame.pack_forget()
+            for frame in frames:
+                frame.pack(fill=tk.X, padx=5, pady=5)
     
     def add_property(self, property_data: Dict[str, Any]):
         """
@@ -559,6 +863,7 @@ class PropertyGrid:
         Args:
             property_data: Property data dictionary
         """
+        _index_first_image(property_data)
         self.properties.append(property_data)
         
         # If this is the first property, reload grid
@@ -566,15 +871,7 @@ class PropertyGrid:
             self.load_properties()
         else:
             # Add single card
-            card = PropertyCard(
-                self.scrollable_frame,
-                property_data,
-                on_click=self.on_property_click,
-                on_edit=self.on_property_edit,
-                on_delete=self.on_property_delete,
-                on_generate=self.on_property_generate
-            )
-            self.property_cards.append(card)
+            self.property_cards.append(self._create_card(property_data))
     
     def remove_property(self, property_id: int):
         """
@@ -583,11 +880,8 @@ class PropertyGrid:
         Args:
             property_id: Property ID to remove
         """
-        # Find and remove property
-        self.properties = [p for p in self.properties if p.get('id') != property_id]
-        
-        # Reload grid
-        self.load_properties()
+        # Drop the property; only its card is destroyed
+        self.update_properties([p for p in self.properties if p.get('id') != property_id])
     
     def get_widget(self) -> tk.Canvas:
         """
@@ -12,6 +12,8 @@ from tkinter import ttk, messagebox, filedialog
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Callable
 import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Add the project root to the path
@@ -19,14 +21,45 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from core.localization import translate
+from core.database import casefold
 from gui.components.media_gallery import MediaGallery
 from gui.property_wizard import PropertyWizard
 
+# Row formatting helpers, bound once instead of per row
+_PRICE_FMT = "€{:,.0f}".format
+_TITLE_MAX = 40
+
 class PropertyManagerInterface:
     """
     Advanced property management interface with search, filter, and detailed view
     """
     
+    # List columns and their widths
+    COLUMNS = ('ID', 'Title', 'Type', 'Transaction', 'Price', 'City', 'Bedrooms', 'Status', 'Updated')
+    COLUMN_WIDTHS = {'ID': 50, 'Title': 200, 'Type': 80, 'Transaction': 80, 
+                     'Price': 100, 'City': 100, 'Bedrooms': 70, 'Status': 80, 'Updated': 100}
+    
+    # Database column sorted by each sortable list column
+    SORT_COLUMNS = {
+        'ID': 'id',
+        'Title': 'title',
+        'Type': 'property_type',
+        'Price': 'price',
+        'City': 'city',
+        'Bedrooms': 'bedrooms',
+        'Status': 'status',
+        'Updated': 'updated_at'
+    }
+    
+    # Number of properties fetched per query
+    PAGE_SIZE = 500
+    
+    # Number of tree rows materialized at a time
+    RENDER_CHUNK = 50
+    
+    # Number of property detail views kept alive
+    DETAIL_CACHE_SIZE = 16
+    
     def __init__(self, parent_frame, property_manager, main_window):
         """
         Initialize property manager interface
@@ -46,16 +79,68 @@ class PropertyManagerInterface:
         self.sort_column = "updated_at"
         self.sort_direction = "desc"
         
+        # Paging and cached total of the current filters
+        self._page = 0
+        self._total_count = 0
+        self._counted_filters = None
+        
         # Selected property
         self.selected_property_id = None
         self.selected_property_data = None
         
+        # Number of exports running in the background
+        self._exports_running = 0
+        
+        # Row targeted by the context menu
+        self._context_item = None
+        self._context_property_id = None
+        
+        # Media handler shared with the main window, created on first edit
+        self._media_handler = None
+        
         # UI components
         self.properties_tree = None
+        
+        # Tree items are keyed by property ID: displayed order and row values
+        self._tree_item_ids = []
+        self._tree_values = {}
+        
+        # Fetched rows; only a prefix of them is materialized in the tree
+        self._last_results = []
+        self._results_filters = None
+        self._rows = []
+        self._render_pending = False
         self.detail_frame = None
         self.search_var = None
         self.filter_vars = {}
         
+        # Pending detail panel scrollregion update
+        self._detail_sr_after_id = None
+        
+        # Accumulated detail panel wheel delta, flushed when idle
+        self._detail_wheel_delta = 0
+        self._detail_wheel_after_id = None
+        
+        # Built detail views by property ID: (frame, property data), least recent first
+        self._detail_cache = OrderedDict()
+        self._current_detail = None
+        self._no_selection_frame = None
+        
+        # Pending debounced search/filter callbacks
+        self._search_after_id = None
+        self._filter_after_id = None
+        self._filters_suspended = False
+        
+        # Background worker for database calls, and the latest request of each kind
+        self._io_executor = ThreadPoolExecutor(max_workers=1)
+        
+        # Exports copy media files and can take a while, so they get their own
+        # worker instead of holding up list and detail queries
+        self._export_executor = ThreadPoolExecutor(max_workers=1)
+        self._req_seq = 0
+        self._detail_seq = 0
+        self._closed = False
+        
         self.setup_interface()
     
     def setup_interface(self):
@@ -65,6 +150,7 @@ class PropertyManagerInterface:
         # Main container with paned window for resizable layout
         self.paned_window = ttk.PanedWindow(self.parent_frame, orient=tk.HORIZONTAL)
         self.paned_window.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.paned_window.bind('<Destroy>', self._on_destroy)
         
         # Left panel - Property list with search and filters
         self.create_list_panel()
@@ -75,6 +161,55 @@ class PropertyManagerInterface:
         # Load initial data
         self.refresh_properties_list()
     
+    def _on_destroy(self, event):
+        """
+        Stop the background worker when the interface is destroyed
+        
+        Args:
+            event: Destroy event
+        """
+        if event.widget is self.paned_window:
+            self._closed = True
+            self._io_executor.shutdown(wait=False)
+            self._export_executor.shutdown(wait=False)
+    
+    def _run_in_background(self, func: Callable, on_done: Callable, *args,
+                           on_error: Optional[Callable] = None,
+                           executor: Optional[ThreadPoolExecutor] = None):
+        """
+        Run a blocking call on the worker thread and handle its outcome on the Tk thread
+        
+        Args:
+            func: Blocking function to run
+            on_done: Callback receiving the result
+            *args: Arguments for func
+            on_error: Callback receiving the exception (defaults to an error dialog)
+            executor: Executor to run func on (defaults to the database worker)
+        """
+        future = (executor or self._io_executor).submit(func, *args)
+        
+        def deliver():
+            if self._closed:
+                return
+            try:
+                result = future.result()
+            except Exception as e:
+                if on_error:
+                    on_error(e)
+                else:
+                    messagebox.showerror("Error", str(e))
+                return
+            on_done(result)
+        
+        def schedule(_future):
+            try:
+                self.parent_frame.after(0, deliver)
+            except (RuntimeError, tk.TclError):
+                # Tk is already gone
+                pass
+        
+        future.add_done_callback(schedule)
+    
     def create_list_panel(self):
         """
         Create the left panel with property list, search, and filters
@@ -172,16 +307,16 @@ class PropertyManagerInterface:
         city_entry = ttk.Entry(filter_row2, textvariable=self.filter_vars['city'], width=15)
         city_entry.pack(side=tk.LEFT, padx=(5, 0))
         
-        # Bind filter changes
+        # Bind filter changes (debounced while typing)
         for var in [self.filter_vars['min_price'], self.filter_vars['max_price'], self.filter_vars['city']]:
-            var.trace('w', self.on_filter_changed)
+            var.trace('w', self.on_filter_entry_changed)
         
         # Filter buttons
         filter_buttons = ttk.Frame(search_frame)
         filter_buttons.pack(fill=tk.X, pady=(10, 0))
         
         ttk.Button(filter_buttons, text="Apply Filters", 
-                  command=self.apply_filters).pack(side=tk.LEFT)
+                  command=self._apply_filters_now).pack(side=tk.LEFT)
         ttk.Button(filter_buttons, text="Clear Filters", 
                   command=self.clear_filters).pack(side=tk.LEFT, padx=(10, 0))
     
@@ -197,21 +332,21 @@ class PropertyManagerInterface:
         list_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Treeview for properties
-        columns = ('ID', 'Title', 'Type', 'Transaction', 'Price', 'City', 'Bedrooms', 'Status', 'Updated')
-        self.properties_tree = ttk.Treeview(list_frame, columns=columns, show='headings', height=15)
+        self.properties_tree = ttk.Treeview(list_frame, columns=self.COLUMNS, show='headings', height=15)
         
         # Configure columns
-        column_widths = {'ID': 50, 'Title': 200, 'Type': 80, 'Transaction': 80, 
-                        'Price': 100, 'City': 100, 'Bedrooms': 70, 'Status': 80, 'Updated': 100}
+        for col in self.COLUMNS:
+            self.properties_tree.heading(col, text=col)
+            self.properties_tree.column(col, width=self.COLUMN_WIDTHS.get(col, 100), minwidth=50)
         
-        for col in columns:
-            self.properties_tree.heading(col, text=col, command=lambda c=col: self.sort_by_column(c))
-            self.properties_tree.column(col, width=column_widths.get(col, 100), minwidth=50)
+        # One click handler sorts by any heading
+        self.properties_tree.bind('<Button-1>', self._on_tree_click)
         
         # Scrollbars
         v_scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.properties_tree.yview)
         h_scrollbar = ttk.Scrollbar(list_frame, orient=tk.HORIZONTAL, command=self.properties_tree.xview)
-        self.properties_tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.properties_tree.configure(yscrollcommand=self._on_tree_yscroll, xscrollcommand=h_scrollbar.set)
+        self._v_scrollbar = v_scrollbar
         
         # Pack treeview and scrollbars
         self.properties_tree.grid(row=0, column=0, sticky='nsew')
@@ -228,6 +363,20 @@ class PropertyManagerInterface:
         # Context menu
         self.create_context_menu()
     
+    def _on_tree_click(self, event):
+        """
+        Sort by the clicked column heading
+        
+        Args:
+            event: Click event
+        """
+        if self.properties_tree.identify_region(event.x, event.y) != 'heading':
+            return
+        column = self.properties_tree.identify_column(event.x)
+        index = int(column.lstrip('#')) - 1 if column else -1
+        if 0 <= index < len(self.COLUMNS):
+            self.sort_by_column(self.COLUMNS[index])
+    
     def create_action_buttons(self, parent):
         """
         Create action buttons below the list
@@ -255,6 +404,9 @@ class PropertyManagerInterface:
         # Refresh button
         ttk.Button(buttons_frame, text="Refresh", 
                   command=self.refresh_properties_list).pack(side=tk.RIGHT)
+        
+        # Shown while exports run in the background
+        self._export_progress = ttk.Progressbar(buttons_frame, mode='indeterminate', length=80)
     
     def create_detail_panel(self):
         """
@@ -269,10 +421,7 @@ class PropertyManagerInterface:
         detail_scrollbar = ttk.Scrollbar(right_panel, orient="vertical", command=self.detail_canvas.yview)
         self.detail_frame = ttk.Frame(self.detail_canvas)
         
-        self.detail_frame.bind(
-            "<Configure>",
-            lambda e: self.detail_canvas.configure(scrollregion=self.detail_canvas.bbox("all"))
-        )
+        self.detail_frame.bind("<Configure>", self._schedule_detail_scrollregion)
         
         self.detail_canvas.create_window((0, 0), window=self.detail_frame, anchor="nw")
         self.detail_canvas.configure(yscrollcommand=detail_scrollbar.set)
@@ -287,6 +436,23 @@ class PropertyManagerInterface:
         # Show initial message
         self.show_no_selection_message()
     
+    def _schedule_detail_scrollregion(self, event=None):
+        """
+        Schedule a detail panel scrollregion update once the layout has settled
+        
+        Args:
+            event: Configure event
+        """
+        if self._detail_sr_after_id is None:
+            self._detail_sr_after_id = self.detail_canvas.after_idle(self._update_detail_scrollregion)
+    
+    def _update_detail_scrollregion(self):
+        """
+        Apply the pending detail panel scrollregion update
+        """
+        self._detail_sr_after_id = None
+        self.detail_canvas.configure(scrollregion=self.detail_canvas.bbox("all"))
+    
     def _on_detail_mousewheel(self, event):
         """
         Handle mouse wheel scrolling in detail panel
@@ -294,36 +460,95 @@ class PropertyManagerInterface:
         Args:
             event: Mouse wheel event
         """
-        self.detail_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        # Coalesce bursts of wheel events into one scroll per idle pass
+        self._detail_wheel_delta += event.delta
+        if self._detail_wheel_after_id is None:
+            self._detail_wheel_after_id = self.detail_canvas.after_idle(self._flush_detail_mousewheel)
+    
+    def _flush_detail_mousewheel(self):
+        """
+        Apply the accumulated mouse wheel delta to the detail panel
+        """
+        self._detail_wheel_after_id = None
+        units = int(-1*(self._detail_wheel_delta/120))
+        # Keep the sub-unit remainder for the next flush
+        self._detail_wheel_delta += units * 120
+        if units:
+            self.detail_canvas.yview_scroll(units, "units")
     
     def show_no_selection_message(self):
         """
         Show message when no property is selected
         """
-        # Clear detail frame
-        for widget in self.detail_frame.winfo_children():
-            widget.destroy()
+        # Any detail load still in flight is now stale
+        self._detail_seq += 1
+        
+        # Build the message once and reuse it
+        if self._no_selection_frame is None:
+            self._no_selection_frame = ttk.Frame(self.detail_frame)
+            
+            ttk.Label(self._no_selection_frame, text="Select a property to view details", 
+                     font=('Segoe UI', 14), 
+                     foreground='gray').pack(expand=True)
+        
+        self._show_detail_frame(self._no_selection_frame, padx=20, pady=50)
+    
+    def _show_detail_frame(self, frame, **pack_options):
+        """
+        Swap the frame displayed in the detail panel
+        
+        Args:
+            frame: Frame to display
+            **pack_options: Extra pack options for the frame
+        """
+        if self._current_detail is frame:
+            return
+        if self._current_detail is not None and self._current_detail.winfo_exists():
+            self._current_detail.pack_forget()
         
-        # Show message
-        message_frame = ttk.Frame(self.detail_frame)
-        message_frame.pack(expand=True, fill=tk.BOTH, padx=20, pady=50)
+        frame.pack(expand=True, fill=tk.BOTH, **pack_options)
+        self._current_detail = frame
+        self.detail_canvas.yview_moveto(0)
+    
+    def invalidate_property_details(self, property_id: Optional[int] = None):
+        """
+        Drop cached detail views so they are rebuilt on next display
         
-        ttk.Label(message_frame, text="Select a property to view details", 
-                 font=('Segoe UI', 14), 
-                 foreground='gray').pack(expand=True)
+        Args:
+            property_id: Property whose view to drop (None for all)
+        """
+        property_ids = list(self._detail_cache) if property_id is None else [property_id]
+        for pid in property_ids:
+            cached = self._detail_cache.pop(pid, None)
+            if cached is None:
+                continue
+            frame = cached[0]
+            if frame is self._current_detail:
+                self._current_detail = None
+            frame.destroy()
     
     def create_context_menu(self):
         """
         Create context menu for properties list
         """
+        # Menu actions apply to the right-clicked row, which is not selected
         self.context_menu = tk.Menu(self.parent_frame, tearoff=0)
-        self.context_menu.add_command(label="Edit", command=self.edit_selected_property)
-        self.context_menu.add_command(label="Duplicate", command=self.duplicate_selected_property)
+        self.context_menu.add_command(label="Edit", 
+                                      command=lambda: self.edit_selected_property(self._context_property_id))
+        self.context_menu.add_command(label="Duplicate", 
+                                      command=lambda: self.duplicate_selected_property(self._context_property_id))
         self.context_menu.add_separator()
-        self.context_menu.add_command(label="Generate Website", command=self.generate_website)
+        self.context_menu.add_command(label="Generate Website", 
+                                      command=lambda: self.generate_website(self._context_property_id))
         self.context_menu.add_separator()
-        self.context_menu.add_command(label="Export", command=self.export_selected_property)
-        self.context_menu.add_command(label="Delete", command=self.delete_selected_property)
+        self.context_menu.add_command(label="Export", 
+                                      command=lambda: self.export_selected_property(self._context_property_id))
+        self.context_menu.add_command(label="Delete", 
+                                      command=lambda: self.delete_selected_property(self._context_property_id))
+        self.context_menu.bind('<Unmap>', lambda e: self._clear_context_highlight())
+        
+        # Highlight of the right-clicked row
+        self.properties_tree.tag_configure('context', background='#e8f0fe')
         
         # Bind right-click
         self.properties_tree.bind('<Button-3>', self.show_context_menu)
@@ -335,18 +560,42 @@ class PropertyManagerInterface:
         Args:
             event: Right-click event
         """
-        # Select item under cursor
+        # Target the item under cursor without selecting it, which would
+        # load its details before the menu shows up
         item = self.properties_tree.identify_row(event.y)
         if item:
-            self.properties_tree.selection_set(item)
+            self._clear_context_highlight()
+            self._context_item = item
+            self._context_property_id = int(item)
+            tags = self.properties_tree.item(item, 'tags')
+            self.properties_tree.item(item, tags=tuple(tags) + ('context',))
             self.context_menu.post(event.x_root, event.y_root)
     
+    def _clear_context_highlight(self):
+        """
+        Remove the highlight of the right-clicked row
+        """
+        item = self._context_item
+        self._context_item = None
+        if item and self.properties_tree.exists(item):
+            tags = self.properties_tree.item(item, 'tags')
+            self.properties_tree.item(item, tags=tuple(t for t in tags if t != 'context'))
+    
     # Event handlers
     def on_search_changed(self, *args):
         """
         Handle search text changes
         """
-        # Debounce search - could be improved with actual debouncing
+        # Debounce search: only query once typing pauses
+        if self._search_after_id:
+            self.parent_frame.after_cancel(self._search_after_id)
+        self._search_after_id = self.parent_frame.after(300, self._run_search)
+    
+    def _run_search(self):
+        """
+        Apply the search query after the debounce delay
+        """
+        self._search_after_id = None
         self.search_query = self.search_var.get().strip()
         if len(self.search_query) >= 2 or self.search_query == "":
             self.apply_filters()
@@ -356,9 +605,25 @@ class PropertyManagerInterface:
         Handle filter changes
         """
         # Auto-apply filters when dropdown changes
-        if hasattr(self, 'properties_tree'):
+        if hasattr(self, 'properties_tree') and not self._filters_suspended:
             self.apply_filters()
     
+    def on_filter_entry_changed(self, *args):
+        """
+        Handle typing in the price and city filter entries
+        """
+        # Debounce filter entries: only query once typing pauses
+        if self._filter_after_id:
+            self.parent_frame.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.parent_frame.after(150, self._run_filter_entries)
+    
+    def _run_filter_entries(self):
+        """
+        Apply the filter entries after the debounce delay
+        """
+        self._filter_after_id = None
+        self.on_filter_changed()
+    
     def clear_search(self):
         """
         Clear search field
@@ -369,12 +634,31 @@ class PropertyManagerInterface:
         """
         Clear all filters
         """
-        self.search_var.set("")
-        self.filter_vars['property_type'].set("All")
-        self.filter_vars['transaction_type'].set("All")
-        self.filter_vars['min_price'].set("")
-        self.filter_vars['max_price'].set("")
-        self.filter_vars['city'].set("")
+        # Reset every field first, then reload the list once
+        self._filters_suspended = True
+        try:
+            self.search_var.set("")
+            self.filter_vars['property_type'].set("All")
+            self.filter_vars['transaction_type'].set("All")
+            self.filter_vars['min_price'].set("")
+            self.filter_vars['max_price'].set("")
+            self.filter_vars['city'].set("")
+        finally:
+            self._filters_suspended = False
+        self._apply_filters_now()
+    
+    def _apply_filters_now(self):
+        """
+        Apply the current search and filters without waiting for the debounce delays
+        """
+        if self._search_after_id:
+            self.parent_frame.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        if self._filter_after_id:
+            self.parent_frame.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
+        
+        self.search_query = self.search_var.get().strip()
         self.apply_filters()
     
     def apply_filters(self):
@@ -408,6 +692,10 @@ class PropertyManagerInterface:
         if self.filter_vars['city'].get():
             filters['city'] = self.filter_vars['city'].get()
         
+        # Nothing to do when the filters did not actually change
+        if filters == self.current_filters:
+            return
+        
         self.current_filters = filters
         self.refresh_properties_list()
     
@@ -418,13 +706,46 @@ class PropertyManagerInterface:
         Args:
             column: Column name to sort by
         """
+        column = self.SORT_COLUMNS.get(column)
+        if column is None:
+            # No database column backs this heading
+            return
+        
         if self.sort_column == column:
             self.sort_direction = "asc" if self.sort_direction == "desc" else "desc"
         else:
             self.sort_column = column
             self.sort_direction = "asc"
         
-        self.refresh_properties_list()
+        # Re-sort in memory when the whole filtered result set is already loaded
+        results_complete = (self._last_results
+                            and len(self._last_results) >= self._total_count
+                            and self._results_filters == self.current_filters
+                            and column in self._last_results[0])
+        if results_complete:
+            self._repopulate_tree_from_cache()
+        else:
+            self.refresh_properties_list(recount=False)
+    
+    def _repopulate_tree_from_cache(self):
+        """
+        Sort the cached results with the current sort settings and redisplay them
+        """
+        column = self.sort_column
+        
+        def sort_key(pair):
+            value = pair[0].get(column)
+            # Same order as SQLite: text compared with the CASEFOLD collation,
+            # NULLs first when ascending, ties broken by ID
+            return (value is not None, casefold(value), pair[0]['id'])
+        
+        pairs = sorted(zip(self._last_results, self._rows), key=sort_key,
+                       reverse=self.sort_direction == "desc")
+        self._last_results = [result for result, _ in pairs]
+        self._rows = [row for _, row in pairs]
+        
+        window = max(self.RENDER_CHUNK, len(self._tree_item_ids))
+        self._populate_tree(self._rows[:window])
     
     def on_property_selected(self, event):
         """
@@ -436,55 +757,228 @@ class PropertyManagerInterface:
         selection = self.properties_tree.selection()
         if selection:
             item = selection[0]
-            property_id = self.properties_tree.item(item)['values'][0]
+            property_id = int(item)
             self.selected_property_id = property_id
             self.load_property_details(property_id)
         else:
             self.selected_property_id = None
             self.show_no_selection_message()
     
-    def refresh_properties_list(self):
+    def refresh_properties_list(self, recount: bool = True, on_loaded: Optional[Callable] = None):
         """
         Refresh the properties list with current filters and sorting
+        
+        The queries run on the background worker; results of a refresh
+        superseded by a newer one are dropped.
+        
+        Args:
+            recount: Whether to recount matching properties (not needed when only sorting)
+            on_loaded: Callback run once the list has been repopulated
         """
-        # Clear existing items
-        for item in self.properties_tree.get_children():
-            self.properties_tree.delete(item)
+        self._req_seq += 1
+        seq = self._req_seq
+        filters = dict(self.current_filters)
+        sort_column = self.sort_column
+        sort_direction = self.sort_direction
         
-        try:
-            # Get filtered and sorted properties
+        # Sorting keeps the total, so only recount when asked or filters changed
+        count_needed = recount or filters != self._counted_filters
+        
+        def query():
+            # Get the first page of filtered and sorted properties
             properties = self.property_manager.get_filtered_properties(
-                filters=self.current_filters,
-                sort_column=self.sort_column,
-                sort_direction=self.sort_direction
+                filters=filters,
+                sort_column=sort_column,
+                sort_direction=sort_direction,
+                limit=self.PAGE_SIZE,
+                offset=0
             )
+            total = self.property_manager.count_filtered_properties(filters) if count_needed else None
+            return properties, total
+        
+        def loaded(result):
+            if seq != self._req_seq:
+                return
+            properties, total = result
             
-            # Populate tree
-            for prop in properties:
-                values = (
-                    prop['id'],
-                    prop['title'][:40] + '...' if len(prop['title']) > 40 else prop['title'],
-                    prop['property_type'],
-                    prop['transaction_type'],
-                    f"€{prop['price']:,.0f}" if prop['price'] else 'N/A',
-                    prop['city'] or 'N/A',
-                    prop['bedrooms'] or 'N/A',
-                    prop['status'],
-                    prop['updated_at'][:10] if prop['updated_at'] else 'N/A'
-                )
-                self.properties_tree.insert('', tk.END, values=values)
+            self._page = 0
+            if total is not None:
+                self._total_count = total
+                self._counted_filters = filters
             
-            # Update status
-            count = len(properties)
-            status_text = f"Showing {count} properties"
-            if self.current_filters:
-                status_text += " (filtered)"
+            # Nothing to redisplay when the listed rows are unchanged (e.g. after
+            # saving a property whose listed fields did not change)
+            if properties != self._last_results:
+                # Populate tree with the visible window only (at least what was shown before)
+                self._last_results = properties
+                self._rows = [self._format_row(prop) for prop in properties]
+                window = max(self.RENDER_CHUNK, len(self._tree_item_ids))
+                self._populate_tree(self._rows[:window])
+            self._results_filters = filters
             
-            if hasattr(self.main_window, 'set_status'):
-                self.main_window.set_status(status_text)
-                
-        except Exception as e:
+            self._update_list_status()
+            
+            if on_loaded:
+                on_loaded()
+        
+        self._run_in_background(
+            query, loaded,
+            on_error=lambda e: messagebox.showerror("Error", f"Failed to load properties: {e}")
+        )
+    
+    def _format_row(self, prop: Dict[str, Any]) -> tuple:
+        """
+        Format a property row for the properties tree
+        
+        Args:
+            prop: Property row dictionary
+            
+        Returns:
+            Tuple of column values
+        """
+        title = prop['title']
+        price = prop['price']
+        updated = prop['updated_at']
+        return (
+            prop['id'],
+            title[:_TITLE_MAX] + '...' if len(title) > _TITLE_MAX else title,
+            prop['property_type'],
+            prop.get('transaction_type') or 'N/A',
+            _PRICE_FMT(price) if price else 'N/A',
+            prop['city'] or 'N/A',
+            prop['bedrooms'] or 'N/A',
+            prop['status'],
+            updated[:10] if updated else 'N/A'
+        )
+    
+    def _update_list_status(self):
+        """
+        Show the number of listed properties in the status bar
+        """
+        count = len(self._rows)
+        status_text = f"Showing {count} properties"
+        if self._total_count > count:
+            status_text = f"Showing {count} of {self._total_count} properties"
+        if self.current_filters:
+            status_text += " (filtered)"
+        
+        if hasattr(self.main_window, 'set_status'):
+            self.main_window.set_status(status_text)
+    
+    def _on_tree_yscroll(self, first, last):
+        """
+        Update the scrollbar and render more rows when nearing the end
+        
+        Args:
+            first: Top of the visible fraction
+            last: Bottom of the visible fraction
+        """
+        self._v_scrollbar.set(first, last)
+        
+        has_more = (len(self._tree_item_ids) < len(self._rows)
+                    or len(self._rows) < self._total_count)
+        if float(last) >= 0.9 and has_more and not self._render_pending:
+            self._render_pending = True
+            self.properties_tree.after_idle(self._render_more_rows)
+    
+    def _render_more_rows(self):
+        """
+        Materialize the next chunk of rows, fetching the next page if needed
+        """
+        self._render_pending = False
+        
+        if len(self._tree_item_ids) >= len(self._rows):
+            if len(self._rows) < self._total_count:
+                self._load_next_page()
+            return
+        
+        start = len(self._tree_item_ids)
+        for values in self._rows[start:start + self.RENDER_CHUNK]:
+            iid = self.properties_tree.insert('', tk.END, iid=str(values[0]), values=values)
+            self._tree_item_ids.append(iid)
+            self._tree_values[iid] = values
+    
+    def _load_next_page(self):
+        """
+        Fetch the next page of properties into the row cache, then render it
+        """
+        # Hold off further render requests until the page arrives
+        self._render_pending = True
+        seq = self._req_seq
+        page = self._page + 1
+        
+        def loaded(properties):
+            self._render_pending = False
+            if seq != self._req_seq:
+                return
+            self._page = page
+            
+            # Rows inserted meanwhile shift pages; skip properties already listed
+            listed = {row[0] for row in self._rows}
+            new_properties = [prop for prop in properties if prop['id'] not in listed]
+            
+            self._last_results.extend(new_properties)
+            self._rows.extend(self._format_row(prop) for prop in new_properties)
+            if not properties:
+                # Rows were deleted meanwhile; stop asking for more
+                self._total_count = len(self._rows)
+            
+            self._update_list_status()
+            self._render_more_rows()
+        
+        def failed(e):
+            self._render_pending = False
             messagebox.showerror("Error", f"Failed to load properties: {e}")
+        
+        self._run_in_background(
+            self.property_manager.get_filtered_properties, loaded,
+            self._results_filters, self.sort_column, self.sort_direction,
+            self.PAGE_SIZE, page * self.PAGE_SIZE,
+            on_error=failed
+        )
+    
+    def _populate_tree(self, rows: List[tuple]):
+        """
+        Write rows into the properties tree, reusing existing items
+        
+        Items are keyed by property ID, so properties that stay listed keep
+        their item and only have changed values written.
+        
+        Args:
+            rows: Ordered row values to display
+        """
+        tree = self.properties_tree
+        wanted = [str(values[0]) for values in rows]
+        wanted_set = set(wanted)
+        
+        # Delete items of properties no longer shown
+        stale = [iid for iid in self._tree_item_ids if iid not in wanted_set]
+        if stale:
+            tree.delete(*stale)
+            for iid in stale:
+                del self._tree_values[iid]
+        
+        # Update changed items, append new ones
+        order = [iid for iid in self._tree_item_ids if iid in wanted_set]
+        for iid, values in zip(wanted, rows):
+            current = self._tree_values.get(iid)
+            if current is None:
+                tree.insert('', tk.END, iid=iid, values=values)
+                order.append(iid)
+            elif current != values:
+                tree.item(iid, values=values)
+            self._tree_values[iid] = values
+        
+        # Reorder in a single call when the order changed
+        if order != wanted:
+            tree.set_children('', *wanted)
+        self._tree_item_ids = wanted
+        
+        # Keep the selection on the same property
+        selected_iid = str(self.selected_property_id)
+        selected_item = (selected_iid,) if selected_iid in wanted_set else ()
+        if tree.selection() != selected_item:
+            tree.selection_set(selected_item)
     
     def load_property_details(self, property_id: int):
         """
@@ -493,62 +987,112 @@ class PropertyManagerInterface:
         Args:
             property_id: Property ID to load
         """
-        try:
-            # Get property data
+        # Any detail load still in flight is now stale
+        self._detail_seq += 1
+        seq = self._detail_seq
+        
+        # Reuse the already built view of this property
+        cached = self._detail_cache.get(property_id)
+        if cached is not None:
+            self._detail_cache.move_to_end(property_id)
+            frame, self.selected_property_data = cached
+            self._show_detail_frame(frame)
+            return
+        
+        def fetch():
             property_data = self.property_manager.get_property_by_id(property_id)
-            if not property_data:
-                self.show_no_selection_message()
-                return
-            
+            media_count = self.property_manager.get_property_media_count(property_id) if property_data else 0
+            return property_data, media_count
+        
+        self._run_in_background(
+            fetch,
+            lambda result: self._show_property_details(seq, property_id, *result),
+            on_error=lambda e: messagebox.showerror("Error", f"Failed to load property details: {e}")
+        )
+    
+    def _show_property_details(self, seq: int, property_id: int,
+                               property_data: Optional[Dict[str, Any]], media_count: int):
+        """
+        Build and display the detail view of fetched property data
+        
+        Args:
+            seq: Detail request sequence number
+            property_id: Property ID
+            property_data: Property data dictionary (None if not found)
+            media_count: Number of media files of the property
+        """
+        # Another property was selected meanwhile
+        if seq != self._detail_seq:
+            return
+        
+        if not property_data:
+            self.show_no_selection_message()
+            return
+        
+        view = None
+        try:
             self.selected_property_data = property_data
             
-            # Clear detail frame
-            for widget in self.detail_frame.winfo_children():
-                widget.destroy()
-            
             # Create detail view
-            self.create_property_detail_view(property_data)
+            view = ttk.Frame(self.detail_frame)
+            self.create_property_detail_view(view, property_data, media_count)
+            self._show_detail_frame(view)
+            
+            # Cache it, evicting the least recently shown view
+            self._detail_cache[property_id] = (view, property_data)
+            if len(self._detail_cache) > self.DETAIL_CACHE_SIZE:
+                oldest_id = next(iter(self._detail_cache))
+                self.invalidate_property_details(oldest_id)
             
         except Exception as e:
+            # Don't keep a half-built view around
+            if view is not None and property_id not in self._detail_cache:
+                if view is self._current_detail:
+                    self._current_detail = None
+                view.destroy()
             messagebox.showerror("Error", f"Failed to load property details: {e}")
     
-    def create_property_detail_view(self, property_data: Dict[str, Any]):
+    def create_property_detail_view(self, parent, property_data: Dict[str, Any],
+                                    media_count: Optional[int] = None):
         """
         Create detailed view of selected property
         
         Args:
+            parent: Parent widget
             property_data: Property data dictionary
+            media_count: Number of media files (queried when not given)
         """
         # Header
-        header_frame = ttk.Frame(self.detail_frame)
+        header_frame = ttk.Frame(parent)
         header_frame.pack(fill=tk.X, padx=10, pady=10)
         
         ttk.Label(header_frame, text="Property Details", 
                  font=('Segoe UI', 14, 'bold')).pack(anchor=tk.W)
         
         # Basic information
-        self.create_basic_info_section(property_data)
+        self.create_basic_info_section(parent, property_data)
         
         # Location information
-        self.create_location_info_section(property_data)
+        self.create_location_info_section(parent, property_data)
         
         # Features
-        self.create_features_section(property_data)
+        self.create_features_section(parent, property_data)
         
         # Media gallery
-        self.create_media_section(property_data)
+        self.create_media_section(parent, property_data, media_count)
         
         # Action buttons
-        self.create_detail_action_buttons(property_data)
+        self.create_detail_action_buttons(parent, property_data)
     
-    def create_basic_info_section(self, property_data: Dict[str, Any]):
+    def create_basic_info_section(self, parent, property_data: Dict[str, Any]):
         """
         Create basic information section
         
         Args:
+            parent: Parent widget
             property_data: Property data dictionary
         """
-        info_frame = ttk.LabelFrame(self.detail_frame, text="Basic Information", padding=10)
+        info_frame = ttk.LabelFrame(parent, text="Basic Information", padding=10)
         info_frame.pack(fill=tk.X, padx=10, pady=5)
         
         # Create info rows
@@ -587,14 +1131,15 @@ class PropertyManagerInterface:
             desc_text.insert(tk.END, property_data['description'])
             desc_text.config(state=tk.DISABLED)
     
-    def create_location_info_section(self, property_data: Dict[str, Any]):
+    def create_location_info_section(self, parent, property_data: Dict[str, Any]):
         """
         Create location information section
         
         Args:
+            parent: Parent widget
             property_data: Property data dictionary
         """
-        location_frame = ttk.LabelFrame(self.detail_frame, text="Location", padding=10)
+        location_frame = ttk.LabelFrame(parent, text="Location", padding=10)
         location_frame.pack(fill=tk.X, padx=10, pady=5)
         
         location_items = [
@@ -612,11 +1157,12 @@ class PropertyManagerInterface:
                      font=('Segoe UI', 9, 'bold'), width=12).pack(side=tk.LEFT)
             ttk.Label(row_frame, text=str(value)).pack(side=tk.LEFT, padx=(10, 0))
     
-    def create_features_section(self, property_data: Dict[str, Any]):
+    def create_features_section(self, parent, property_data: Dict[str, Any]):
         """
         Create features section
         
         Args:
+            parent: Parent widget
             property_data: Property data dictionary
         """
         features = property_data.get('features', [])
@@ -624,65 +1170,115 @@ class PropertyManagerInterface:
         all_features = features + additional_features
         
         if all_features:
-            features_frame = ttk.LabelFrame(self.detail_frame, text="Features", padding=10)
+            features_frame = ttk.LabelFrame(parent, text="Features", padding=10)
             features_frame.pack(fill=tk.X, padx=10, pady=5)
             
-            # Create features grid
+            # Create features grid: one multi-line label per column
             features_container = ttk.Frame(features_frame)
             features_container.pack(fill=tk.X)
             
-            for i, feature in enumerate(all_features):
-                row = i // 2
-                col = i % 2
-                
-                feature_label = ttk.Label(features_container, text=f"• {feature}")
-                feature_label.grid(row=row, column=col, sticky=tk.W, padx=(0, 20), pady=2)
+            for col in range(2):
+                column_text = "\n".join(f"• {feature}" for feature in all_features[col::2])
+                if column_text:
+                    feature_label = ttk.Label(features_container, text=column_text, justify=tk.LEFT)
+                    feature_label.grid(row=0, column=col, sticky=tk.NW, padx=(0, 20), pady=2)
     
-    def create_media_section(self, property_data: Dict[str, Any]):
+    def create_media_section(self, parent, property_data: Dict[str, Any],
+                             media_count: Optional[int] = None):
         """
         Create media section
         
+        The gallery itself is only built on demand since it reads and
+        decodes the media files.
+        
         Args:
+            parent: Parent widget
             property_data: Property data dictionary
+            media_count: Number of media files (queried when not given)
         """
-        media_files = self.property_manager.get_property_media(property_data['id'])
+        if media_count is None:
+            media_count = self.property_manager.get_property_media_count(property_data['id'])
         
-        if media_files:
-            media_frame = ttk.LabelFrame(self.detail_frame, text="Media", padding=10)
+        if media_count:
+            media_frame = ttk.LabelFrame(parent, text="Media", padding=10)
             media_frame.pack(fill=tk.X, padx=10, pady=5)
             
-            # Create media gallery
-            try:
-                self.media_gallery = MediaGallery(
-                    media_frame, 
-                    media_files=media_files,
-                    readonly=True,
-                    max_height=200
-                )
-            except Exception as e:
+            load_button = ttk.Button(media_frame, text=f"Load media ({media_count} files)")
+            load_button.configure(
+                command=lambda: self.load_media_gallery(media_frame, load_button, property_data['id'])
+            )
+            load_button.pack(anchor=tk.W)
+    
+    def load_media_gallery(self, media_frame, load_button, property_id: int):
+        """
+        Replace the load button with the property media gallery
+        
+        Args:
+            media_frame: Frame hosting the gallery
+            load_button: Button to remove
+            property_id: Property ID
+        """
+        load_button.configure(state=tk.DISABLED)
+        
+        def show_error(e):
+            if media_frame.winfo_exists():
+                load_button.destroy()
                 ttk.Label(media_frame, text=f"Error loading media: {e}").pack()
+        
+        self._run_in_background(
+            self.property_manager.get_property_media,
+            lambda media_files: self._create_media_gallery(media_frame, load_button, media_files),
+            property_id,
+            on_error=show_error
+        )
+    
+    def _create_media_gallery(self, media_frame, load_button, media_files: List[Dict[str, Any]]):
+        """
+        Build the media gallery once the media list has been fetched
+        
+        Args:
+            media_frame: Frame hosting the gallery
+            load_button: Button to remove
+            media_files: Media files of the property
+        """
+        # The detail view may have been evicted meanwhile
+        if not media_frame.winfo_exists():
+            return
+        
+        load_button.destroy()
+        
+        # Create media gallery
+        try:
+            self.media_gallery = MediaGallery(
+                media_frame, 
+                media_files=media_files,
+                editable=False
+            )
+        except Exception as e:
+            ttk.Label(media_frame, text=f"Error loading media: {e}").pack()
     
-    def create_detail_action_buttons(self, property_data: Dict[str, Any]):
+    def create_detail_action_buttons(self, parent, property_data: Dict[str, Any]):
         """
         Create action buttons in detail view
         
         Args:
+            parent: Parent widget
             property_data: Property data dictionary
         """
-        actions_frame = ttk.Frame(self.detail_frame)
+        actions_frame = ttk.Frame(parent)
         actions_frame.pack(fill=tk.X, padx=10, pady=10)
         
-        ttk.Button(actions_frame, text=self.localization.get_text("btn_edit_property"), 
+        ttk.Button(actions_frame, text=translate("btn_edit_property"), 
                   command=self.edit_selected_property,
                   style='Primary.TButton').pack(side=tk.LEFT, padx=(0, 10))
         
-        ttk.Button(actions_frame, text=self.localization.get_text("btn_duplicate_property"), 
+        ttk.Button(actions_frame, text=translate("btn_duplicate_property"), 
                   command=self.duplicate_selected_property).pack(side=tk.LEFT, padx=(0, 10))
         
-        ttk.Button(actions_frame, text=self.localization.get_text("btn_generate_website"), 
+        ttk.Button(actions_frame, text=translate("btn_generate_website"), 
                   command=self.generate_website).pack(side=tk.LEFT, padx=(0, 10))
         
-        ttk.Button(actions_frame, text=self.localization.get_text("btn_export"), 
+        ttk.Button(actions_frame, text=translate("btn_export"), 
                   command=self.export_selected_property).pack(side=tk.LEFT)
     
     # Action methods
@@ -693,14 +1289,18 @@ class PropertyManagerInterface:
         if hasattr(self.main_window, 'new_property'):
             self.main_window.new_property()
     
-    def edit_selected_property(self):
+    def edit_selected_property(self, property_id: Optional[int] = None):
         """
         Edit selected property
+        
+        Args:
+            property_id: Property to edit (defaults to the selected one)
         """
-        if not self.selected_property_id:
+        property_id = property_id or self.selected_property_id
+        if not property_id:
             messagebox.showwarning(
-                self.localization.get_text("msg_no_selection"), 
-                self.localization.get_text("msg_no_selection_edit")
+                translate("msg_no_selection"), 
+                translate("msg_no_selection_edit")
             )
             return
         
@@ -710,113 +1310,170 @@ class PropertyManagerInterface:
                 if self.main_window.property_wizard.window.winfo_exists():
                     self.main_window.property_wizard.window.destroy()
             
-            from core.media_handler import MediaHandler
-            from gui.property_wizard import PropertyWizard
-            media_handler = MediaHandler()
-            
             # Open property wizard in edit mode with property ID
             self.main_window.property_wizard = PropertyWizard(
                 self.main_window.root, 
                 self.property_manager, 
-                media_handler,
+                self._get_media_handler(),
                 self.on_property_saved,
-                property_id=self.selected_property_id
+                property_id=property_id
             )
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open property editor: {e}")
     
-    def duplicate_selected_property(self):
+    def _get_media_handler(self):
+        """
+        Get the media handler shared with the main window, creating it once
+        
+        Returns:
+            MediaHandler instance
+        """
+        if self._media_handler is None:
+            self._media_handler = getattr(self.main_window, 'media_handler', None)
+            if self._media_handler is None:
+                from core.media_handler import MediaHandler
+                self._media_handler = MediaHandler()
+                self.main_window.media_handler = self._media_handler
+        return self._media_handler
+    
+    def duplicate_selected_property(self, property_id: Optional[int] = None):
         """
         Duplicate selected property
+        
+        Args:
+            property_id: Property to duplicate (defaults to the selected one)
         """
-        if not self.selected_property_id:
+        property_id = property_id or self.selected_property_id
+        if not property_id:
             messagebox.showwarning(
-                self.localization.get_text("msg_no_selection"), 
-                self.localization.get_text("msg_no_selection_duplicate")
+                translate("msg_no_selection"), 
+                translate("msg_no_selection_duplicate")
             )
             return
         
-        try:
-            new_property_id = self.property_manager.duplicate_property(self.selected_property_id)
+        def duplicated(new_property_id):
             if new_property_id:
                 messagebox.showinfo(
-                    self.localization.get_text("msg_success"), 
-                    self.localization.get_text("msg_property_duplicated").format(new_id=new_property_id)
+                    translate("msg_success"), 
+                    translate("msg_property_duplicated", new_id=new_property_id)
                 )
                 self.refresh_properties_list()
                 if hasattr(self.main_window, 'dashboard') and self.main_window.dashboard:
                     self.main_window.dashboard.refresh()
             else:
                 messagebox.showerror(
-                    self.localization.get_text("msg_error"), 
-                    self.localization.get_text("msg_duplicate_error")
+                    translate("msg_error"), 
+                    translate("msg_duplicate_error")
                 )
-        except Exception as e:
+        
+        def failed(e):
             messagebox.showerror(
-                self.localization.get_text("msg_error"), 
-                f"{self.localization.get_text('msg_duplicate_error')}: {e}"
+                translate("msg_error"), 
+                f"{translate('msg_duplicate_error')}: {e}"
             )
+        
+        self._run_in_background(
+            self.property_manager.duplicate_property, duplicated,
+            property_id,
+            on_error=failed
+        )
+    
+    def _get_property_title(self, property_id: int) -> Optional[str]:
+        """
+        Get the title of a listed property without querying the database
+        
+        Args:
+            property_id: Property ID
+            
+        Returns:
+            Property title or None if the property is not loaded
+        """
+        if self.selected_property_data and self.selected_property_data.get('id') == property_id:
+            return self.selected_property_data['title']
+        for prop in self._last_results:
+            if prop['id'] == property_id:
+                return prop['title']
+        return None
     
-    def delete_selected_property(self):
+    def delete_selected_property(self, property_id: Optional[int] = None):
         """
         Delete selected property
+        
+        Args:
+            property_id: Property to delete (defaults to the selected one)
         """
-        if not self.selected_property_id or not self.selected_property_data:
+        property_id = property_id or self.selected_property_id
+        title = self._get_property_title(property_id) if property_id else None
+        if title is None:
             messagebox.showwarning(
-                self.localization.get_text("msg_no_selection"), 
-                self.localization.get_text("msg_no_selection_delete")
+                translate("msg_no_selection"), 
+                translate("msg_no_selection_delete")
             )
             return
         
         # Confirm deletion
         result = messagebox.askyesno(
-            self.localization.get_text("btn_delete_property"),
-            self.localization.get_text("msg_confirm_delete_property").format(
-                title=self.selected_property_data['title']
-            )
+            translate("btn_delete_property"),
+            translate("msg_confirm_delete_property", title=title)
         )
         
-        if result:
-            try:
-                success = self.property_manager.delete_property_with_media(self.selected_property_id)
-                
-                if success:
-                    messagebox.showinfo(
-                        self.localization.get_text("msg_success"), 
-                        self.localization.get_text("msg_property_deleted")
-                    )
-                    self.refresh_properties_list()
+        if not result:
+            return
+        
+        def deleted(success):
+            if success:
+                self.invalidate_property_details(property_id)
+                messagebox.showinfo(
+                    translate("msg_success"), 
+                    translate("msg_property_deleted")
+                )
+                self.refresh_properties_list()
+                if property_id == self.selected_property_id:
                     self.show_no_selection_message()
-                    if hasattr(self.main_window, 'dashboard') and self.main_window.dashboard:
-                        self.main_window.dashboard.refresh()
-                else:
-                    messagebox.showerror(
-                        self.localization.get_text("msg_error"), 
-                        self.localization.get_text("msg_delete_error")
-                    )
-                    
-            except Exception as e:
+                if hasattr(self.main_window, 'dashboard') and self.main_window.dashboard:
+                    self.main_window.dashboard.refresh()
+            else:
                 messagebox.showerror(
-                    self.localization.get_text("msg_error"), 
-                    f"{self.localization.get_text('msg_delete_error')}: {e}"
+                    translate("msg_error"), 
+                    translate("msg_delete_error")
                 )
+        
+        def failed(e):
+            messagebox.showerror(
+                translate("msg_error"), 
+                f"{translate('msg_delete_error')}: {e}"
+            )
+        
+        self._run_in_background(
+            self.property_manager.delete_property_with_media, deleted,
+            property_id,
+            on_error=failed
+        )
     
-    def generate_website(self):
+    def generate_website(self, property_id: Optional[int] = None):
         """
         Generate website for selected property
+        
+        Args:
+            property_id: Property to generate for (defaults to the selected one)
         """
-        if not self.selected_property_id:
+        property_id = property_id or self.selected_property_id
+        if not property_id:
             messagebox.showwarning("No Selection", "Please select a property to generate website.")
             return
         
-        messagebox.showinfo("Generate Website", f"Generate website for property {self.selected_property_id} - Coming soon...")
+        messagebox.showinfo("Generate Website", f"Generate website for property {property_id} - Coming soon...")
     
-    def export_selected_property(self):
+    def export_selected_property(self, property_id: Optional[int] = None):
         """
         Export selected property
+        
+        Args:
+            property_id: Property to export (defaults to the selected one)
         """
-        if not self.selected_property_id:
+        property_id = property_id or self.selected_property_id
+        if not property_id:
             messagebox.showwarning("No Selection", "Please select a property to export.")
             return
         
@@ -826,18 +1483,41 @@ class PropertyManagerInterface:
         )
         
         if export_path:
-            try:
-                success = self.property_manager.export_property_data(
-                    self.selected_property_id, export_path
-                )
-                
+            self._set_export_running(1)
+            
+            def exported(success):
+                self._set_export_running(-1)
                 if success:
                     messagebox.showinfo("Success", "Property exported successfully.")
                 else:
                     messagebox.showerror("Error", "Failed to export property.")
-                    
-            except Exception as e:
+            
+            def failed(e):
+                self._set_export_running(-1)
                 messagebox.showerror("Error", f"Error exporting property: {e}")
+            
+            self._run_in_background(
+                self.property_manager.export_property_data, exported,
+                property_id, export_path,
+                on_error=failed,
+                executor=self._export_executor
+            )
+    
+    def _set_export_running(self, change: int):
+        """
+        Track running exports and show the progress bar while any is running
+        
+        Args:
+            change: 1 when an export starts, -1 when one finishes
+        """
+        self._exports_running += change
+        if self._exports_running > 0:
+            if not self._export_progress.winfo_ismapped():
+                self._export_progress.pack(side=tk.RIGHT, padx=(0, 10))
+                self._export_progress.start(15)
+        else:
+            self._export_progress.stop()
+            self._export_progress.pack_forget()
     
     def on_property_saved(self, property_id: int):
         """
@@ -846,14 +1526,17 @@ class PropertyManagerInterface:
         Args:
             property_id: ID of saved property
         """
-        self.refresh_properties_list()
+        self.invalidate_property_details(property_id)
+        
+        def select_saved():
+            # Select the saved property
+            iid = str(property_id)
+            if self.properties_tree.exists(iid):
+                self.properties_tree.selection_set(iid)
+                self.properties_tree.focus(iid)
+                self.properties_tree.see(iid)
         
-        # Select the saved property
-        for item in self.properties_tree.get_children():
-            if self.properties_tree.item(item)['values'][0] == property_id:
-                self.properties_tree.selection_set(item)
-                self.properties_tree.focus(item)
-                break
+        self.refresh_properties_list(on_loaded=select_saved)
         
         if hasattr(self.main_window, 'dashboard') and self.main_window.dashboard:
             self.main_window.dashboard.refresh()
\ No newline at end of file
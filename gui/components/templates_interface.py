@@ -8,8 +8,85 @@ Version: 1.0.0
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
-from core.localization import translate
+from functools import partial
+from tkinter import ttk
+from tkinter import font as tkfont
+from core.localization import translate_many
+
+# Translation keys used by the templates interface, looked up in one batch
+_TEXT_KEYS = (
+    "templates_title", "templates_new", "templates_import",
+    "templates_website", "templates_property", "templates_email",
+    "templates_name", "templates_subject", "templates_type", "templates_modified",
+    "templates_preview", "templates_use", "templates_edit",
+    "templates_new_coming_soon", "templates_import_coming_soon"
+)
+
+# Sample website templates
+_WEBSITE_TEMPLATES = (
+    {
+        "name": "Modern Luxury",
+        "description": "Clean, modern design perfect for luxury properties",
+        "preview": "🏢",
+        "features": ("Responsive", "Image Gallery", "Contact Forms")
+    },
+    {
+        "name": "Classic Elegance",
+        "description": "Traditional design with elegant typography",
+        "preview": "🏛️",
+        "features": ("Professional", "Print-friendly", "SEO Optimized")
+    },
+    {
+        "name": "Minimalist",
+        "description": "Simple, clean design focusing on content",
+        "preview": "⬜",
+        "features": ("Fast Loading", "Mobile First", "Accessibility")
+    },
+    {
+        "name": "Real Estate Pro",
+        "description": "Professional template for real estate agencies",
+        "preview": "🏘️",
+        "features": ("Multi-listing", "Search Filters", "Agent Profiles")
+    }
+)
+
+# Sample property listing templates
+_PROPERTY_TEMPLATES = (
+    {
+        "name": "Residential Standard",
+        "description": "Standard template for residential properties",
+        "preview": "🏠",
+        "features": ("Room Details", "Amenities", "Neighborhood Info")
+    },
+    {
+        "name": "Commercial Listing",
+        "description": "Template designed for commercial properties",
+        "preview": "🏢",
+        "features": ("Floor Plans", "Zoning Info", "Investment Details")
+    },
+    {
+        "name": "Luxury Showcase",
+        "description": "Premium template for high-end properties",
+        "preview": "💎",
+        "features": ("Virtual Tour", "Video Gallery", "Concierge Info")
+    },
+    {
+        "name": "Rental Property",
+        "description": "Template optimized for rental listings",
+        "preview": "🔑",
+        "features": ("Lease Terms", "Availability", "Application Form")
+    }
+)
+
+# Sample email templates: name, subject, type, modified
+_SAMPLE_EMAILS = (
+    ("Welcome New Client", "Welcome to Our Real Estate Services", "Client Onboarding", "2024-01-15"),
+    ("Property Inquiry Response", "Thank you for your interest in [Property]", "Inquiry Response", "2024-01-20"),
+    ("Showing Confirmation", "Your property showing is confirmed", "Appointment", "2024-02-01"),
+    ("Market Update", "Monthly Market Report - [Month]", "Newsletter", "2024-02-05"),
+    ("Offer Submitted", "Your offer has been submitted", "Transaction", "2024-01-25"),
+    ("Closing Reminder", "Upcoming closing - Important information", "Transaction", "2024-02-10")
+)
 
 
 class TemplatesInterface:
@@ -17,6 +94,15 @@ class TemplatesInterface:
     Interface for managing website and property templates
     """
     
+    # Template card geometry on the tab canvases
+    CARD_WIDTH = 260
+    CARD_PADDING = 15
+    CARD_MARGIN = 10
+    CARD_COLUMNS = 2
+    
+    # Number of email template rows materialized at a time
+    EMAIL_RENDER_CHUNK = 50
+    
     def __init__(self, parent):
         """
         Initialize templates interface
@@ -25,6 +111,19 @@ class TemplatesInterface:
             parent: Parent widget
         """
         self.parent = parent
+        self._t = translate_many(*_TEXT_KEYS)
+        
+        # Fonts shared by every card instead of per-item font specs
+        self._font_title = tkfont.Font(root=parent, family="Arial", size=16, weight="bold")
+        self._font_card_title = tkfont.Font(root=parent, family="Arial", size=10, weight="bold")
+        self._font_big = tkfont.Font(root=parent, family="Arial", size=24)
+        self._font_small = tkfont.Font(root=parent, family="Arial", size=8)
+        
+        # Email template rows; only a prefix of them is materialized in the tree
+        self._email_rows = []
+        self._email_rendered = 0
+        self._email_render_pending = False
+        
         self.create_interface()
     
     def create_interface(self):
@@ -33,29 +132,49 @@ class TemplatesInterface:
         """
         # Main container
         main_frame = ttk.Frame(self.parent)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        self._main_frame = main_frame
+        self.show()
         
         # Header
         header_frame = ttk.Frame(main_frame)
         header_frame.pack(fill=tk.X, pady=(0, 20))
         
-        title_label = ttk.Label(header_frame, text=translate("templates_title"), 
-                               font=("Arial", 16, "bold"))
+        title_label = ttk.Label(header_frame, text=self._t["templates_title"], 
+                               font=self._font_title)
         title_label.pack(side=tk.LEFT)
         
         # Action buttons
         button_frame = ttk.Frame(header_frame)
         button_frame.pack(side=tk.RIGHT)
         
-        ttk.Button(button_frame, text=translate("templates_new"),
+        ttk.Button(button_frame, text=self._t["templates_new"],
                   command=self.new_template).pack(side=tk.LEFT, padx=(0, 10))
         
-        ttk.Button(button_frame, text=translate("templates_import"),
+        ttk.Button(button_frame, text=self._t["templates_import"],
                   command=self.import_template).pack(side=tk.LEFT)
         
+        # Status line for placeholder actions
+        self._status_var = tk.StringVar()
+        self._status_after_id = None
+        ttk.Label(main_frame, textvariable=self._status_var, 
+                 foreground="gray").pack(side=tk.BOTTOM, fill=tk.X, pady=(10, 0))
+        
         # Template categories
         self.create_template_categories(main_frame)
     
+    def show(self):
+        """
+        Show the interface in its parent
+        """
+        if not self._main_frame.winfo_manager():
+            self._main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+    
+    def hide(self):
+        """
+        Hide the interface, keeping it built for the next show()
+        """
+        self._main_frame.pack_forget()
+    
     def create_template_categories(self, parent):
         """
         Create template categories with tabs
@@ -67,128 +186,119 @@ class TemplatesInterface:
         self.notebook = ttk.Notebook(parent)
         self.notebook.pack(fill=tk.BOTH, expand=True)
         
-        # Website templates tab
-        self.create_website_templates_tab()
-        
-        # Property listing templates tab
-        self.create_property_templates_tab()
+        # Tabs are empty until first shown: website, property listing, email
+        self._tab_builders = {}
+        for text_key, builder in (("templates_website", self.create_website_templates_tab),
+                                  ("templates_property", self.create_property_templates_tab),
+                                  ("templates_email", self.create_email_templates_tab)):
+            tab_frame = ttk.Frame(self.notebook)
+            self.notebook.add(tab_frame, text=self._t[text_key])
+            self._tab_builders[str(tab_frame)] = (builder, tab_frame)
+        
+        # Build the visible tab now, the others when selected
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self._build_current_tab()
+    
+    def _on_tab_changed(self, event):
+        """
+        Handle notebook tab changes
         
-        # Email templates tab
-        self.create_email_templates_tab()
+        Args:
+            event: Tab change event
+        """
+        self._build_current_tab()
     
-    def create_website_templates_tab(self):
+    def _build_current_tab(self):
         """
-        Create website templates tab
+        Build the selected tab the first time it is shown
+        """
+        pending = self._tab_builders.pop(self.notebook.select(), None)
+        if pending:
+            builder, tab_frame = pending
+            builder(tab_frame)
+    
+    def create_website_templates_tab(self, tab_frame):
         """
-        tab_frame = ttk.Frame(self.notebook)
-        self.notebook.add(tab_frame, text=translate("templates_website"))
+        Create website templates tab
         
+        Args:
+            tab_frame: Tab frame to fill
+        """
         # Templates grid
-        canvas = tk.Canvas(tab_frame)
-        scrollbar = ttk.Scrollbar(tab_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Sample website templates
-        website_templates = [
-            {
-                "name": "Modern Luxury",
-                "description": "Clean, modern design perfect for luxury properties",
-                "preview": "🏢",
-                "features": ["Responsive", "Image Gallery", "Contact Forms"]
-            },
-            {
-                "name": "Classic Elegance",
-                "description": "Traditional design with elegant typography",
-                "preview": "🏛️",
-                "features": ["Professional", "Print-friendly", "SEO Optimized"]
-            },
-            {
-                "name": "Minimalist",
-                "description": "Simple, clean design focusing on content",
-                "preview": "⬜",
-                "features": ["Fast Loading", "Mobile First", "Accessibility"]
-            },
-            {
-                "name": "Real Estate Pro",
-                "description": "Professional template for real estate agencies",
-                "preview": "🏘️",
-                "features": ["Multi-listing", "Search Filters", "Agent Profiles"]
-            }
-        ]
-        
-        self.create_template_grid(scrollable_frame, website_templates, "website")
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        canvas = self._make_scrollable(tab_frame)
+        self.create_template_grid(canvas, _WEBSITE_TEMPLATES, "website")
     
-    def create_property_templates_tab(self):
+    def create_property_templates_tab(self, tab_frame):
         """
         Create property listing templates tab
-        """
-        tab_frame = ttk.Frame(self.notebook)
-        self.notebook.add(tab_frame, text=translate("templates_property"))
         
+        Args:
+            tab_frame: Tab frame to fill
+        """
         # Templates grid
-        canvas = tk.Canvas(tab_frame)
-        scrollbar = ttk.Scrollbar(tab_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        canvas = self._make_scrollable(tab_frame)
+        self.create_template_grid(canvas, _PROPERTY_TEMPLATES, "property")
+    
+    def _make_scrollable(self, parent):
+        """
+        Create a vertically scrollable canvas filling a tab
         
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        Args:
+            parent: Parent widget
+            
+        Returns:
+            The canvas
+        """
+        canvas = tk.Canvas(parent, highlightthickness=0)
+        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
         canvas.configure(yscrollcommand=scrollbar.set)
         
-        # Sample property templates
-        property_templates = [
-            {
-                "name": "Residential Standard",
-                "description": "Standard template for residential properties",
-                "preview": "🏠",
-                "features": ["Room Details", "Amenities", "Neighborhood Info"]
-            },
-            {
-                "name": "Commercial Listing",
-                "description": "Template designed for commercial properties",
-                "preview": "🏢",
-                "features": ["Floor Plans", "Zoning Info", "Investment Details"]
-            },
-            {
-                "name": "Luxury Showcase",
-                "description": "Premium template for high-end properties",
-                "preview": "💎",
-                "features": ["Virtual Tour", "Video Gallery", "Concierge Info"]
-            },
-            {
-                "name": "Rental Property",
-                "description": "Template optimized for rental listings",
-                "preview": "🔑",
-                "features": ["Lease Terms", "Availability", "Application Form"]
-            }
-        ]
-        
-        self.create_template_grid(scrollable_frame, property_templates, "property")
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        canvas.grid(row=0, column=0, sticky="nsew")
+        scrollbar.grid(row=0, column=1, sticky="ns")
+        parent.grid_rowconfigure(0, weight=1)
+        parent.grid_columnconfigure(0, weight=1)
+        
+        self._bind_mousewheel(canvas)
+        return canvas
     
-    def create_email_templates_tab(self):
+    def _bind_mousewheel(self, canvas):
         """
-        Create email templates tab
+        Scroll a canvas with the mouse wheel, at most once per idle pass
+        
+        Args:
+            canvas: Canvas to scroll
         """
-        tab_frame = ttk.Frame(self.notebook)
-        self.notebook.add(tab_frame, text=translate("templates_email"))
+        state = {'delta': 0, 'after_id': None}
+        
+        def flush():
+            state['after_id'] = None
+            units = int(-1*(state['delta']/120))
+            # Keep the sub-unit remainder for the next flush
+            state['delta'] += units * 120
+            if units:
+                canvas.yview_scroll(units, "units")
+        
+        def on_wheel(event):
+            # X11 reports wheel steps as buttons 4 and 5
+            if event.num == 4:
+                state['delta'] += 120
+            elif event.num == 5:
+                state['delta'] -= 120
+            else:
+                state['delta'] += event.delta
+            if state['after_id'] is None:
+                state['after_id'] = canvas.after_idle(flush)
+        
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            canvas.bind(sequence, on_wheel)
+    
+    def create_email_templates_tab(self, tab_frame):
+        """
+        Create email templates tab
         
+        Args:
+            tab_frame: Tab frame to fill
+        """
         # Templates list
         list_frame = ttk.Frame(tab_frame)
         list_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
@@ -198,10 +308,10 @@ class TemplatesInterface:
         self.email_tree = ttk.Treeview(list_frame, columns=columns, show='headings', height=15)
         
         # Configure columns
-        self.email_tree.heading('name', text=translate("templates_name"))
-        self.email_tree.heading('subject', text=translate("templates_subject"))
-        self.email_tree.heading('type', text=translate("templates_type"))
-        self.email_tree.heading('modified', text=translate("templates_modified"))
+        self.email_tree.heading('name', text=self._t["templates_name"])
+        self.email_tree.heading('subject', text=self._t["templates_subject"])
+        self.email_tree.heading('type', text=self._t["templates_type"])
+        self.email_tree.heading('modified', text=self._t["templates_modified"])
         
         self.email_tree.column('name', width=200)
         self.email_tree.column('subject', width=300)
@@ -212,7 +322,8 @@ class TemplatesInterface:
         v_scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.email_tree.yview)
         h_scrollbar = ttk.Scrollbar(list_frame, orient=tk.HORIZONTAL, command=self.email_tree.xview)
         
-        self.email_tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.email_tree.configure(yscrollcommand=self._on_email_yscroll, xscrollcommand=h_scrollbar.set)
+        self._email_v_scrollbar = v_scrollbar
         
         # Pack treeview and scrollbars
         self.email_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -225,81 +336,162 @@ class TemplatesInterface:
         # Bind events
         self.email_tree.bind('<Double-1>', self.edit_email_template)
     
-    def create_template_grid(self, parent, templates, template_type):
+    def create_template_grid(self, canvas, templates, template_type):
         """
-        Create a grid of template cards
+        Draw a grid of template cards on a canvas
+        
+        Card texts and borders are canvas items; only the action buttons
+        are widgets.
         
         Args:
-            parent: Parent widget
+            canvas: Canvas to draw on
             templates: List of template dictionaries
             template_type: Type of templates (website, property)
         """
-        row = 0
-        col = 0
-        max_cols = 2
-        
-        for template in templates:
-            # Template card frame
-            card_frame = ttk.LabelFrame(parent, text=template["name"], padding=15)
-            card_frame.grid(row=row, column=col, padx=10, pady=10, sticky="ew")
+        max_cols = self.CARD_COLUMNS
+        
+        cell_width = self.CARD_WIDTH + 2 * self.CARD_MARGIN
+        text_width = self.CARD_WIDTH - 2 * self.CARD_PADDING
+        row_top = self.CARD_MARGIN
+        row_bottom = row_top
+        row_lefts = []
+        
+        for index, template in enumerate(templates):
+            # Grid position
+            row, col = divmod(index, max_cols)
+            left = self.CARD_MARGIN + col * cell_width
+            center = left + self.CARD_WIDTH // 2
+            y = row_top + self.CARD_PADDING
+            
+            # Card title
+            y = self._draw_card_text(canvas, center, y, template["name"], 
+                                     font=self._font_card_title, width=text_width) + 10
             
             # Preview icon
-            preview_label = ttk.Label(card_frame, text=template["preview"], 
-                                    font=("Arial", 24))
-            preview_label.pack(pady=(0, 10))
+            y = self._draw_card_text(canvas, center, y, template["preview"], 
+                                     font=self._font_big) + 10
             
             # Description
-            desc_label = ttk.Label(card_frame, text=template["description"], 
-                                 wraplength=200, justify=tk.CENTER)
-            desc_label.pack(pady=(0, 10))
+            y = self._draw_card_text(canvas, center, y, template["description"], 
+                                     width=text_width, justify=tk.CENTER) + 10
             
             # Features
-            features_frame = ttk.Frame(card_frame)
-            features_frame.pack(pady=(0, 10))
-            
-            for feature in template["features"]:
-                feature_label = ttk.Label(features_frame, text=f"• {feature}", 
-                                        font=("Arial", 8))
-                feature_label.pack(anchor=tk.W)
+            features_text = "\n".join(f"• {feature}" for feature in template["features"])
+            y = self._draw_card_text(canvas, center, y, features_text, 
+                                     font=self._font_small, justify=tk.LEFT) + 10
             
             # Action buttons
-            button_frame = ttk.Frame(card_frame)
-            button_frame.pack(fill=tk.X)
+            buttons = [
+                ttk.Button(canvas, text=self._t["templates_preview"], style='Card.TButton',
+                          command=partial(self.preview_template, template, template_type)),
+                ttk.Button(canvas, text=self._t["templates_use"], style='Card.TButton',
+                          command=partial(self.use_template, template, template_type)),
+                ttk.Button(canvas, text=self._t["templates_edit"], style='Card.TButton',
+                          command=partial(self.edit_template, template, template_type))
+            ]
+            buttons_width = sum(button.winfo_reqwidth() for button in buttons) + 5 * (len(buttons) - 1)
+            x = center - buttons_width // 2
+            for button in buttons:
+                canvas.create_window(x, y, window=button, anchor=tk.NW)
+                x += button.winfo_reqwidth() + 5
+            y += max(button.winfo_reqheight() for button in buttons)
             
-            ttk.Button(button_frame, text=translate("templates_preview"),
-                      command=lambda t=template: self.preview_template(t, template_type)).pack(side=tk.LEFT, padx=(0, 5))
+            row_bottom = max(row_bottom, y + self.CARD_PADDING)
+            row_lefts.append(left)
             
-            ttk.Button(button_frame, text=translate("templates_use"),
-                      command=lambda t=template: self.use_template(t, template_type)).pack(side=tk.LEFT, padx=(0, 5))
-            
-            ttk.Button(button_frame, text=translate("templates_edit"),
-                      command=lambda t=template: self.edit_template(t, template_type)).pack(side=tk.LEFT)
+            # Row complete
+            if col == max_cols - 1 or index == len(templates) - 1:
+                # Card borders, sized to the tallest card of the row
+                for card_left in row_lefts:
+                    border = canvas.create_rectangle(card_left, row_top, 
+                                                     card_left + self.CARD_WIDTH, row_bottom, 
+                                                     outline='#cccccc')
+                    canvas.tag_lower(border)
+                row_lefts = []
+                row_top = row_bottom + 2 * self.CARD_MARGIN
+                row_bottom = row_top
+        
+        # Extent of the cards is known from the layout, no need for bbox("all")
+        width = min(len(templates), max_cols) * cell_width
+        height = row_top - self.CARD_MARGIN
+        canvas.configure(scrollregion=(0, 0, width, height))
+    
+    def _draw_card_text(self, canvas, x, y, text, **options):
+        """
+        Draw a text item of a template card
+        
+        Args:
+            canvas: Canvas to draw on
+            x: Horizontal center of the text
+            y: Top of the text
+            text: Text to draw
+            **options: Extra text item options
             
-            # Update grid position
-            col += 1
-            if col >= max_cols:
-                col = 0
-                row += 1
-        
-        # Configure grid weights
-        for i in range(max_cols):
-            parent.grid_columnconfigure(i, weight=1)
+        Returns:
+            Bottom coordinate of the drawn text
+        """
+        item = canvas.create_text(x, y, text=text, anchor=tk.N, **options)
+        return canvas.bbox(item)[3]
     
     def load_sample_email_templates(self):
         """
         Load sample email templates
         """
-        sample_emails = [
-            ("Welcome New Client", "Welcome to Our Real Estate Services", "Client Onboarding", "2024-01-15"),
-            ("Property Inquiry Response", "Thank you for your interest in [Property]", "Inquiry Response", "2024-01-20"),
-            ("Showing Confirmation", "Your property showing is confirmed", "Appointment", "2024-02-01"),
-            ("Market Update", "Monthly Market Report - [Month]", "Newsletter", "2024-02-05"),
-            ("Offer Submitted", "Your offer has been submitted", "Transaction", "2024-01-25"),
-            ("Closing Reminder", "Upcoming closing - Important information", "Transaction", "2024-02-10")
-        ]
+        self._email_rows = _SAMPLE_EMAILS
+        self._email_rendered = 0
+        self._render_more_email_rows()
+    
+    def _on_email_yscroll(self, first, last):
+        """
+        Update the scrollbar and render more rows when nearing the end
+        
+        Args:
+            first: Top of the visible fraction
+            last: Bottom of the visible fraction
+        """
+        self._email_v_scrollbar.set(first, last)
+        
+        has_more = self._email_rendered < len(self._email_rows)
+        if float(last) >= 0.9 and has_more and not self._email_render_pending:
+            self._email_render_pending = True
+            self.email_tree.after_idle(self._render_more_email_rows)
+    
+    def _render_more_email_rows(self):
+        """
+        Materialize the next chunk of email template rows
+        """
+        self._email_render_pending = False
         
-        for email in sample_emails:
+        start = self._email_rendered
+        
+        # Hide the columns while inserting so rows are laid out once
+        self.email_tree.configure(displaycolumns=())
+        for email in self._email_rows[start:start + self.EMAIL_RENDER_CHUNK]:
             self.email_tree.insert('', tk.END, values=email)
+        self.email_tree.configure(displaycolumns='#all')
+        self._email_rendered = min(len(self._email_rows), start + self.EMAIL_RENDER_CHUNK)
+    
+    def _show_status(self, title, message):
+        """
+        Show a transient message in the status line
+        
+        Args:
+            title: Message title
+            message: Message text
+        """
+        self._status_var.set(f"{title}: {message}")
+        
+        # Clear it after a while, unless a newer message replaced it
+        if self._status_after_id:
+            self.parent.after_cancel(self._status_after_id)
+        self._status_after_id = self.parent.after(3000, self._clear_status)
+    
+    def _clear_status(self):
+        """
+        Clear the status line
+        """
+        self._status_after_id = None
+        self._status_var.set("")
     
     def preview_template(self, template, template_type):
         """
@@ -309,8 +501,8 @@ class TemplatesInterface:
             template: Template dictionary
             template_type: Type of template
         """
-        messagebox.showinfo(
-            translate("templates_preview"),
+        self._show_status(
+            self._t["templates_preview"],
             f"Preview for {template['name']} ({template_type}) coming soon!"
         )
     
@@ -322,8 +514,8 @@ class TemplatesInterface:
             template: Template dictionary
             template_type: Type of template
         """
-        messagebox.showinfo(
-            translate("templates_use"),
+        self._show_status(
+            self._t["templates_use"],
             f"Using template {template['name']} ({template_type}) coming soon!"
         )
     
@@ -335,8 +527,8 @@ class TemplatesInterface:
             template: Template dictionary
             template_type: Type of template
         """
-        messagebox.showinfo(
-            translate("templates_edit"),
+        self._show_status(
+            self._t["templates_edit"],
             f"Editing template {template['name']} ({template_type}) coming soon!"
         )
     
@@ -349,10 +541,9 @@ class TemplatesInterface:
         """
         selection = self.email_tree.selection()
         if selection:
-            item = self.email_tree.item(selection[0])
-            template_name = item['values'][0]
-            messagebox.showinfo(
-                translate("templates_edit"),
+            template_name = self.email_tree.set(selection[0], 'name')
+            self._show_status(
+                self._t["templates_edit"],
                 f"Editing email template '{template_name}' coming soon!"
             )
     
@@ -360,10 +551,10 @@ class TemplatesInterface:
         """
         Create new template
         """
-        messagebox.showinfo(translate("templates_new"), translate("templates_new_coming_soon"))
+        self._show_status(self._t["templates_new"], self._t["templates_new_coming_soon"])
     
     def import_template(self):
         """
         Import template
         """
-        messagebox.showinfo(translate("templates_import"), translate("templates_import_coming_soon"))
\ No newline at end of file
+        self._show_status(self._t["templates_import"], self._t["templates_import_coming_soon"])
\ No newline at end of file
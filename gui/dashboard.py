@@ -8,24 +8,43 @@ Version: 1.0.0
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, scrolledtext
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 import webbrowser
-import sys
+from contextlib import contextmanager
+from functools import partial
 from gui.components.property_manager_interface import PropertyManagerInterface
+from core.localization import translate, translate_many, get_language
 
-# Add the project root to the path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
-from core.localization import translate
+def _fmt_currency(value) -> str:
+    """
+    Format an amount for a statistics card
+    
+    Args:
+        value: Amount in euros
+        
+    Returns:
+        Formatted amount, or 'N/A' when there is none
+    """
+    return f"€{value:,.0f}" if value > 0 else 'N/A'
 
 class Dashboard:
     """
     Dashboard interface for property overview and quick actions
     """
     
+    # Number of cards in the recent properties list
+    RECENT_COUNT = 5
+    
+    # Statistics card geometry
+    STAT_CARD_HEIGHT = 100
+    STAT_CARD_MARGIN = 10
+    STAT_CARD_PADDING = 15
+    
+    # Directory holding the help dialog texts
+    HELP_DIR = Path(__file__).parent / 'help'
+    
     def __init__(self, parent_frame, property_manager, main_window):
         """
         Initialize dashboard
@@ -39,6 +58,33 @@ class Dashboard:
         self.property_manager = property_manager
         self.main_window = main_window
         
+        # Query results, reused until the property manager revision changes
+        self._stats_cache = None
+        self._stats_rev = -1
+        self._summaries_cache = None
+        self._summaries_rev = -1
+        
+        # Recent property cards, built once and reconfigured on refresh
+        self._card_pool = []
+        self._empty_frame = None
+        
+        # Translated widgets as (translation key, widget) pairs, updated by refresh_language()
+        self._translated_widgets = []
+        self._language = get_language()
+        
+        # Help texts, loaded on first use
+        self._help_cache = {}
+        self._help_window = None
+        self._help_text = None
+        
+        # Scrollregion update state
+        self._sr_after_id = None
+        self._layout_suspended = 0
+        
+        # Mouse wheel delta not yet applied, and its pending flush
+        self._wheel_delta = 0
+        self._wheel_after_id = None
+        
         self.setup_dashboard()
     
     def setup_dashboard(self):
@@ -50,10 +96,7 @@ class Dashboard:
         self.scrollbar = ttk.Scrollbar(self.parent_frame, orient="vertical", command=self.canvas.yview)
         self.scrollable_frame = ttk.Frame(self.canvas)
         
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+        self.scrollable_frame.bind("<Configure>", self._schedule_scrollregion)
         
         self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         self.canvas.configure(yscrollcommand=self.scrollbar.set)
@@ -62,15 +105,134 @@ class Dashboard:
         self.canvas.pack(side="left", fill="both", expand=True)
         self.scrollbar.pack(side="right", fill="y")
         
-        # Bind mousewheel to canvas
-        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
+        # Scroll on the wheel anywhere over the dashboard, not only over the bare
+        # canvas; the application-wide binding only exists while the pointer is
+        # over the dashboard, so other tabs keep their own wheel handling
+        self.canvas.bind("<Enter>", self._on_pointer_enter)
+        self.canvas.bind("<Leave>", self._on_pointer_leave)
+        self.canvas.bind("<Destroy>", self._on_destroy)
         
         # Create dashboard content
-        self.create_header()
-        self.create_statistics_section()
-        self.create_quick_actions_section()
-        self.create_recent_properties_section()
-        self.create_tips_section()
+        with self._suppress_layout():
+            self.create_header()
+            self.create_statistics_section()
+            self.create_quick_actions_section()
+            self.create_recent_properties_section()
+        
+        # Tips are below the fold; build them once the first paint is done
+        self.parent_frame.after_idle(self.create_tips_section)
+    
+    @contextmanager
+    def _suppress_layout(self):
+        """
+        Batch dashboard content changes into a single scrollregion update
+        
+        Configure events raised while the block runs are ignored and the
+        scrollbar is detached; both are restored on exit and the
+        scrollregion is recomputed once.
+        """
+        self._layout_suspended += 1
+        if self._layout_suspended == 1:
+            self.canvas.configure(yscrollcommand='')
+        try:
+            yield
+        finally:
+            self._layout_suspended -= 1
+            if not self._layout_suspended:
+                self.canvas.configure(yscrollcommand=self.scrollbar.set)
+                self._schedule_scrollregion()
+    
+    def _translated(self, key: str, widget):
+        """
+        Register a widget whose text is the translation of key
+        
+        Args:
+            key: Translation key
+            widget: Widget to update on language change
+            
+        Returns:
+            The widget
+        """
+        self._translated_widgets.append((key, widget))
+        return widget
+    
+    def _schedule_scrollregion(self, event=None):
+        """
+        Schedule a scrollregion update once the layout has settled
+        
+        Args:
+            event: Configure event
+        """
+        if self._layout_suspended or self._sr_after_id is not None:
+            return
+        self._sr_after_id = self.canvas.after_idle(self._update_scrollregion)
+    
+    def _update_scrollregion(self):
+        """
+        Apply the pending scrollregion update
+        """
+        self._sr_after_id = None
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+    
+    def _is_over_canvas(self, x_root: int, y_root: int) -> bool:
+        """
+        Check whether a screen position is over the canvas or one of its descendants
+        
+        Args:
+            x_root: Screen x coordinate
+            y_root: Screen y coordinate
+            
+        Returns:
+            True if the position is over the dashboard canvas
+        """
+        try:
+            widget = self.canvas.winfo_containing(x_root, y_root)
+        except KeyError:
+            # Pointer over a Tk-internal window unknown to tkinter (e.g. a combobox list)
+            return False
+        if widget is None:
+            return False
+        path, canvas_path = str(widget), str(self.canvas)
+        return path == canvas_path or path.startswith(canvas_path + '.')
+    
+    def _on_pointer_enter(self, event):
+        """
+        Route mouse wheel events to the dashboard while the pointer is over it
+        
+        Args:
+            event: Enter event
+        """
+        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel_global)
+    
+    def _on_pointer_leave(self, event):
+        """
+        Release the mouse wheel once the pointer has left the dashboard
+        
+        Args:
+            event: Leave event
+        """
+        # Moving onto a card also leaves the bare canvas; keep the binding then
+        if not self._is_over_canvas(event.x_root, event.y_root):
+            self.canvas.unbind_all("<MouseWheel>")
+    
+    def _on_mousewheel_global(self, event):
+        """
+        Dispatch application-wide mouse wheel events over the dashboard
+        
+        Args:
+            event: Mouse wheel event
+        """
+        if self._is_over_canvas(event.x_root, event.y_root):
+            self._on_mousewheel(event)
+    
+    def _on_destroy(self, event):
+        """
+        Release the application-wide mouse wheel binding when the dashboard goes away
+        
+        Args:
+            event: Destroy event
+        """
+        self.canvas.unbind_all("<MouseWheel>")
     
     def _on_mousewheel(self, event):
         """
@@ -79,7 +241,21 @@ class Dashboard:
         Args:
             event: Mouse wheel event
         """
-        self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        # Coalesce bursts of wheel events into one scroll per idle pass
+        self._wheel_delta += event.delta
+        if self._wheel_after_id is None:
+            self._wheel_after_id = self.canvas.after_idle(self._flush_mousewheel)
+    
+    def _flush_mousewheel(self):
+        """
+        Apply the accumulated mouse wheel delta
+        """
+        self._wheel_after_id = None
+        units = int(-1*(self._wheel_delta/120))
+        # Keep the sub-unit remainder for the next flush
+        self._wheel_delta += units * 120
+        if units:
+            self.canvas.yview_scroll(units, "units")
     
     def create_header(self):
         """
@@ -89,130 +265,162 @@ class Dashboard:
         header_frame.pack(fill=tk.X, padx=20, pady=20)
         
         # Welcome message
-        self.welcome_label = ttk.Label(
+        self.welcome_label = self._translated('dashboard_welcome', ttk.Label(
             header_frame,
             text=translate('dashboard_welcome'),
             font=('Segoe UI', 20, 'bold')
-        )
+        ))
         self.welcome_label.pack(anchor=tk.W)
         
-        self.subtitle_label = ttk.Label(
+        self.subtitle_label = self._translated('dashboard_subtitle', ttk.Label(
             header_frame,
             text=translate('dashboard_subtitle'),
             font=('Segoe UI', 12),
             foreground='gray'
-        )
+        ))
         self.subtitle_label.pack(anchor=tk.W, pady=(5, 0))
     
     def create_statistics_section(self):
         """
         Create statistics cards section
         """
-        self.stats_frame = ttk.LabelFrame(self.scrollable_frame, text=translate('dashboard_stats'), padding=15)
+        self.stats_frame = self._translated('dashboard_stats', ttk.LabelFrame(
+            self.scrollable_frame, text=translate('dashboard_stats'), padding=15))
         self.stats_frame.pack(fill=tk.X, padx=20, pady=(0, 20))
         
-        # Statistics container
-        self.stats_container = ttk.Frame(self.stats_frame)
-        self.stats_container.pack(fill=tk.X)
+        # Statistics cards are drawn on a single canvas, matching the frame background
+        background = ttk.Style(self.stats_frame).lookup('TLabelframe', 'background') or 'white'
+        self.stats_canvas = tk.Canvas(
+            self.stats_frame,
+            height=self.STAT_CARD_HEIGHT + 2 * self.STAT_CARD_MARGIN,
+            bg=background,
+            highlightthickness=0,
+            borderwidth=0
+        )
+        self.stats_canvas.pack(fill=tk.X)
+        self.stats_canvas.bind("<Configure>", self._layout_stat_cards)
         
         # Create placeholder cards
         self.create_stat_cards()
     
     def create_stat_cards(self):
         """
-        Create statistics cards
+        Create statistics cards, filled in by update_stat_cards()
         """
-        # Clear existing cards
-        for widget in self.stats_container.winfo_children():
-            widget.destroy()
+        # Card definitions: statistic key, title, color, icon
+        cards_data = [
+            {'key': 'total_properties', 'title': 'Total Properties', 'color': '#4CAF50', 'icon': '🏠'},
+            {'key': 'total_value', 'title': 'Total Value', 'color': '#2196F3', 'icon': '💰'},
+            {'key': 'average_price', 'title': 'Average Price', 'color': '#FF9800', 'icon': '📊'},
+            {'key': 'total_media_files', 'title': 'Media Files', 'color': '#9C27B0', 'icon': '📷'}
+        ]
         
+        # Create cards, keeping their canvas items for updates
+        self._stat_card_items = {}
+        self._stat_values = {}
+        for card_data in cards_data:
+            self.create_stat_card(card_data)
+        self._layout_stat_cards()
+        
+        self.update_stat_cards()
+    
+    def update_stat_cards(self):
+        """
+        Write current statistics into the existing cards
+        """
         # Get statistics
-        stats = self.property_manager.get_property_statistics()
+        stats = self._get_statistics()
+        
+        values = {
+            'total_properties': str(stats['total_properties']),
+            'total_value': _fmt_currency(stats['total_value']),
+            'average_price': _fmt_currency(stats['average_price']),
+            'total_media_files': str(stats['total_media_files'])
+        }
+        
+        # Only touch the values that changed since the last update
+        for key, value in values.items():
+            if self._stat_values.get(key) != value:
+                self.stats_canvas.itemconfig(self._stat_card_items[key]['value'], text=value)
+                self._stat_values[key] = value
+    
+    def _get_statistics(self) -> Dict[str, Any]:
+        """
+        Get property statistics, querying only when properties changed
         
-        # Define card data
-        cards_data = [
-            {
-                'title': 'Total Properties',
-                'value': str(stats['total_properties']),
-                'color': '#4CAF50',
-                'icon': '🏠'
-            },
-            {
-                'title': 'Total Value',
-                'value': f"€{stats['total_value']:,.0f}" if stats['total_value'] > 0 else 'N/A',
-                'color': '#2196F3',
-                'icon': '💰'
-            },
-            {
-                'title': 'Average Price',
-                'value': f"€{stats['average_price']:,.0f}" if stats['average_price'] > 0 else 'N/A',
-                'color': '#FF9800',
-                'icon': '📊'
-            },
-            {
-                'title': 'Media Files',
-                'value': str(stats['total_media_files']),
-                'color': '#9C27B0',
-                'icon': '📷'
-            }
-        ]
+        Returns:
+            Statistics dictionary
+        """
+        rev = self.property_manager.revision
+        if rev != self._stats_rev:
+            self._stats_cache = self.property_manager.get_property_statistics()
+            self._stats_rev = rev
+        return self._stats_cache
+    
+    def _get_summaries(self) -> List[Dict[str, Any]]:
+        """
+        Get property summaries, querying only when properties changed
         
-        # Create cards in a grid
-        for i, card_data in enumerate(cards_data):
-            self.create_stat_card(self.stats_container, card_data, i)
+        Returns:
+            List of property summaries, most recently updated first
+        """
+        rev = self.property_manager.revision
+        if rev != self._summaries_rev:
+            self._summaries_cache = self.property_manager.get_all_property_summaries()
+            self._summaries_rev = rev
+        return self._summaries_cache
     
-    def create_stat_card(self, parent, card_data: Dict[str, str], index: int):
+    def create_stat_card(self, card_data: Dict[str, str]):
         """
-        Create individual statistics card
+        Create individual statistics card, positioned by _layout_stat_cards()
         
         Args:
-            parent: Parent widget
             card_data: Card data dictionary
-            index: Card index for positioning
         """
-        # Card frame
-        card_frame = ttk.Frame(parent, style='Card.TFrame')
-        card_frame.grid(row=0, column=index, padx=10, pady=5, sticky='ew')
-        
-        # Configure grid weight
-        parent.grid_columnconfigure(index, weight=1)
-        
-        # Card content
-        content_frame = ttk.Frame(card_frame)
-        content_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
-        
-        # Icon and value
-        header_frame = ttk.Frame(content_frame)
-        header_frame.pack(fill=tk.X)
-        
-        icon_label = ttk.Label(
-            header_frame,
-            text=card_data['icon'],
-            font=('Segoe UI', 24)
-        )
-        icon_label.pack(side=tk.LEFT)
-        
-        value_label = ttk.Label(
-            header_frame,
-            text=card_data['value'],
-            font=('Segoe UI', 18, 'bold')
-        )
-        value_label.pack(side=tk.RIGHT)
+        canvas = self.stats_canvas
+        background = canvas.cget('bg')
+        
+        self._stat_card_items[card_data['key']] = {
+            'border': canvas.create_rectangle(0, 0, 0, 0, fill=background, outline='#cccccc'),
+            'icon': canvas.create_text(0, 0, text=card_data['icon'],
+                                       font=('Segoe UI', 24), anchor=tk.W),
+            'value': canvas.create_text(0, 0, text='',
+                                        font=('Segoe UI', 18, 'bold'), anchor=tk.E),
+            'title': canvas.create_text(0, 0, text=card_data['title'],
+                                        font=('Segoe UI', 10), fill='gray', anchor=tk.SW)
+        }
+    
+    def _layout_stat_cards(self, event=None):
+        """
+        Position the statistics cards across the canvas width
         
-        # Title
-        title_label = ttk.Label(
-            content_frame,
-            text=card_data['title'],
-            font=('Segoe UI', 10),
-            foreground='gray'
-        )
-        title_label.pack(anchor=tk.W, pady=(10, 0))
+        Args:
+            event: Configure event
+        """
+        canvas = self.stats_canvas
+        width = event.width if event else canvas.winfo_width()
+        count = len(self._stat_card_items)
+        margin = self.STAT_CARD_MARGIN
+        padding = self.STAT_CARD_PADDING
+        card_width = max((width - 2 * margin * count) / count, 0)
+        top = margin
+        bottom = top + self.STAT_CARD_HEIGHT
+        
+        for index, items in enumerate(self._stat_card_items.values()):
+            left = margin + index * (card_width + 2 * margin)
+            right = left + card_width
+            header_y = top + padding + 20
+            canvas.coords(items['border'], left, top, right, bottom)
+            canvas.coords(items['icon'], left + padding, header_y)
+            canvas.coords(items['value'], right - padding, header_y)
+            canvas.coords(items['title'], left + padding, bottom - padding)
     
     def create_quick_actions_section(self):
         """
         Create quick actions section
         """
-        self.actions_frame = ttk.LabelFrame(self.scrollable_frame, text=translate('dashboard_quick_actions'), padding=15)
+        self.actions_frame = self._translated('dashboard_quick_actions', ttk.LabelFrame(
+            self.scrollable_frame, text=translate('dashboard_quick_actions'), padding=15))
         self.actions_frame.pack(fill=tk.X, padx=20, pady=(0, 20))
         
         # Actions container
@@ -222,40 +430,44 @@ class Dashboard:
         # Action buttons
         actions = [
             {
-                'text': translate('dashboard_new_property'),
+                'key': 'dashboard_new_property',
                 'command': self.main_window.new_property,
                 'style': 'Primary.TButton'
             },
             {
+                'key': None,
                 'text': 'Manage Properties',
                 'command': self.open_property_manager,
                 'style': 'Secondary.TButton'
             },
             {
-                'text': translate('dashboard_generate_website'),
+                'key': 'dashboard_generate_website',
                 'command': self.main_window.generate_website,
                 'style': 'Secondary.TButton'
             },
             {
-                'text': translate('dashboard_ai_staging'),
+                'key': 'dashboard_ai_staging',
                 'command': self.main_window.ai_staging,
                 'style': 'Secondary.TButton'
             },
             {
-                'text': translate('dashboard_import_property'),
+                'key': 'dashboard_import_property',
                 'command': self.main_window.import_property,
                 'style': 'Secondary.TButton'
             }
         ]
+        texts = translate_many(*(action['key'] for action in actions if action['key']))
         
         for i, action in enumerate(actions):
             btn = ttk.Button(
                 actions_container,
-                text=action['text'],
+                text=texts[action['key']] if action['key'] else action['text'],
                 command=action['command'],
                 style=action['style'],
                 width=20
             )
+            if action['key']:
+                self._translated(action['key'], btn)
             btn.grid(row=0, column=i, padx=5, pady=5, sticky='ew')
             actions_container.grid_columnconfigure(i, weight=1)
     
@@ -275,7 +487,8 @@ class Dashboard:
         """
         Create recent properties section
         """
-        recent_frame = ttk.LabelFrame(self.scrollable_frame, text="Recent Properties", padding=15)
+        recent_frame = self._translated('dashboard_recent_properties', ttk.LabelFrame(
+            self.scrollable_frame, text=translate('dashboard_recent_properties'), padding=15))
         recent_frame.pack(fill=tk.X, padx=20, pady=(0, 20))
         
         # Recent properties container
@@ -287,19 +500,46 @@ class Dashboard:
     
     def load_recent_properties(self):
         """
-        Load and display recent properties
+        Load and display recent properties, reusing pooled cards
         """
-        # Clear existing content
-        for widget in self.recent_container.winfo_children():
-            widget.destroy()
-        
-        # Get recent properties (last 5)
-        properties = self.property_manager.get_all_property_summaries()[:5]
+        # Get recent properties
+        properties = self._get_summaries()[:self.RECENT_COUNT]
         
         if not properties:
-            # No properties message
+            for card in self._card_pool:
+                card['frame'].pack_forget()
+            self._get_empty_frame().pack(fill=tk.X)
+            return
+        
+        if self._empty_frame is not None:
+            self._empty_frame.pack_forget()
+        
+        # Build the card pool on first use
+        if not self._card_pool:
+            for _ in range(self.RECENT_COUNT):
+                self._card_pool.append(self.create_property_card(self.recent_container))
+        
+        for card, prop in zip(self._card_pool, properties):
+            self._fill_property_card(card, prop)
+            if not card['frame'].winfo_manager():
+                card['frame'].pack(fill=tk.X, pady=5)
+        
+        # Hide unused slots
+        for card in self._card_pool[len(properties):]:
+            card['frame'].pack_forget()
+    
+    def _get_empty_frame(self):
+        """
+        Get the "no properties" placeholder, creating it on first use
+        
+        Returns:
+            Placeholder frame
+        """
+        if self._empty_frame is None:
+            self._empty_frame = ttk.Frame(self.recent_container)
+            
             no_props_label = ttk.Label(
-                self.recent_container,
+                self._empty_frame,
                 text="No properties yet. Create your first property to get started!",
                 font=('Segoe UI', 12),
                 foreground='gray'
@@ -307,29 +547,26 @@ class Dashboard:
             no_props_label.pack(pady=20)
             
             create_btn = ttk.Button(
-                self.recent_container,
+                self._empty_frame,
                 text="Create First Property",
                 command=self.main_window.new_property,
                 style='Primary.TButton'
             )
             create_btn.pack()
-        else:
-            # Properties list
-            for i, prop in enumerate(properties):
-                self.create_property_card(self.recent_container, prop, i)
+        return self._empty_frame
     
-    def create_property_card(self, parent, property_data: Dict[str, Any], index: int):
+    def create_property_card(self, parent) -> Dict[str, Any]:
         """
-        Create property card for recent properties
+        Create an empty property card for the recent properties pool
         
         Args:
             parent: Parent widget
-            property_data: Property data
-            index: Card index
+            
+        Returns:
+            Dictionary of the card widgets, filled in by _fill_property_card()
         """
         # Card frame
         card_frame = ttk.Frame(parent, style='Card.TFrame')
-        card_frame.pack(fill=tk.X, pady=5)
         
         # Card content
         content_frame = ttk.Frame(card_frame)
@@ -342,40 +579,20 @@ class Dashboard:
         # Property title
         title_label = ttk.Label(
             info_frame,
-            text=property_data['title'],
             font=('Segoe UI', 12, 'bold')
         )
         title_label.pack(anchor=tk.W)
         
-        # Property details
-        details = []
-        if property_data.get('property_type'):
-            details.append(property_data['property_type'])
-        if property_data.get('city'):
-            details.append(property_data['city'])
-        if property_data.get('price'):
-            details.append(f"€{property_data['price']:,.0f}")
-        
-        if details:
-            details_text = " • ".join(details)
-            details_label = ttk.Label(
-                info_frame,
-                text=details_text,
-                font=('Segoe UI', 10),
-                foreground='gray'
-            )
-            details_label.pack(anchor=tk.W, pady=(2, 0))
+        # Property details, packed only when there are details to show
+        details_label = ttk.Label(
+            info_frame,
+            font=('Segoe UI', 10),
+            foreground='gray'
+        )
         
         # Property stats
-        stats_text = f"{property_data.get('rooms', 0)} rooms"
-        if property_data.get('surface_area'):
-            stats_text += f" • {property_data['surface_area']} m²"
-        if property_data.get('image_count', 0) > 0:
-            stats_text += f" • {property_data['image_count']} photos"
-        
         stats_label = ttk.Label(
             info_frame,
-            text=stats_text,
             font=('Segoe UI', 9),
             foreground='gray'
         )
@@ -386,18 +603,10 @@ class Dashboard:
         actions_frame.pack(side=tk.RIGHT, padx=(10, 0))
         
         # Status badge
-        status_color = {
-            'draft': '#FFC107',
-            'published': '#4CAF50',
-            'archived': '#9E9E9E'
-        }.get(property_data.get('status', 'draft'), '#FFC107')
-        
         status_label = ttk.Label(
             actions_frame,
-            text=property_data.get('status', 'draft').upper(),
             font=('Segoe UI', 8, 'bold'),
-            foreground='white',
-            background=status_color
+            foreground='white'
         )
         status_label.pack(pady=(0, 5))
         
@@ -405,7 +614,6 @@ class Dashboard:
         edit_btn = ttk.Button(
             actions_frame,
             text="Edit",
-            command=lambda p_id=property_data['id']: self.edit_property(p_id),
             width=8
         )
         edit_btn.pack(pady=2)
@@ -413,16 +621,82 @@ class Dashboard:
         generate_btn = ttk.Button(
             actions_frame,
             text="Generate",
-            command=lambda p_id=property_data['id']: self.generate_website(p_id),
             width=8
         )
         generate_btn.pack(pady=2)
+        
+        return {
+            'frame': card_frame,
+            'title_label': title_label,
+            'details_label': details_label,
+            'stats_label': stats_label,
+            'status_label': status_label,
+            'edit_btn': edit_btn,
+            'generate_btn': generate_btn,
+            'bound_id': None
+        }
+    
+    def _fill_property_card(self, card: Dict[str, Any], property_data: Dict[str, Any]):
+        """
+        Show a property in a pooled card
+        
+        Args:
+            card: Card widgets from create_property_card()
+            property_data: Property data
+        """
+        card['title_label'].config(text=property_data['title'])
+        
+        # Property details
+        details = []
+        if property_data.get('property_type'):
+            details.append(property_data['property_type'])
+        if property_data.get('city'):
+            details.append(property_data['city'])
+        if property_data.get('price'):
+            details.append(f"€{property_data['price']:,.0f}")
+        
+        details_label = card['details_label']
+        if details:
+            details_label.config(text=" • ".join(details))
+            if not details_label.winfo_manager():
+                details_label.pack(anchor=tk.W, pady=(2, 0), after=card['title_label'])
+        elif details_label.winfo_manager():
+            details_label.pack_forget()
+        
+        # Property stats
+        stats_text = f"{property_data.get('rooms', 0)} rooms"
+        if property_data.get('surface_area'):
+            stats_text += f" • {property_data['surface_area']} m²"
+        if property_data.get('image_count', 0) > 0:
+            stats_text += f" • {property_data['image_count']} photos"
+        card['stats_label'].config(text=stats_text)
+        
+        # Status badge
+        status = property_data.get('status', 'draft')
+        status_color = {
+            'draft': '#FFC107',
+            'published': '#4CAF50',
+            'archived': '#9E9E9E'
+        }.get(status, '#FFC107')
+        card['status_label'].config(text=status.upper(), background=status_color)
+        
+        # Action buttons, rebound only when the card shows another property
+        property_id = property_data['id']
+        if card['bound_id'] != property_id:
+            card['edit_btn'].config(command=partial(self.edit_property, property_id))
+            card['generate_btn'].config(command=partial(self.generate_website, property_id))
+            card['bound_id'] = property_id
     
     def create_tips_section(self):
         """
         Create tips and help section
         """
-        tips_frame = ttk.LabelFrame(self.scrollable_frame, text="Tips & Resources", padding=15)
+        # Built from after_idle; the dashboard may have been replaced meanwhile
+        if not self.scrollable_frame.winfo_exists():
+            return
+        
+        tips_frame = self._translated('dashboard_tips', ttk.LabelFrame(
+            self.scrollable_frame, text=translate('dashboard_tips'), padding=15))
         tips_frame.pack(fill=tk.X, padx=20, pady=(0, 20))
         
         # Tips container
@@ -518,48 +792,31 @@ class Dashboard:
         """
         Refresh dashboard data
         """
-        self.create_stat_cards()
-        self.load_recent_properties()
+        with self._suppress_layout():
+            self.update_stat_cards()
+            self.load_recent_properties()
     
     def refresh_language(self):
         """
         Refresh dashboard with new language.
         """
-        # Update welcome text
-        if hasattr(self, 'welcome_label'):
-            self.welcome_label.config(text=translate('dashboard_welcome'))
-        
-        if hasattr(self, 'subtitle_label'):
-            self.subtitle_label.config(text=translate('dashboard_subtitle'))
-        
-        # Update section titles
-        if hasattr(self, 'stats_frame'):
-            self.stats_frame.config(text=translate('dashboard_stats'))
-        
-        if hasattr(self, 'actions_frame'):
-            self.actions_frame.config(text=translate('dashboard_quick_actions'))
-        
-        if hasattr(self, 'recent_frame'):
-            self.recent_frame.config(text=translate('dashboard_recent_properties'))
-        
-        if hasattr(self, 'tips_frame'):
-            self.tips_frame.config(text=translate('dashboard_tips'))
+        # Nothing to relabel if the language did not actually change
+        language = get_language()
+        if language == self._language:
+            return
+        self._language = language
         
-        # Update button texts
-        if hasattr(self, 'create_btn'):
-            self.create_btn.config(text=translate('dashboard_create_property'))
+        # Update all registered widgets in one pass
+        texts = translate_many(*(key for key, _ in self._translated_widgets))
+        for key, widget in self._translated_widgets:
+            widget.config(text=texts[key])
         
-        if hasattr(self, 'import_btn'):
-            self.import_btn.config(text=translate('dashboard_import_data'))
-        
-        if hasattr(self, 'generate_btn'):
-            self.generate_btn.config(text=translate('dashboard_generate_website'))
-        
-        # Refresh statistics with new labels
-        self.create_stat_cards()
-        
-        # Refresh recent properties
-        self.load_recent_properties()
+        with self._suppress_layout():
+            # Refresh statistics in place
+            self.update_stat_cards()
+            
+            # Refresh recent properties
+            self.load_recent_properties()
     
     # Action handlers
     def edit_property(self, property_id: int):
@@ -580,78 +837,68 @@ class Dashboard:
         """
         messagebox.showinfo("Generate Website", f"Generate website for property {property_id} - Coming soon...")
     
-    def show_getting_started(self):
+    def _load_help_text(self, name: str) -> str:
         """
-        Show getting started guide
+        Load a help text from the help directory, caching it after first use
+        
+        Args:
+            name: Help file name without extension
+            
+        Returns:
+            Help text
         """
-        help_text = """
-Getting Started with HomeShow Desktop
-
-1. Create Your First Property
-   • Click "New Property" to start the wizard
-   • Fill in basic information (title, type, price)
-   • Add high-quality photos and media
-
-2. Organize Your Content
-   • Add detailed descriptions
-   • Include floor plans if available
-   • Set property features and amenities
-
-3. Generate Your Website
-   • Choose from professional templates
-   • Customize colors and layout
-   • Generate and preview your site
-
-4. Publish and Share
-   • Export your website files
-   • Upload to your hosting provider
-   • Share with clients and prospects
-
-Tips for Success:
-• Use high-resolution images (1920x1080 or higher)
-• Include virtual tours or 360° photos when possible
-• Write compelling property descriptions
-• Keep information accurate and up-to-date
+        if name not in self._help_cache:
+            help_file = self.HELP_DIR / f"{name}.txt"
+            self._help_cache[name] = help_file.read_text(encoding='utf-8')
+        return self._help_cache[name]
+    
+    def _show_help(self, title: str, text: str):
         """
+        Show a help text in a non-modal window, reused between calls
         
-        messagebox.showinfo("Getting Started Guide", help_text)
+        Args:
+            title: Window title
+            text: Help text
+        """
+        if self._help_window is None or not self._help_window.winfo_exists():
+            self._help_window = tk.Toplevel(self.main_window.root)
+            self._help_window.geometry("520x560")
+            self._help_window.transient(self.main_window.root)
+            # Closing only hides the window so it can be shown again
+            self._help_window.protocol("WM_DELETE_WINDOW", self._help_window.withdraw)
+            
+            self._help_text = scrolledtext.ScrolledText(
+                self._help_window,
+                wrap=tk.WORD,
+                font=('Segoe UI', 10),
+                padx=15,
+                pady=10
+            )
+            self._help_text.pack(fill=tk.BOTH, expand=True)
+            
+            ttk.Button(
+                self._help_window,
+                text="Close",
+                command=self._help_window.withdraw
+            ).pack(pady=10)
+        
+        self._help_window.title(title)
+        self._help_text.config(state=tk.NORMAL)
+        self._help_text.delete('1.0', tk.END)
+        self._help_text.insert('1.0', text)
+        self._help_text.config(state=tk.DISABLED)
+        
+        self._help_window.deiconify()
+        self._help_window.lift()
+    
+    def show_getting_started(self):
+        """
+        Show getting started guide
+        """
+        self._show_help("Getting Started Guide", self._load_help_text('getting_started'))
     
     def show_photo_guide(self):
         """
         Show photo guide
         """
-        help_text = """
-Property Photography Best Practices
-
-📸 Camera Settings:
-• Use wide-angle lens (14-24mm)
-• Shoot in RAW format for better editing
-• Use tripod for stability
-• HDR for high contrast scenes
-
-💡 Lighting Tips:
-• Natural light is best - shoot during golden hour
-• Turn on all lights in the room
-• Avoid harsh shadows
-• Use flash sparingly
-
-🏠 Composition:
-• Shoot from corners to show room size
-• Include ceiling in shots when possible
-• Keep vertical lines straight
-• Declutter and stage rooms
-
-📱 Mobile Photography:
-• Clean your lens before shooting
-• Use grid lines for composition
-• Take multiple shots of each room
-• Edit for brightness and contrast
-
-✨ Post-Processing:
-• Adjust exposure and highlights
-• Enhance colors naturally
-• Straighten horizons
-• Remove distracting elements
-        """
-        
-        messagebox.showinfo("Photography Guide", help_text)
\ No newline at end of file
+        self._show_help("Photography Guide", self._load_help_text('photo_guide'))
\ No newline at end of file
@@ -10,70 +10,203 @@ Version: 1.0.0
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable
+
+# Application paths, resolved once
+_APP_ROOT = Path(__file__).resolve().parent.parent
 
 # Import application modules
-sys.path.append(str(Path(__file__).parent.parent))
+if str(_APP_ROOT) not in sys.path:
+    sys.path.append(str(_APP_ROOT))
 
 from core.database import DatabaseManager
 from core.property_manager import PropertyManager
-from gui.dashboard import Dashboard
-from gui.property_wizard import PropertyWizard
-from gui.components.property_manager_interface import PropertyManagerInterface
-from gui.preferences_dialog import PreferencesDialog
-from gui.components.projects_interface import ProjectsInterface
-from gui.components.templates_interface import TemplatesInterface
-from core.localization import get_localization_manager, translate, set_language
+from core.localization import get_localization_manager, translate, translate_many, set_language
+
+_ICON_PATH = _APP_ROOT / "resources" / "icons" / "app_icon.ico"
+_HOME = str(Path.home())
+
+# Translation keys of the notebook tabs, in tab order
+_TAB_KEYS = ('tab_dashboard', 'tab_properties', 'tab_projects', 'tab_templates')
+
+# Menu bar layout: (cascade key, entries), where each entry is
+# (label key, handler method name, handler arguments, accelerator) or None for a separator
+_MENU_SPEC = (
+    ('menu_file', (
+        ('menu_new', 'new_property', (), "Ctrl+N"),
+        None,
+        ('menu_import', 'import_property', (), None),
+        ('menu_export', 'export_property', (), None),
+        None,
+        ('menu_exit', 'on_closing', (), "Ctrl+Q"),
+    )),
+    ('menu_edit', (
+        ('menu_preferences', 'show_preferences', (), None),
+    )),
+    ('menu_tools', (
+        ('menu_generate_website', 'generate_website', (), None),
+        ('menu_ai_staging', 'ai_staging', (), None),
+        None,
+        ('menu_backup_database', 'backup_database', (), None),
+    )),
+    ('menu_language', (
+        ('menu_english', 'change_language', ('en',), None),
+        ('menu_french', 'change_language', ('fr',), None),
+    )),
+    ('menu_help', (
+        ('menu_user_guide', 'show_help', (), None),
+        ('menu_about', 'show_about', (), None),
+    )),
+)
+
+# Translation keys used by the menu bar
+_MENU_KEYS = tuple(
+    key
+    for cascade_key, entries in _MENU_SPEC
+    for key in (cascade_key, *(entry[0] for entry in entries if entry))
+)
 
 class MainWindow:
     """
     Main application window with tabbed interface
     """
     
+    # Initial window size
+    WINDOW_WIDTH = 1200
+    WINDOW_HEIGHT = 800
+    
+    # Minimum delay between forced status bar redraws, in milliseconds
+    STATUS_FLUSH_DELAY = 50
+    
+    # ttk style options as (style name, options), applied by setup_styles()
+    _STYLES = (
+        # Notebook (tabs)
+        ('TNotebook', {'background': '#f0f0f0'}),
+        ('TNotebook.Tab', {'padding': [20, 10]}),
+        # Buttons
+        ('Primary.TButton', {'font': ('Segoe UI', 10, 'bold')}),
+        ('Secondary.TButton', {'font': ('Segoe UI', 9)}),
+        ('Card.TButton', {'padding': 2}),
+        # Frames
+        ('Card.TFrame', {'relief': 'solid', 'borderwidth': 1}),
+        ('Sidebar.TFrame', {'background': '#e8e8e8'}),
+        # Status bar notices
+        ('Toast.TLabel', {'background': '#4CAF50', 'foreground': 'white', 'padding': (8, 2)}),
+    ) + tuple(
+        # Property status badges
+        (f'Status.{name}.TLabel', {'background': color, 'foreground': 'white',
+                                   'font': ('Segoe UI', 8, 'bold'), 'padding': (8, 2)})
+        for name, color in (('Draft', '#f39c12'), ('Published', '#27ae60'), ('Archived', '#95a5a6'))
+    )
+    
     def __init__(self):
         """
         Initialize main window
         """
         self.root = tk.Tk()
         
+        # Keep the window hidden while it is laid out, so it is drawn once
+        self.root.withdraw()
+        
+        self._styles_configured = False
+        
         # Initialize localization
         self.localization = get_localization_manager()
         
         self.setup_window()
         self.setup_styles()
         
-        # Initialize core components
-        self.db_manager = DatabaseManager()
-        self.property_manager = PropertyManager(self.db_manager)
+        # Core components, created on first use (see db_manager/property_manager)
+        self._db_manager = None
+        self._property_manager = None
         
         # GUI components
+        self.notebook = None
         self.dashboard = None
         self.property_wizard = None
+        self.media_handler = None
+        self.property_manager_interface = None
+        self.projects_interface = None
+        self.templates_interface = None
+        
+        # Tabs whose interface must be rebuilt before it is shown again
+        self._dirty_tabs = set()
+        
+        # Index of the tab shown last
+        self._current_tab = None
+        
+        # Latest status message, whether showing it is already scheduled, and the pending toast reset
+        self._status_message = "Ready"
+        self._status_pending = False
+        self._toast_after_id = None
+        
+        # Folder the last file dialog ended in
+        self._last_io_dir = _HOME
+        
+        # Background worker for import/export/backup file I/O
+        self._io_executor = ThreadPoolExecutor(max_workers=1)
+        self._closed = False
         
         # Setup interface
         self.create_menu()
         self.create_main_interface()
         
-        # Initialize dashboard
-        self.show_dashboard()
+        # Tab show handlers, in tab order
+        self._tab_handlers = (self.show_dashboard, self.show_properties,
+                              self.show_projects, self.show_templates)
+        
+        # Show the fully built window, centered on screen
+        self.center_window()
+        self.root.deiconify()
+        
+        # Build the dashboard once the window has been drawn
+        self.root.after_idle(self.show_dashboard)
+    
+    @property
+    def db_manager(self) -> DatabaseManager:
+        """
+        Database manager, created on first use
+        """
+        if self._db_manager is None:
+            self._db_manager = DatabaseManager()
+        return self._db_manager
+    
+    @property
+    def property_manager(self) -> PropertyManager:
+        """
+        Property manager, created on first use
+        """
+        if self._property_manager is None:
+            self._property_manager = PropertyManager(self.db_manager)
+        return self._property_manager
     
     def setup_window(self):
         """
         Configure main window properties
         """
         self.root.title("HomeShow Desktop - Real Estate Website Generator")
-        self.root.geometry("1200x800")
+        self.root.geometry(f"{self.WINDOW_WIDTH}x{self.WINDOW_HEIGHT}")
         self.root.minsize(1000, 600)
         
-        # Center window on screen
-        self.center_window()
+        # Set window icon (if available)
+        try:
+            if _ICON_PATH.exists():
+                self.root.iconbitmap(str(_ICON_PATH))
+        except Exception:
+            pass
+        
+        # Handle window closing
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
     
     def update_window_title(self):
         """
         Update the window title with localized text.
         """
-        title = f"{translate('app_title')} - {translate('app_subtitle')}"
+        t = translate_many('app_title', 'app_subtitle')
+        title = f"{t['app_title']} - {t['app_subtitle']}"
         self.root.title(title)
     
     def change_language(self, language_code):
@@ -93,45 +226,42 @@ class MainWindow:
         # Update window title
         self.update_window_title()
         
-        # Recreate menu
-        self.create_menu()
+        # Relabel menu
+        self.relabel_menu()
         
         # Refresh notebook tabs
         self.refresh_tabs()
         
+        # Rebuild the tab interfaces with the new language when next shown
+        for index, interface in ((1, self.property_manager_interface),
+                                 (2, self.projects_interface),
+                                 (3, self.templates_interface)):
+            if interface is not None:
+                self._dirty_tabs.add(index)
+        if self.notebook.index('current') in self._dirty_tabs:
+            self.on_tab_changed(None)
+        
         # Refresh dashboard with new language
-        if hasattr(self, 'dashboard') and self.dashboard:
+        if self.dashboard is not None:
             self.dashboard.refresh_language()
     
     def refresh_tabs(self):
         """
         Refresh notebook tab labels.
         """
-        if hasattr(self, 'notebook'):
+        if self.notebook is not None:
             # Update tab texts
-            self.notebook.tab(0, text=translate('tab_dashboard'))
-            self.notebook.tab(1, text=translate('tab_properties'))
-            self.notebook.tab(2, text=translate('tab_projects'))
-            self.notebook.tab(3, text=translate('tab_templates'))
-        
-        # Set window icon (if available)
-        try:
-            icon_path = Path(__file__).parent.parent / "resources" / "icons" / "app_icon.ico"
-            if icon_path.exists():
-                self.root.iconbitmap(str(icon_path))
-        except Exception:
-            pass
-        
-        # Handle window closing
-        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+            t = translate_many(*_TAB_KEYS)
+            for index, key in enumerate(_TAB_KEYS):
+                self.notebook.tab(index, text=t[key])
     
     def center_window(self):
         """
         Center the window on the screen
         """
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
+        # The window may still be withdrawn, so use its configured size
+        width = self.WINDOW_WIDTH
+        height = self.WINDOW_HEIGHT
         x = (self.root.winfo_screenwidth() // 2) - (width // 2)
         y = (self.root.winfo_screenheight() // 2) - (height // 2)
         self.root.geometry(f"{width}x{height}+{x}+{y}")
@@ -140,66 +270,67 @@ class MainWindow:
         """
         Configure ttk styles for modern appearance
         """
-        style = ttk.Style()
-        
-        # Configure notebook (tabs) style
-        style.configure('TNotebook', background='#f0f0f0')
-        style.configure('TNotebook.Tab', padding=[20, 10])
+        # Styles are global to the Tk interpreter; configure them only once
+        if self._styles_configured:
+            return
         
-        # Configure button styles
-        style.configure('Primary.TButton', font=('Segoe UI', 10, 'bold'))
-        style.configure('Secondary.TButton', font=('Segoe UI', 9))
-        
-        # Configure frame styles
-        style.configure('Card.TFrame', relief='solid', borderwidth=1)
-        style.configure('Sidebar.TFrame', background='#e8e8e8')
+        style = ttk.Style()
+        for name, options in self._STYLES:
+            style.configure(name, **options)
+        self._styles_configured = True
     
     def create_menu(self):
         """
-        Create application menu bar
+        Create application menu bar from _MENU_SPEC, relabelled in place by relabel_menu()
         """
+        # Resolve all menu labels in one lookup
+        t = translate_many(*_MENU_KEYS)
+        
+        # Labelled entries as (menu, entry index, translation key)
+        self._menu_labels = []
+        
         menubar = tk.Menu(self.root)
         self.root.config(menu=menubar)
         
-        # File menu
-        file_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label=translate('menu_file'), menu=file_menu)
-        file_menu.add_command(label=translate('menu_new'), command=self.new_property, accelerator="Ctrl+N")
-        file_menu.add_separator()
-        file_menu.add_command(label=translate('menu_import'), command=self.import_property)
-        file_menu.add_command(label=translate('menu_export'), command=self.export_property)
-        file_menu.add_separator()
-        file_menu.add_command(label=translate('menu_exit'), command=self.on_closing, accelerator="Ctrl+Q")
-        
-        # Edit menu
-        edit_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label=translate('menu_edit'), menu=edit_menu)
-        edit_menu.add_command(label=translate('menu_preferences'), command=self.show_preferences)
-        
-        # Tools menu
-        tools_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label=translate('menu_tools'), menu=tools_menu)
-        tools_menu.add_command(label=translate('menu_generate_website'), command=self.generate_website)
-        tools_menu.add_command(label=translate('menu_ai_staging'), command=self.ai_staging)
-        tools_menu.add_separator()
-        tools_menu.add_command(label=translate('menu_backup_database'), command=self.backup_database)
-        
-        # Language menu
-        language_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label=translate('menu_language'), menu=language_menu)
-        language_menu.add_command(label=translate('menu_english'), command=lambda: self.change_language('en'))
-        language_menu.add_command(label=translate('menu_french'), command=lambda: self.change_language('fr'))
-        
-        # Help menu
-        help_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label=translate('menu_help'), menu=help_menu)
-        help_menu.add_command(label=translate('menu_user_guide'), command=self.show_help)
-        help_menu.add_command(label=translate('menu_about'), command=self.show_about)
+        for cascade_key, entries in _MENU_SPEC:
+            menu = tk.Menu(menubar, tearoff=0)
+            self._add_menu_item(menubar, 'cascade', cascade_key, t, menu=menu)
+            
+            for entry in entries:
+                if entry is None:
+                    menu.add_separator()
+                    continue
+                key, handler, args, accelerator = entry
+                options = {'accelerator': accelerator} if accelerator else {}
+                self._add_menu_item(menu, 'command', key, t,
+                                    command=partial(getattr(self, handler), *args), **options)
         
         # Keyboard shortcuts
         self.root.bind('<Control-n>', lambda e: self.new_property())
         self.root.bind('<Control-q>', lambda e: self.on_closing())
     
+    def _add_menu_item(self, menu: tk.Menu, item_type: str, key: str, texts: Dict[str, str], **options):
+        """
+        Add a translated menu entry and remember it for relabelling
+        
+        Args:
+            menu: Menu to add the entry to
+            item_type: Entry type ('command' or 'cascade')
+            key: Translation key of the entry label
+            texts: Resolved menu labels
+            **options: Extra entry options
+        """
+        menu.add(item_type, label=texts[key], **options)
+        self._menu_labels.append((menu, menu.index(tk.END), key))
+    
+    def relabel_menu(self):
+        """
+        Update the menu labels to the current language
+        """
+        t = translate_many(*_MENU_KEYS)
+        for menu, index, key in self._menu_labels:
+            menu.entryconfigure(index, label=t[key])
+    
     def create_main_interface(self):
         """
         Create the main interface with tabbed navigation
@@ -208,25 +339,32 @@ class MainWindow:
         main_frame = ttk.Frame(self.root)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
+        # Tab labels
+        t = translate_many(*_TAB_KEYS)
+        
         # Create notebook for tabs
         self.notebook = ttk.Notebook(main_frame)
         self.notebook.pack(fill=tk.BOTH, expand=True)
         
         # Dashboard tab
         self.dashboard_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.dashboard_frame, text=translate('tab_dashboard'))
+        self.notebook.add(self.dashboard_frame, text=t['tab_dashboard'])
+        
+        # Placeholder until the dashboard is built
+        self._dashboard_placeholder = ttk.Label(self.dashboard_frame, text="Loading…", foreground='gray')
+        self._dashboard_placeholder.pack(expand=True)
         
         # Properties tab
         self.properties_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.properties_frame, text=translate('tab_properties'))
+        self.notebook.add(self.properties_frame, text=t['tab_properties'])
         
         # Projects tab
         self.projects_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.projects_frame, text=translate('tab_projects'))
+        self.notebook.add(self.projects_frame, text=t['tab_projects'])
         
         # Templates tab
         self.templates_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.templates_frame, text=translate('tab_templates'))
+        self.notebook.add(self.templates_frame, text=t['tab_templates'])
         
         # Bind tab change event
         self.notebook.bind('<<NotebookTabChanged>>', self.on_tab_changed)
@@ -255,11 +393,32 @@ class MainWindow:
         version_label = ttk.Label(self.status_bar, text="v1.0.0")
         version_label.pack(side=tk.RIGHT)
     
+    def _tab_needs_build(self, index: int, interface, frame) -> bool:
+        """
+        Check whether a tab interface must be built, clearing it if it is stale
+        
+        Args:
+            index: Tab index
+            interface: Current interface of the tab, or None if never built
+            frame: Tab frame holding the interface widgets
+            
+        Returns:
+            True if the interface must be (re)built
+        """
+        if index in self._dirty_tabs:
+            self._dirty_tabs.discard(index)
+            for widget in frame.winfo_children():
+                widget.destroy()
+            return True
+        return interface is None
+    
     def show_dashboard(self):
         """
         Initialize and show dashboard
         """
         if self.dashboard is None:
+            from gui.dashboard import Dashboard
+            self._dashboard_placeholder.destroy()
             self.dashboard = Dashboard(self.dashboard_frame, self.property_manager, self)
         self.dashboard.refresh()
     
@@ -267,11 +426,12 @@ class MainWindow:
         """
         Show properties management interface
         """
-        # Clear existing content
-        for widget in self.properties_frame.winfo_children():
-            widget.destroy()
+        # Build the interface once; it keeps itself up to date afterwards
+        if not self._tab_needs_build(1, self.property_manager_interface, self.properties_frame):
+            return
         
         # Create advanced properties interface
+        from gui.components.property_manager_interface import PropertyManagerInterface
         self.property_manager_interface = PropertyManagerInterface(
             self.properties_frame, 
             self.property_manager, 
@@ -289,7 +449,7 @@ class MainWindow:
         """
         Refresh the properties interface if it exists
         """
-        if hasattr(self, 'property_manager_interface'):
+        if self.property_manager_interface is not None:
             self.property_manager_interface.refresh_properties_list()
     
 
@@ -299,6 +459,7 @@ class MainWindow:
         Open property creation wizard
         """
         if self.property_wizard is None or not self.property_wizard.window.winfo_exists():
+            from gui.property_wizard import PropertyWizard
             self.property_wizard = PropertyWizard(self.root, self.property_manager, self.on_property_saved)
         else:
             self.property_wizard.window.lift()
@@ -313,7 +474,7 @@ class MainWindow:
         self.set_status(f"Property saved successfully (ID: {property_id})")
         
         # Refresh dashboard and properties interface
-        if self.dashboard:
+        if self.dashboard is not None:
             self.dashboard.refresh()
         
         # Refresh properties interface if it exists
@@ -328,19 +489,21 @@ class MainWindow:
         """
         # Refresh interface to apply new settings
         self.refresh_interface()
-        self.set_status("Settings updated successfully")
+        self._show_toast("Settings updated successfully")
     
     def open_property_wizard(self):
         """
         Open the property creation wizard
         """
         try:
-            from core.media_handler import MediaHandler
-            media_handler = MediaHandler()
+            if self.media_handler is None:
+                from core.media_handler import MediaHandler
+                self.media_handler = MediaHandler()
+            from gui.property_wizard import PropertyWizard
             wizard = PropertyWizard(
                 self.root,
                 self.property_manager,
-                media_handler,
+                self.media_handler,
                 on_complete=self.on_property_saved
             )
         except Exception as e:
@@ -353,38 +516,37 @@ class MainWindow:
         Args:
             event: Tab change event
         """
-        selected_index = self.notebook.index(self.notebook.select())
+        selected_index = self.notebook.index('current')
         
-        if selected_index == 0:  # Dashboard
-            self.show_dashboard()
-        elif selected_index == 1:  # Properties
-            self.show_properties()
-        elif selected_index == 2:  # Projects
-            self.show_projects()
-        elif selected_index == 3:  # Templates
-            self.show_templates()
+        # Unpack the templates interface while another tab is shown
+        if self._current_tab == 3 and selected_index != 3 and self.templates_interface is not None:
+            self.templates_interface.hide()
+        self._current_tab = selected_index
+        
+        self._tab_handlers[selected_index]()
     
     def show_projects(self):
         """
         Show projects interface
         """
-        # Clear existing content
-        for widget in self.projects_frame.winfo_children():
-            widget.destroy()
+        # Build the interface once and keep it between tab visits
+        if not self._tab_needs_build(2, self.projects_interface, self.projects_frame):
+            return
         
         # Create projects interface
+        from gui.components.projects_interface import ProjectsInterface
         self.projects_interface = ProjectsInterface(self.projects_frame)
     
     def show_templates(self):
         """
         Show templates interface
         """
-        # Clear existing content
-        for widget in self.templates_frame.winfo_children():
-            widget.destroy()
-        
-        # Create templates interface
-        self.templates_interface = TemplatesInterface(self.templates_frame)
+        # Build the templates interface once, then just show it again
+        if self._tab_needs_build(3, self.templates_interface, self.templates_frame):
+            from gui.components.templates_interface import TemplatesInterface
+            self.templates_interface = TemplatesInterface(self.templates_frame)
+        else:
+            self.templates_interface.show()
     
     def set_status(self, message: str, show_progress: bool = False):
         """
@@ -394,7 +556,8 @@ class MainWindow:
             message: Status message
             show_progress: Whether to show progress bar
         """
-        self.status_label.config(text=message)
+        self._cancel_toast()
+        self._status_message = message
         
         if show_progress:
             self.progress_bar.pack(side=tk.LEFT, padx=(10, 0))
@@ -403,48 +566,127 @@ class MainWindow:
             self.progress_bar.stop()
             self.progress_bar.pack_forget()
         
-        self.root.update_idletasks()
+        # Relabel at most once per STATUS_FLUSH_DELAY, however often the status changes
+        if not self._status_pending:
+            self._status_pending = True
+            self.root.after(self.STATUS_FLUSH_DELAY, self._flush_status)
+    
+    def _show_toast(self, message: str, duration: int = 3000):
+        """
+        Show a highlighted, non-blocking notice in the status bar
+        
+        Args:
+            message: Notice text
+            duration: Time before the status bar resets, in milliseconds
+        """
+        self.set_status(message)
+        self.status_label.config(style='Toast.TLabel')
+        self._toast_after_id = self.root.after(duration, self._reset_status)
+    
+    def _cancel_toast(self):
+        """
+        Drop the pending reset and highlight of a toast notice
+        """
+        if self._toast_after_id is not None:
+            self.root.after_cancel(self._toast_after_id)
+            self._toast_after_id = None
+            self.status_label.config(style='TLabel')
+    
+    def _reset_status(self):
+        """
+        Return the status bar to its idle message once a toast expires
+        """
+        self._toast_after_id = None
+        self.status_label.config(style='TLabel')
+        self.set_status("Ready")
+    
+    def _flush_status(self):
+        """
+        Show the latest status message after a burst of status updates
+        """
+        self._status_pending = False
+        self.status_label.config(text=self._status_message)
     
     # Menu command implementations
+    def _run_in_background(self, func: Callable, on_done: Callable, *args,
+                           on_error: Optional[Callable] = None):
+        """
+        Run a blocking call on the worker thread and handle its outcome on the Tk thread
+        
+        Args:
+            func: Blocking function to run
+            on_done: Callback receiving the result
+            *args: Arguments for func
+            on_error: Callback receiving the exception (defaults to an error dialog)
+        """
+        future = self._io_executor.submit(func, *args)
+        
+        def deliver():
+            if self._closed:
+                return
+            try:
+                result = future.result()
+            except Exception as e:
+                if on_error:
+                    on_error(e)
+                else:
+                    messagebox.showerror("Error", str(e))
+                return
+            on_done(result)
+        
+        def schedule(_future):
+            try:
+                self.root.after(0, deliver)
+            except (RuntimeError, tk.TclError):
+                # Tk is already gone
+                pass
+        
+        future.add_done_callback(schedule)
+    
     def import_property(self):
         """
         Import property from file
         """
         folder_path = filedialog.askdirectory(
             title="Select Property Export Folder",
-            initialdir=str(Path.home())
+            initialdir=self._last_io_dir
         )
         
-        if folder_path:
-            self.set_status("Importing property...", True)
-            
-            try:
-                property_id = self.property_manager.import_property_data(folder_path)
-                
-                if property_id:
-                    self.set_status(f"Property imported successfully (ID: {property_id})")
-                    self.refresh_properties_list()
-                    if self.dashboard:
-                        self.dashboard.refresh()
-                else:
-                    self.set_status("Failed to import property")
-                    messagebox.showerror("Import Error", "Failed to import property data.")
-                    
-            except Exception as e:
-                self.set_status("Import failed")
-                messagebox.showerror("Import Error", f"Error importing property: {e}")
+        if not folder_path:
+            return
+        self._last_io_dir = str(Path(folder_path).parent)
+        
+        self.set_status("Importing property...", True)
+        
+        def on_imported(property_id):
+            if property_id:
+                self.set_status(f"Property imported successfully (ID: {property_id})")
+                self.refresh_properties_interface()
+                if self.dashboard is not None:
+                    self.dashboard.refresh()
+            else:
+                self.set_status("Failed to import property")
+                messagebox.showerror("Import Error", "Failed to import property data.")
+        
+        def on_error(e):
+            self.set_status("Import failed")
+            messagebox.showerror("Import Error", f"Error importing property: {e}")
+        
+        self._run_in_background(self.property_manager.import_property_data, on_imported,
+                                folder_path, on_error=on_error)
     
     def export_property(self):
         """
         Export selected property
         """
-        messagebox.showinfo("Export", "Please select a property from the Properties tab to export.")
+        self._show_toast("Please select a property from the Properties tab to export.")
     
     def show_preferences(self):
         """
         Show preferences dialog
         """
         try:
+            from gui.preferences_dialog import PreferencesDialog
             PreferencesDialog(self.root, on_settings_changed=self.on_settings_changed)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open preferences: {e}")
@@ -453,13 +695,13 @@ class MainWindow:
         """
         Generate website for selected property
         """
-        messagebox.showinfo("Generate Website", "Website generation coming soon...")
+        self._show_toast("Website generation coming soon...")
     
     def ai_staging(self):
         """
         Open AI staging interface
         """
-        messagebox.showinfo("AI Staging", "AI Virtual Staging interface coming soon...")
+        self._show_toast("AI Virtual Staging interface coming soon...")
     
     def backup_database(self):
         """
@@ -467,18 +709,25 @@ class MainWindow:
         """
         backup_path = filedialog.asksaveasfilename(
             title="Save Database Backup",
+            initialdir=self._last_io_dir,
             defaultextension=".db",
             filetypes=[("Database files", "*.db"), ("All files", "*.*")]
         )
         
-        if backup_path:
-            try:
-                import shutil
-                db_path = Path(__file__).parent.parent / "data" / "database.db"
-                shutil.copy2(db_path, backup_path)
-                messagebox.showinfo("Backup", "Database backup created successfully.")
-            except Exception as e:
-                messagebox.showerror("Backup Error", f"Failed to create backup: {e}")
+        if not backup_path:
+            return
+        self._last_io_dir = str(Path(backup_path).parent)
+        
+        self.set_status("Creating database backup...", True)
+        
+        def on_done(_result):
+            self._show_toast("Database backup created successfully.")
+        
+        def on_error(e):
+            self.set_status("Backup failed")
+            messagebox.showerror("Backup Error", f"Failed to create backup: {e}")
+        
+        self._run_in_background(self.db_manager.backup, on_done, backup_path, on_error=on_error)
     
     def show_help(self):
         """
@@ -509,137 +758,22 @@ Developed with Python and Tkinter
         """
         messagebox.showinfo("About HomeShow Desktop", about_text)
     
-    # Properties list context menu handlers
-    def show_properties_context_menu(self, event):
-        """
-        Show context menu for properties list
-        
-        Args:
-            event: Right-click event
-        """
-        # Select item under cursor
-        item = self.properties_tree.identify_row(event.y)
-        if item:
-            self.properties_tree.selection_set(item)
-            self.properties_context_menu.post(event.x_root, event.y_root)
-    
-    def edit_selected_property(self):
-        """
-        Edit selected property
-        """
-        selection = self.properties_tree.selection()
-        if selection:
-            item = selection[0]
-            property_id = self.properties_tree.item(item)['values'][0]
-            # TODO: Open property editor
-            messagebox.showinfo("Edit", f"Edit property {property_id} - Coming soon...")
-    
-    def duplicate_selected_property(self):
-        """
-        Duplicate selected property
-        """
-        selection = self.properties_tree.selection()
-        if selection:
-            item = selection[0]
-            property_id = self.properties_tree.item(item)['values'][0]
-            
-            try:
-                new_property_id = self.property_manager.duplicate_property(property_id)
-                if new_property_id:
-                    self.set_status(f"Property duplicated (New ID: {new_property_id})")
-                    self.refresh_properties_list()
-                    if self.dashboard:
-                        self.dashboard.refresh()
-                else:
-                    messagebox.showerror("Error", "Failed to duplicate property.")
-            except Exception as e:
-                messagebox.showerror("Error", f"Error duplicating property: {e}")
-    
-    def generate_website_for_selected(self):
-        """
-        Generate website for selected property
-        """
-        selection = self.properties_tree.selection()
-        if selection:
-            item = selection[0]
-            property_id = self.properties_tree.item(item)['values'][0]
-            messagebox.showinfo("Generate", f"Generate website for property {property_id} - Coming soon...")
-    
-    def export_selected_property(self):
-        """
-        Export selected property
-        """
-        selection = self.properties_tree.selection()
-        if selection:
-            item = selection[0]
-            property_id = self.properties_tree.item(item)['values'][0]
-            
-            export_path = filedialog.askdirectory(
-                title="Select Export Directory",
-                initialdir=str(Path.home())
-            )
-            
-            if export_path:
-                self.set_status("Exporting property...", True)
-                
-                try:
-                    success = self.property_manager.export_property_data(
-                        property_id, export_path
-                    )
-                    
-                    if success:
-                        self.set_status("Property exported successfully")
-                        messagebox.showinfo("Export", "Property exported successfully.")
-                    else:
-                        self.set_status("Export failed")
-                        messagebox.showerror("Export Error", "Failed to export property.")
-                        
-                except Exception as e:
-                    self.set_status("Export failed")
-                    messagebox.showerror("Export Error", f"Error exporting property: {e}")
-    
-    def delete_selected_property(self):
-        """
-        Delete selected property
-        """
-        selection = self.properties_tree.selection()
-        if selection:
-            item = selection[0]
-            property_id = self.properties_tree.item(item)['values'][0]
-            property_title = self.properties_tree.item(item)['values'][1]
-            
-            # Confirm deletion
-            result = messagebox.askyesno(
-                "Confirm Deletion",
-                f"Are you sure you want to delete property '{property_title}'?\n\n"
-                "This action cannot be undone and will remove all associated media files."
-            )
-            
-            if result:
-                try:
-                    success = self.property_manager.delete_property_with_media(property_id)
-                    
-                    if success:
-                        self.set_status("Property deleted successfully")
-                        self.refresh_properties_list()
-                        if self.dashboard:
-                            self.dashboard.refresh()
-                    else:
-                        messagebox.showerror("Error", "Failed to delete property.")
-                        
-                except Exception as e:
-                    messagebox.showerror("Error", f"Error deleting property: {e}")
-    
     def on_closing(self):
         """
         Handle application closing
         """
-        # Close database connection
-        if hasattr(self, 'db_manager'):
-            self.db_manager.close()
+        # Stop the background worker; results still in flight are dropped
+        self._closed = True
+        self._io_executor.shutdown(wait=False)
         
-        # Destroy window
-        self.root.destroy()
+        # Close database connection, destroying the window even if that fails
+        try:
+            if self._db_manager is not None:
+                self._db_manager.close()
+        except Exception as e:
+            print(f"Error closing database: {e}")
+        finally:
+            self.root.destroy()
     
     def run(self):
         """
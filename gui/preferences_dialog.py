@@ -7,12 +7,92 @@ Author: AI Assistant
 Version: 1.0.0
 """
 
+import os
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from pathlib import Path
 import json
 from typing import Dict, Any
-from core.localization import translate, get_language, set_language
+from core.localization import translate, translate_many, get_language, set_language
+
+# Application paths, resolved once
+_APP_ROOT = Path(__file__).resolve().parent.parent
+_SETTINGS_FILE = _APP_ROOT / "data" / "settings.json"
+_DEFAULT_DATA_DIR = _APP_ROOT / "data"
+_DEFAULT_BACKUP_DIR = _APP_ROOT / "backups"
+
+# Default application settings, copied when loading
+_DEFAULT_SETTINGS = {
+    "language": "en",
+    "theme": "default",
+    "auto_backup": True,
+    "backup_interval": 24,  # hours
+    "max_backups": 10,
+    "default_currency": "EUR",
+    "image_quality": "high",
+    "auto_resize_images": True,
+    "max_image_size": 1920,
+    "website_template": "modern",
+    "export_format": "json",
+    "show_tips": True,
+    "check_updates": True,
+    "data_directory": str(_DEFAULT_DATA_DIR),
+    "backup_directory": str(_DEFAULT_BACKUP_DIR)
+}
+
+# Translation keys used to build the dialog
+_TEXT_KEYS = (
+    "preferences_title", "preferences_general", "preferences_language",
+    "preferences_select_language", "preferences_currency",
+    "preferences_default_currency", "preferences_other", "preferences_show_tips",
+    "preferences_check_updates", "preferences_media", "preferences_image_quality",
+    "preferences_quality_level", "preferences_auto_resize",
+    "preferences_enable_auto_resize", "preferences_max_size", "preferences_backup",
+    "preferences_auto_backup", "preferences_enable_auto_backup",
+    "preferences_backup_interval", "preferences_hours", "preferences_max_backups",
+    "preferences_backup_directory", "preferences_browse", "preferences_website",
+    "preferences_default_template", "preferences_select_template",
+    "preferences_export_format", "preferences_default_export", "preferences_cancel",
+    "preferences_reset", "preferences_apply", "preferences_ok",
+    "preferences_select_backup_dir"
+)
+
+# Optional fast JSON backend for the settings file
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _loads(data: bytes) -> Any:
+    """
+    Parse JSON from UTF-8 bytes
+    
+    Args:
+        data: Encoded JSON document
+        
+    Returns:
+        Parsed value
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(value: Any) -> bytes:
+    """
+    Serialize a value to indented UTF-8 JSON
+    
+    Args:
+        value: Value to serialize
+        
+    Returns:
+        Encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(value, indent=2, ensure_ascii=False) + "\n").encode('utf-8')
 
 
 class PreferencesDialog:
@@ -31,8 +111,50 @@ class PreferencesDialog:
         self.parent = parent
         self.on_settings_changed = on_settings_changed
         self.settings = self.load_settings()
+        
+        # Snapshot of what is on disk, to skip saving unchanged settings
+        self._saved_settings = dict(self.settings)
+        
+        # Dialog texts, looked up once
+        self._t = translate_many(*_TEXT_KEYS)
+        
         self.create_dialog()
     
+    def create_variables(self):
+        """
+        Create the setting variables, shared by all tabs whether built or not
+        """
+        self.language_var = tk.StringVar(value=self.settings.get("language", get_language()))
+        self.currency_var = tk.StringVar(value=self.settings.get("default_currency", "EUR"))
+        self.show_tips_var = tk.BooleanVar(value=self.settings.get("show_tips", True))
+        self.check_updates_var = tk.BooleanVar(value=self.settings.get("check_updates", True))
+        self.image_quality_var = tk.StringVar(value=self.settings.get("image_quality", "high"))
+        self.auto_resize_var = tk.BooleanVar(value=self.settings.get("auto_resize_images", True))
+        self.max_size_var = tk.StringVar(value=str(self.settings.get("max_image_size", 1920)))
+        self.auto_backup_var = tk.BooleanVar(value=self.settings.get("auto_backup", True))
+        self.backup_interval_var = tk.StringVar(value=str(self.settings.get("backup_interval", 24)))
+        self.max_backups_var = tk.StringVar(value=str(self.settings.get("max_backups", 10)))
+        self.backup_dir_var = tk.StringVar(value=self.settings.get("backup_directory", ""))
+        self.template_var = tk.StringVar(value=self.settings.get("website_template", "modern"))
+        self.export_format_var = tk.StringVar(value=self.settings.get("export_format", "json"))
+        
+        # Variable backing each setting the dialog edits
+        self._setting_vars = {
+            "language": self.language_var,
+            "default_currency": self.currency_var,
+            "show_tips": self.show_tips_var,
+            "check_updates": self.check_updates_var,
+            "image_quality": self.image_quality_var,
+            "auto_resize_images": self.auto_resize_var,
+            "max_image_size": self.max_size_var,
+            "auto_backup": self.auto_backup_var,
+            "backup_interval": self.backup_interval_var,
+            "max_backups": self.max_backups_var,
+            "backup_directory": self.backup_dir_var,
+            "website_template": self.template_var,
+            "export_format": self.export_format_var
+        }
+    
     def load_settings(self) -> Dict[str, Any]:
         """
         Load application settings
@@ -40,60 +162,51 @@ class PreferencesDialog:
         Returns:
             Dictionary of settings
         """
-        settings_file = Path(__file__).parent.parent / "data" / "settings.json"
-        
-        default_settings = {
-            "language": "en",
-            "theme": "default",
-            "auto_backup": True,
-            "backup_interval": 24,  # hours
-            "max_backups": 10,
-            "default_currency": "EUR",
-            "image_quality": "high",
-            "auto_resize_images": True,
-            "max_image_size": 1920,
-            "website_template": "modern",
-            "export_format": "json",
-            "show_tips": True,
-            "check_updates": True,
-            "data_directory": str(Path(__file__).parent.parent / "data"),
-            "backup_directory": str(Path(__file__).parent.parent / "backups")
-        }
+        settings = _DEFAULT_SETTINGS.copy()
         
         try:
-            if settings_file.exists():
-                with open(settings_file, 'r', encoding='utf-8') as f:
-                    loaded_settings = json.load(f)
-                    # Merge with defaults to ensure all keys exist
-                    default_settings.update(loaded_settings)
-            return default_settings
+            loaded_settings = _loads(_SETTINGS_FILE.read_bytes())
+            # Merge with defaults to ensure all keys exist
+            settings.update(loaded_settings)
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"Error loading settings: {e}")
-            return default_settings
+        
+        return settings
     
     def save_settings(self):
         """
         Save application settings
+        
+        Returns:
+            True if the settings were written, False otherwise
         """
         try:
-            settings_file = Path(__file__).parent.parent / "data" / "settings.json"
+            settings_file = _SETTINGS_FILE
             settings_file.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(settings_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=2, ensure_ascii=False)
+            # Write to a temporary file and swap it in, so a crash never
+            # leaves a truncated settings.json behind
+            tmp_file = settings_file.with_suffix(".json.tmp")
+            tmp_file.write_bytes(_dumps(self.settings))
+            os.replace(tmp_file, settings_file)
             
             if self.on_settings_changed:
                 self.on_settings_changed(self.settings)
+            
+            return True
                 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save settings: {e}")
+            return False
     
     def create_dialog(self):
         """
         Create preferences dialog window
         """
         self.window = tk.Toplevel(self.parent)
-        self.window.title(translate("preferences_title"))
+        self.window.title(self._t["preferences_title"])
         self.window.geometry("600x500")
         self.window.resizable(True, True)
         
@@ -101,6 +214,12 @@ class PreferencesDialog:
         self.window.transient(self.parent)
         self.window.grab_set()
         
+        # Variables must exist before any tab is built
+        self.create_variables()
+        
+        # Numeric entries only accept digits as they are typed
+        self._int_vcmd = (self.window.register(self._is_int), "%P")
+        
         # Main container
         main_frame = ttk.Frame(self.window)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
@@ -109,173 +228,201 @@ class PreferencesDialog:
         self.notebook = ttk.Notebook(main_frame)
         self.notebook.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
         
-        # Create tabs
-        self.create_general_tab()
-        self.create_media_tab()
-        self.create_backup_tab()
-        self.create_website_tab()
+        # Create tabs, building their content when first shown
+        self._tab_builders = {}
+        for text_key, builder in (("preferences_general", self.create_general_tab),
+                                  ("preferences_media", self.create_media_tab),
+                                  ("preferences_backup", self.create_backup_tab),
+                                  ("preferences_website", self.create_website_tab)):
+            tab_frame = ttk.Frame(self.notebook)
+            self.notebook.add(tab_frame, text=self._t[text_key])
+            self._tab_builders[str(tab_frame)] = (builder, tab_frame)
+        
+        # Build the visible tab now, the others when selected
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self._build_current_tab()
         
         # Buttons
         self.create_buttons(main_frame)
     
-    def create_general_tab(self):
+    def _on_tab_changed(self, event):
         """
-        Create general settings tab
+        Handle notebook tab changes
+        
+        Args:
+            event: Tab change event
+        """
+        self._build_current_tab()
+    
+    def _build_current_tab(self):
+        """
+        Build the selected tab the first time it is shown
+        """
+        pending = self._tab_builders.pop(self.notebook.select(), None)
+        if pending:
+            builder, tab_frame = pending
+            builder(tab_frame)
+    
+    def _is_int(self, value: str) -> bool:
+        """
+        Validate a numeric entry as it is edited
+        
+        Args:
+            value: Proposed entry content
+            
+        Returns:
+            True if the content is empty or only ASCII digits
+        """
+        # isdigit() alone also accepts characters such as "²" that int() rejects
+        return value == "" or (value.isascii() and value.isdigit())
+    
+    def create_general_tab(self, tab_frame):
         """
-        tab_frame = ttk.Frame(self.notebook)
-        self.notebook.add(tab_frame, text=translate("preferences_general"))
+        Create general settings tab
         
+        Args:
+            tab_frame: Tab frame to fill
+        """
         # Language settings
-        lang_frame = ttk.LabelFrame(tab_frame, text=translate("preferences_language"), padding=10)
+        lang_frame = ttk.LabelFrame(tab_frame, text=self._t["preferences_language"], padding=10)
         lang_frame.pack(fill=tk.X, pady=(0, 10))
         
-        ttk.Label(lang_frame, text=translate("preferences_select_language")).pack(anchor=tk.W)
+        ttk.Label(lang_frame, text=self._t["preferences_select_language"]).pack(anchor=tk.W)
         
-        self.language_var = tk.StringVar(value=self.settings.get("language", get_language()))
         language_combo = ttk.Combobox(lang_frame, textvariable=self.language_var, 
                                      values=["en", "fr"], 
                                      state="readonly", width=20)
         language_combo.pack(anchor=tk.W, pady=(5, 0))
         
         # Currency settings
-        currency_frame = ttk.LabelFrame(tab_frame, text=translate("preferences_currency"), padding=10)
+        currency_frame = ttk.LabelFrame(tab_frame, text=self._t["preferences_currency"], padding=10)
         currency_frame.pack(fill=tk.X, pady=(0, 10))
         
-        ttk.Label(currency_frame, text=translate("preferences_default_currency")).pack(anchor=tk.W)
+        ttk.Label(currency_frame, text=self._t["preferences_default_currency"]).pack(anchor=tk.W)
         
-        self.currency_var = tk.StringVar(value=self.settings.get("default_currency", "EUR"))
         currency_combo = ttk.Combobox(currency_frame, textvariable=self.currency_var,
                                      values=["EUR", "USD", "GBP", "CAD", "AUD", "CHF", "JPY"],
                                      state="readonly", width=10)
         currency_combo.pack(anchor=tk.W, pady=(5, 0))
         
         # Other general settings
-        other_frame = ttk.LabelFrame(tab_frame, text=translate("preferences_other"), padding=10)
+        other_frame = ttk.LabelFrame(tab_frame, text=self._t["preferences_other"], padding=10)
         other_frame.pack(fill=tk.X)
         
-        self.show_tips_var = tk.BooleanVar(value=self.settings.get("show_tips", True))
-        ttk.Checkbutton(other_frame, text=translate("preferences_show_tips"),
+        ttk.Checkbutton(other_frame, text=self._t["preferences_show_tips"],
                        variable=self.show_tips_var).pack(anchor=tk.W, pady=2)
         
-        self.check_updates_var = tk.BooleanVar(value=self.settings.get("check_updates", True))
-        ttk.Checkbutton(other_frame, text=translate("preferences_check_updates"),
+        ttk.Checkbutton(other_frame, text=self._t["preferences_check_updates"],
                        variable=self.check_updates_var).pack(anchor=tk.W, pady=2)
     
-    def create_media_tab(self):
+    def create_media_tab(self, tab_frame):
         """
         Create media settings tab
-        """
-        tab_frame = ttk.Frame(self.notebook)
-        self.notebook.add(tab_frame, text=translate("preferences_media"))
         
+        Args:
+            tab_frame: Tab frame to fill
+        """
         # Image quality settings
-        quality_frame = ttk.LabelFrame(tab_frame, text=translate("preferences_image_quality"), padding=10)
+        quality_frame = ttk.LabelFrame(tab_frame, text=self._t["preferences_image_quality"], padding=10)
         quality_frame.pack(fill=tk.X, pady=(0, 10))
         
-        ttk.Label(quality_frame, text=translate("preferences_quality_level")).pack(anchor=tk.W)
+        ttk.Label(quality_frame, text=self._t["preferences_quality_level"]).pack(anchor=tk.W)
         
-        self.image_quality_var = tk.StringVar(value=self.settings.get("image_quality", "high"))
         quality_combo = ttk.Combobox(quality_frame, textvariable=self.image_quality_var,
                                     values=["low", "medium", "high", "original"],
                                     state="readonly", width=15)
         quality_combo.pack(anchor=tk.W, pady=(5, 0))
         
         # Auto resize settings
-        resize_frame = ttk.LabelFrame(tab_frame, text=translate("preferences_auto_resize"), padding=10)
+        resize_frame = ttk.LabelFrame(tab_frame, text=self._t["preferences_auto_resize"], padding=10)
         resize_frame.pack(fill=tk.X, pady=(0, 10))
         
-        self.auto_resize_var = tk.BooleanVar(value=self.settings.get("auto_resize_images", True))
-        ttk.Checkbutton(resize_frame, text=translate("preferences_enable_auto_resize"),
+        ttk.Checkbutton(resize_frame, text=self._t["preferences_enable_auto_resize"],
                        variable=self.auto_resize_var).pack(anchor=tk.W, pady=2)
         
         size_frame = ttk.Frame(resize_frame)
         size_frame.pack(fill=tk.X, pady=(5, 0))
         
-        ttk.Label(size_frame, text=translate("preferences_max_size")).pack(side=tk.LEFT)
+        ttk.Label(size_frame, text=self._t["preferences_max_size"]).pack(side=tk.LEFT)
         
-        self.max_size_var = tk.StringVar(value=str(self.settings.get("max_image_size", 1920)))
-        size_entry = ttk.Entry(size_frame, textvariable=self.max_size_var, width=10)
+        size_entry = ttk.Entry(size_frame, textvariable=self.max_size_var, width=10,
+                               validate="key", validatecommand=self._int_vcmd)
         size_entry.pack(side=tk.LEFT, padx=(10, 5))
         
         ttk.Label(size_frame, text="px").pack(side=tk.LEFT)
     
-    def create_backup_tab(self):
+    def create_backup_tab(self, tab_frame):
         """
         Create backup settings tab
-        """
-        tab_frame = ttk.Frame(self.notebook)
-        self.notebook.add(tab_frame, text=translate("preferences_backup"))
         
+        Args:
+            tab_frame: Tab frame to fill
+        """
         # Auto backup settings
-        auto_frame = ttk.LabelFrame(tab_frame, text=translate("preferences_auto_backup"), padding=10)
+        auto_frame = ttk.LabelFrame(tab_frame, text=self._t["preferences_auto_backup"], padding=10)
         auto_frame.pack(fill=tk.X, pady=(0, 10))
         
-        self.auto_backup_var = tk.BooleanVar(value=self.settings.get("auto_backup", True))
-        ttk.Checkbutton(auto_frame, text=translate("preferences_enable_auto_backup"),
+        ttk.Checkbutton(auto_frame, text=self._t["preferences_enable_auto_backup"],
                        variable=self.auto_backup_var).pack(anchor=tk.W, pady=2)
         
         interval_frame = ttk.Frame(auto_frame)
         interval_frame.pack(fill=tk.X, pady=(5, 0))
         
-        ttk.Label(interval_frame, text=translate("preferences_backup_interval")).pack(side=tk.LEFT)
+        ttk.Label(interval_frame, text=self._t["preferences_backup_interval"]).pack(side=tk.LEFT)
         
-        self.backup_interval_var = tk.StringVar(value=str(self.settings.get("backup_interval", 24)))
-        interval_entry = ttk.Entry(interval_frame, textvariable=self.backup_interval_var, width=10)
+        interval_entry = ttk.Entry(interval_frame, textvariable=self.backup_interval_var, width=10,
+                                   validate="key", validatecommand=self._int_vcmd)
         interval_entry.pack(side=tk.LEFT, padx=(10, 5))
         
-        ttk.Label(interval_frame, text=translate("preferences_hours")).pack(side=tk.LEFT)
+        ttk.Label(interval_frame, text=self._t["preferences_hours"]).pack(side=tk.LEFT)
         
         # Max backups
         max_frame = ttk.Frame(auto_frame)
         max_frame.pack(fill=tk.X, pady=(5, 0))
         
-        ttk.Label(max_frame, text=translate("preferences_max_backups")).pack(side=tk.LEFT)
+        ttk.Label(max_frame, text=self._t["preferences_max_backups"]).pack(side=tk.LEFT)
         
-        self.max_backups_var = tk.StringVar(value=str(self.settings.get("max_backups", 10)))
-        max_entry = ttk.Entry(max_frame, textvariable=self.max_backups_var, width=10)
+        max_entry = ttk.Entry(max_frame, textvariable=self.max_backups_var, width=10,
+                              validate="key", validatecommand=self._int_vcmd)
         max_entry.pack(side=tk.LEFT, padx=(10, 0))
         
         # Backup directory
-        dir_frame = ttk.LabelFrame(tab_frame, text=translate("preferences_backup_directory"), padding=10)
+        dir_frame = ttk.LabelFrame(tab_frame, text=self._t["preferences_backup_directory"], padding=10)
         dir_frame.pack(fill=tk.X)
         
-        self.backup_dir_var = tk.StringVar(value=self.settings.get("backup_directory", ""))
-        
         dir_entry_frame = ttk.Frame(dir_frame)
         dir_entry_frame.pack(fill=tk.X)
         
         dir_entry = ttk.Entry(dir_entry_frame, textvariable=self.backup_dir_var)
         dir_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
         
-        ttk.Button(dir_entry_frame, text=translate("preferences_browse"),
+        ttk.Button(dir_entry_frame, text=self._t["preferences_browse"],
                   command=self.browse_backup_directory).pack(side=tk.RIGHT)
     
-    def create_website_tab(self):
+    def create_website_tab(self, tab_frame):
         """
         Create website settings tab
-        """
-        tab_frame = ttk.Frame(self.notebook)
-        self.notebook.add(tab_frame, text=translate("preferences_website"))
         
+        Args:
+            tab_frame: Tab frame to fill
+        """
         # Default template
-        template_frame = ttk.LabelFrame(tab_frame, text=translate("preferences_default_template"), padding=10)
+        template_frame = ttk.LabelFrame(tab_frame, text=self._t["preferences_default_template"], padding=10)
         template_frame.pack(fill=tk.X, pady=(0, 10))
         
-        ttk.Label(template_frame, text=translate("preferences_select_template")).pack(anchor=tk.W)
+        ttk.Label(template_frame, text=self._t["preferences_select_template"]).pack(anchor=tk.W)
         
-        self.template_var = tk.StringVar(value=self.settings.get("website_template", "modern"))
         template_combo = ttk.Combobox(template_frame, textvariable=self.template_var,
                                      values=["modern", "classic", "minimal", "luxury"],
                                      state="readonly", width=20)
         template_combo.pack(anchor=tk.W, pady=(5, 0))
         
         # Export format
-        export_frame = ttk.LabelFrame(tab_frame, text=translate("preferences_export_format"), padding=10)
+        export_frame = ttk.LabelFrame(tab_frame, text=self._t["preferences_export_format"], padding=10)
         export_frame.pack(fill=tk.X)
         
-        ttk.Label(export_frame, text=translate("preferences_default_export")).pack(anchor=tk.W)
+        ttk.Label(export_frame, text=self._t["preferences_default_export"]).pack(anchor=tk.W)
         
-        self.export_format_var = tk.StringVar(value=self.settings.get("export_format", "json"))
         export_combo = ttk.Combobox(export_frame, textvariable=self.export_format_var,
                                    values=["json", "xml", "csv"],
                                    state="readonly", width=15)
@@ -292,18 +439,18 @@ class PreferencesDialog:
         button_frame.pack(fill=tk.X)
         
         # Cancel button
-        ttk.Button(button_frame, text=translate("preferences_cancel"),
+        ttk.Button(button_frame, text=self._t["preferences_cancel"],
                   command=self.cancel).pack(side=tk.LEFT)
         
         # Reset button
-        ttk.Button(button_frame, text=translate("preferences_reset"),
+        ttk.Button(button_frame, text=self._t["preferences_reset"],
                   command=self.reset_to_defaults).pack(side=tk.LEFT, padx=(10, 0))
         
         # Apply and OK buttons
-        ttk.Button(button_frame, text=translate("preferences_apply"),
+        ttk.Button(button_frame, text=self._t["preferences_apply"],
                   command=self.apply_settings).pack(side=tk.RIGHT, padx=(10, 0))
         
-        ttk.Button(button_frame, text=translate("preferences_ok"),
+        ttk.Button(button_frame, text=self._t["preferences_ok"],
                   command=self.ok, style='Primary.TButton').pack(side=tk.RIGHT)
     
     def browse_backup_directory(self):
@@ -311,7 +458,7 @@ class PreferencesDialog:
         Browse for backup directory
         """
         directory = filedialog.askdirectory(
-            title=translate("preferences_select_backup_dir"),
+            title=self._t["preferences_select_backup_dir"],
             initialdir=self.backup_dir_var.get() or str(Path.home())
         )
         
@@ -321,31 +468,40 @@ class PreferencesDialog:
     def apply_settings(self):
         """
         Apply current settings
+        
+        Returns:
+            True if the settings were applied, False otherwise
         """
         try:
+            language = self.language_var.get()
+            
             # Update settings dictionary
             self.settings.update({
-                "language": self.language_var.get(),
+                "language": language,
                 "default_currency": self.currency_var.get(),
                 "show_tips": self.show_tips_var.get(),
                 "check_updates": self.check_updates_var.get(),
                 "image_quality": self.image_quality_var.get(),
                 "auto_resize_images": self.auto_resize_var.get(),
-                "max_image_size": int(self.max_size_var.get()),
+                "max_image_size": int(self.max_size_var.get() or _DEFAULT_SETTINGS["max_image_size"]),
                 "auto_backup": self.auto_backup_var.get(),
-                "backup_interval": int(self.backup_interval_var.get()),
-                "max_backups": int(self.max_backups_var.get()),
+                "backup_interval": int(self.backup_interval_var.get() or _DEFAULT_SETTINGS["backup_interval"]),
+                "max_backups": int(self.max_backups_var.get() or _DEFAULT_SETTINGS["max_backups"]),
                 "backup_directory": self.backup_dir_var.get(),
                 "website_template": self.template_var.get(),
                 "export_format": self.export_format_var.get()
             })
             
-            # Save settings
-            self.save_settings()
+            # Save settings, unless nothing changed since the last save
+            # (a failed save has already been reported and stays pending)
+            if self.settings != self._saved_settings:
+                if not self.save_settings():
+                    return False
+                self._saved_settings = dict(self.settings)
             
             # Apply language change if needed
-            if self.language_var.get() != get_language():
-                set_language(self.language_var.get())
+            if language != get_language():
+                set_language(language)
                 messagebox.showinfo(
                     translate("preferences_language_changed"),
                     translate("preferences_restart_required")
@@ -355,8 +511,10 @@ class PreferencesDialog:
                 translate("preferences_applied"),
                 translate("preferences_settings_saved")
             )
+            return True
             
-        except ValueError as e:
+        except ValueError:
+            # Non-numeric values can still come from a hand-edited settings file
             messagebox.showerror(
                 translate("preferences_error"),
                 translate("preferences_invalid_values")
@@ -366,6 +524,7 @@ class PreferencesDialog:
                 translate("preferences_error"),
                 f"Failed to apply settings: {e}"
             )
+        return False
     
     def reset_to_defaults(self):
         """
@@ -378,26 +537,15 @@ class PreferencesDialog:
         
         if result:
             # Reset to default values
-            self.language_var.set("en")
-            self.currency_var.set("EUR")
-            self.show_tips_var.set(True)
-            self.check_updates_var.set(True)
-            self.image_quality_var.set("high")
-            self.auto_resize_var.set(True)
-            self.max_size_var.set("1920")
-            self.auto_backup_var.set(True)
-            self.backup_interval_var.set("24")
-            self.max_backups_var.set("10")
-            self.backup_dir_var.set(str(Path(__file__).parent.parent / "backups"))
-            self.template_var.set("modern")
-            self.export_format_var.set("json")
+            for key, var in self._setting_vars.items():
+                var.set(_DEFAULT_SETTINGS[key])
     
     def ok(self):
         """
-        Apply settings and close dialog
+        Apply settings and close dialog (kept open if applying failed)
         """
-        self.apply_settings()
-        self.window.destroy()
+        if self.apply_settings():
+            self.window.destroy()
     
     def cancel(self):
         """
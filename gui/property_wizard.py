@@ -7,15 +7,177 @@ Author: AI Assistant
 Version: 1.0.0
 """
 
+import functools
+import hashlib
+import os
+import time
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Callable
+from typing import Dict, Any, Optional, List, Callable, Set, Tuple
 import json
 from PIL import Image, ImageTk
 import threading
 from core.localization import translate
 
+# Translation keys of the wizard step titles, in step order
+_STEP_TITLE_KEYS = (
+    'wizard_basic_info', 'wizard_media_upload', 'wizard_features',
+    'wizard_location', 'wizard_advanced', 'wizard_review'
+)
+
+# Persistent cache of media thumbnails, keyed by source path and mtime
+_THUMB_CACHE_DIR = Path(__file__).resolve().parent.parent / "data" / "thumb_cache"
+_THUMB_SIZE = (128, 128)
+
+# Number of cached thumbnails kept, least recently used are removed first
+_THUMB_CACHE_MAX_FILES = 500
+
+# Age after which a leftover temporary thumbnail file is removed (s)
+_THUMB_TMP_MAX_AGE = 3600
+
+# Delay between checks for finished thumbnails (ms)
+_THUMB_POLL_DELAY = 50
+
+# Base features for all properties
+_BASE_FEATURES = ('Parking', 'Garage', 'Elevator', 'Security System')
+
+# Features for residential properties
+_RESIDENTIAL_FEATURES = (
+    'Air Conditioning', 'Heating', 'Fireplace', 'Balcony', 'Terrace',
+    'Garden', 'Swimming Pool'
+)
+
+# Features specific to rental properties
+_RENTAL_FEATURES = (
+    'Furnished', 'Washing Machine', 'Dishwasher', 'WiFi Internet',
+    'Television', 'Utilities Included', 'Pets Allowed', 'Smoking Allowed'
+)
+
+# Features specific to sale properties
+_SALE_FEATURES = (
+    'New Construction', 'Recently Renovated', 'Investment Property',
+    'Mortgage Available'
+)
+
+# Features for commercial properties
+_COMMERCIAL_FEATURES = (
+    'Conference Room', 'Reception Area', 'Kitchen Facilities',
+    'Storage Space', 'Loading Dock', 'Handicap Accessible'
+)
+
+# Property types that get commercial rather than residential features
+_COMMERCIAL_TYPES = frozenset(('commercial', 'office', 'warehouse'))
+
+
+@functools.lru_cache(maxsize=32)
+def _compute_features(property_type: str, transaction_type: str) -> Tuple[str, ...]:
+    """
+    Combine the feature lists for a property and transaction type
+    
+    Args:
+        property_type: Lowercase property type
+        transaction_type: Lowercase transaction type
+        
+    Returns:
+        Tuple[str, ...]: Sorted features without duplicates
+    """
+    # Start with base features
+    features = set(_BASE_FEATURES)
+    
+    # Add commercial or residential features
+    if property_type in _COMMERCIAL_TYPES:
+        features.update(_COMMERCIAL_FEATURES)
+    else:
+        features.update(_RESIDENTIAL_FEATURES)
+    
+    # Add transaction-specific features
+    if 'rent' in transaction_type or 'location' in transaction_type:
+        features.update(_RENTAL_FEATURES)
+    elif 'sale' in transaction_type or 'vente' in transaction_type:
+        features.update(_SALE_FEATURES)
+    
+    return tuple(sorted(features))
+
+
+def _make_thumbnail(source_path: str) -> Path:
+    """
+    Create the cached thumbnail of an image (runs on a worker thread)
+    
+    Args:
+        source_path: Path of the source image
+        
+    Returns:
+        Path: Path of the cached JPEG thumbnail
+    """
+    source = Path(source_path)
+    key = f"{source.resolve()}|{source.stat().st_mtime_ns}"
+    thumb_path = _THUMB_CACHE_DIR / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.jpg"
+    
+    try:
+        # Mark the thumbnail as recently used for pruning
+        os.utime(thumb_path)
+        return thumb_path
+    except FileNotFoundError:
+        pass
+    
+    with Image.open(source) as img:
+        # Let JPEG decoding skip detail the thumbnail does not need
+        img.draft('RGB', _THUMB_SIZE)
+        thumb = img.convert('RGB')
+        thumb.thumbnail(_THUMB_SIZE, Image.Resampling.BILINEAR)
+    
+    # Write under a name unique to this process and thread, then swap it in,
+    # so a crash or a concurrent wizard never leaves a truncated thumbnail
+    _THUMB_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = thumb_path.with_name(f"{thumb_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        thumb.save(tmp_path, 'JPEG', quality=85)
+        os.replace(tmp_path, thumb_path)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    
+    return thumb_path
+
+
+def _prune_thumbnail_cache():
+    """
+    Remove the least recently used thumbnails beyond the cache limit (runs on a worker thread)
+    """
+    try:
+        entries = []
+        stale = []
+        now = time.time()
+        with os.scandir(_THUMB_CACHE_DIR) as scan:
+            for entry in scan:
+                try:
+                    mtime = entry.stat().st_mtime
+                except FileNotFoundError:
+                    continue
+                if entry.name.endswith('.tmp'):
+                    # Left behind by an interrupted write
+                    if now - mtime > _THUMB_TMP_MAX_AGE:
+                        stale.append(entry.path)
+                else:
+                    entries.append((mtime, entry.path))
+        
+        entries.sort()
+        stale.extend(path for _, path in entries[:max(0, len(entries) - _THUMB_CACHE_MAX_FILES)])
+        for path in stale:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                # Already removed by another wizard
+                pass
+    except FileNotFoundError:
+        # No thumbnails cached yet
+        pass
+    except OSError as e:
+        print(f"Error pruning thumbnail cache: {e}")
+
+
 class PropertyWizard:
     """
     Multi-step wizard for creating new properties
@@ -44,43 +206,37 @@ class PropertyWizard:
         self.media_files = []
         self.current_step = 0
         
+        # Built step frames, kept between visits
+        self._step_frames: Dict[int, ttk.Frame] = {}
+        self._shown_features: List[str] = []
+        
+        # Thumbnails generated off the Tk thread, by source path
+        self._thumb_executor = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+        self._thumb_futures: Dict[str, Future] = {}
+        self._thumb_paths: Dict[str, Optional[Path]] = {}
+        self._thumb_poll_id = None
+        self._preview_image = None
+        
+        # Keep the persistent thumbnail cache bounded
+        self._thumb_executor.submit(_prune_thumbnail_cache)
+        
         # Load existing property data if editing
         if self.is_editing:
             self.load_existing_property_data()
         
-        # Wizard steps
+        # Paths already in media_files, for constant-time duplicate checks
+        self._media_paths: Set[str] = {media['path'] for media in self.media_files if media.get('path')}
+        
+        # Wizard steps, built and titled when first shown
         self.steps = [
-            {
-                'title': translate('wizard_basic_info'),
-                'description': translate('wizard_basic_info_desc'),
-                'create_func': self.create_basic_info_step
-            },
-            {
-                'title': translate('wizard_media_upload'),
-                'description': translate('wizard_media_upload_desc'),
-                'create_func': self.create_media_step
-            },
-            {
-                'title': translate('wizard_features'),
-                'description': translate('wizard_features_desc'),
-                'create_func': self.create_features_step
-            },
-            {
-                'title': translate('wizard_location'),
-                'description': translate('wizard_location_desc'),
-                'create_func': self.create_location_step
-            },
-            {
-                'title': translate('wizard_advanced'),
-                'description': translate('wizard_advanced_desc'),
-                'create_func': self.create_advanced_step
-            },
-            {
-                'title': translate('wizard_review'),
-                'description': translate('wizard_review_desc'),
-                'create_func': self.create_review_step
-            }
+            self.create_basic_info_step,
+            self.create_media_step,
+            self.create_features_step,
+            self.create_location_step,
+            self.create_advanced_step,
+            self.create_review_step
         ]
+        self._step_titles: Dict[int, str] = {}
         
         self.create_wizard_window()
     
@@ -130,6 +286,7 @@ class PropertyWizard:
         # Center window
         self.window.transient(self.parent)
         self.window.grab_set()
+        self.window.bind('<Destroy>', self._on_destroy)
         
         # Main container
         main_frame = ttk.Frame(self.window)
@@ -151,6 +308,19 @@ class PropertyWizard:
         # Load first step
         self.load_step(0)
     
+    def _on_destroy(self, event):
+        """
+        Stop thumbnail generation when the wizard is closed
+        
+        Args:
+            event: Destroy event
+        """
+        if event.widget is self.window:
+            if self._thumb_poll_id:
+                self.window.after_cancel(self._thumb_poll_id)
+                self._thumb_poll_id = None
+            self._thumb_executor.shutdown(wait=False)
+    
     def create_header(self, parent):
         """
         Create wizard header
@@ -170,10 +340,9 @@ class PropertyWizard:
         )
         self.title_label.pack(anchor=tk.W)
         
-        # Subtitle
+        # Subtitle (filled in by load_step)
         self.subtitle_label = ttk.Label(
             header_frame,
-            text=f"{translate('wizard_step')} 1 {translate('wizard_of')} 6: {translate('wizard_basic_info')}",
             font=('Segoe UI', 12),
             foreground='gray'
         )
@@ -248,20 +417,31 @@ class PropertyWizard:
             step_index: Step index to load
         """
         if 0 <= step_index < len(self.steps):
-            self.current_step = step_index
+            # Hide the previous step, keeping its widgets for the next visit
+            previous_frame = self._step_frames.get(self.current_step)
+            if previous_frame is not None:
+                previous_frame.pack_forget()
             
-            # Clear content frame
-            for widget in self.content_frame.winfo_children():
-                widget.destroy()
+            self.current_step = step_index
             
             # Update header
-            step = self.steps[step_index]
             self.subtitle_label.config(
-                text=f"Step {step_index + 1} of {len(self.steps)}: {step['title']}"
+                text=f"Step {step_index + 1} of {len(self.steps)}: {self._step_title(step_index)}"
             )
             
-            # Create step content
-            step['create_func']()
+            # Drop a built step whose content no longer matches the data
+            step_frame = self._step_frames.get(step_index)
+            if step_frame is not None and self._is_step_stale(step_index):
+                step_frame.destroy()
+                step_frame = None
+            
+            # Create step content on first visit
+            if step_frame is None:
+                step_frame = ttk.Frame(self.content_frame)
+                self.steps[step_index](step_frame)
+                self._step_frames[step_index] = step_frame
+            
+            step_frame.pack(fill=tk.BOTH, expand=True)
             
             # Update navigation
             self.update_navigation()
@@ -269,6 +449,38 @@ class PropertyWizard:
             # Update progress
             self.update_progress()
     
+    def _step_title(self, step_index: int) -> str:
+        """
+        Get the translated title of a step
+        
+        Args:
+            step_index: Step index
+            
+        Returns:
+            str: Step title
+        """
+        title = self._step_titles.get(step_index)
+        if title is None:
+            title = self._step_titles[step_index] = translate(_STEP_TITLE_KEYS[step_index])
+        return title
+    
+    def _is_step_stale(self, step_index: int) -> bool:
+        """
+        Check whether a built step must be rebuilt before showing it
+        
+        Args:
+            step_index: Step index to check
+            
+        Returns:
+            bool: True if the step content is out of date
+        """
+        if step_index == 2:  # Features depend on the property type
+            return self.get_dynamic_features() != self._shown_features
+        elif step_index == 5:  # Review summarizes every other step
+            return True
+        
+        return False
+    
     def update_navigation(self):
         """
         Update navigation button states
@@ -352,13 +564,16 @@ class PropertyWizard:
             self.save_advanced()
     
     # Step 1: Basic Information
-    def create_basic_info_step(self):
+    def create_basic_info_step(self, step_frame):
         """
         Create basic information step
+        
+        Args:
+            step_frame: Frame to build the step into
         """
         # Scrollable frame
-        canvas = tk.Canvas(self.content_frame)
-        scrollbar = ttk.Scrollbar(self.content_frame, orient="vertical", command=canvas.yview)
+        canvas = tk.Canvas(step_frame)
+        scrollbar = ttk.Scrollbar(step_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
         
         scrollable_frame.bind(
@@ -489,11 +704,14 @@ class PropertyWizard:
         })
     
     # Step 2: Media Upload
-    def create_media_step(self):
+    def create_media_step(self, step_frame):
         """
         Create media upload step
+        
+        Args:
+            step_frame: Frame to build the step into
         """
-        main_frame = ttk.Frame(self.content_frame)
+        main_frame = ttk.Frame(step_frame)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         # Instructions
@@ -532,6 +750,10 @@ class PropertyWizard:
         listbox_frame = ttk.Frame(list_frame)
         listbox_frame.pack(fill=tk.BOTH, expand=True)
         
+        # Preview of the selected photo
+        self.media_preview = ttk.Label(listbox_frame, anchor=tk.CENTER)
+        self.media_preview.pack(side=tk.RIGHT, padx=(10, 0))
+        
         self.media_listbox = tk.Listbox(
             listbox_frame,
             font=('Segoe UI', 10),
@@ -539,6 +761,7 @@ class PropertyWizard:
         )
         media_scrollbar = ttk.Scrollbar(listbox_frame, orient=tk.VERTICAL, command=self.media_listbox.yview)
         self.media_listbox.configure(yscrollcommand=media_scrollbar.set)
+        self.media_listbox.bind('<<ListboxSelect>>', lambda e: self.show_media_preview())
         
         self.media_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         media_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -576,15 +799,19 @@ class PropertyWizard:
             ]
         )
         
+        new_items = []
         for file_path in files:
-            if file_path not in [media['path'] for media in self.media_files]:
-                self.media_files.append({
+            if file_path not in self._media_paths:
+                self._media_paths.add(file_path)
+                new_items.append({
                     'path': file_path,
                     'type': 'image',
                     'name': Path(file_path).name
                 })
+                self.request_thumbnail(file_path)
         
-        self.refresh_media_list()
+        self.media_files.extend(new_items)
+        self._render_media_incremental(new_items)
     
     def add_videos(self):
         """
@@ -598,25 +825,110 @@ class PropertyWizard:
             ]
         )
         
+        new_items = []
         for file_path in files:
-            if file_path not in [media['path'] for media in self.media_files]:
-                self.media_files.append({
+            if file_path not in self._media_paths:
+                self._media_paths.add(file_path)
+                new_items.append({
                     'path': file_path,
                     'type': 'video',
                     'name': Path(file_path).name
                 })
         
-        self.refresh_media_list()
+        self.media_files.extend(new_items)
+        self._render_media_incremental(new_items)
     
     def refresh_media_list(self):
         """
         Refresh media list display
         """
         self.media_listbox.delete(0, tk.END)
+        self._render_media_incremental(self.media_files)
+    
+    def _render_media_incremental(self, new_items: List[Dict[str, Any]]):
+        """
+        Append media rows to the list display in a single Tk call
+        
+        Args:
+            new_items: Media entries to append
+        """
+        if new_items:
+            self.media_listbox.insert(tk.END, *[
+                f"{'📷' if media['type'] == 'image' else '🎥'} {media['name']}"
+                for media in new_items
+            ])
+    
+    def request_thumbnail(self, file_path: str):
+        """
+        Start generating the thumbnail of an image in the background
+        
+        Args:
+            file_path: Path of the image
+        """
+        if file_path in self._thumb_paths or file_path in self._thumb_futures:
+            return
+        
+        self._thumb_futures[file_path] = self._thumb_executor.submit(_make_thumbnail, file_path)
+        if self._thumb_poll_id is None:
+            self._thumb_poll_id = self.window.after(_THUMB_POLL_DELAY, self._poll_thumbnails)
+    
+    def _poll_thumbnails(self):
+        """
+        Collect finished thumbnails on the Tk thread
+        """
+        self._thumb_poll_id = None
+        finished = False
+        
+        for file_path, future in list(self._thumb_futures.items()):
+            if not future.done():
+                continue
+            del self._thumb_futures[file_path]
+            finished = True
+            try:
+                self._thumb_paths[file_path] = future.result()
+            except Exception as e:
+                # Remember the failure so the thumbnail is not retried
+                self._thumb_paths[file_path] = None
+                print(f"Error creating thumbnail for {file_path}: {e}")
+        
+        if self._thumb_futures:
+            self._thumb_poll_id = self.window.after(_THUMB_POLL_DELAY, self._poll_thumbnails)
+        
+        # The selected photo may just have got its thumbnail
+        if finished:
+            self.show_media_preview()
+    
+    def show_media_preview(self):
+        """
+        Show the thumbnail of the selected photo
+        """
+        if not self.media_preview.winfo_exists():
+            return
+        
+        selection = self.media_listbox.curselection()
+        media = self.media_files[selection[0]] if selection else None
+        
+        if media and media.get('type') == 'image' and media.get('path'):
+            # Missing thumbnails are shown by _poll_thumbnails once ready
+            self.request_thumbnail(media['path'])
+            thumb_path = self._thumb_paths.get(media['path'])
+        else:
+            thumb_path = None
+        
+        if thumb_path is None:
+            self._preview_image = None
+            self.media_preview.config(image='')
+            return
         
-        for i, media in enumerate(self.media_files):
-            icon = "📷" if media['type'] == 'image' else "🎥"
-            self.media_listbox.insert(tk.END, f"{icon} {media['name']}")
+        try:
+            with Image.open(thumb_path) as img:
+                self._preview_image = ImageTk.PhotoImage(img)
+            self.media_preview.config(image=self._preview_image)
+        except Exception as e:
+            print(f"Error showing thumbnail for {media['path']}: {e}")
+            # Drop the unreadable file so the next session recreates it
+            self._thumb_paths[media['path']] = None
+            thumb_path.unlink(missing_ok=True)
     
     def remove_selected_media(self):
         """
@@ -625,8 +937,10 @@ class PropertyWizard:
         selection = self.media_listbox.curselection()
         if selection:
             index = selection[0]
+            self._media_paths.discard(self.media_files[index].get('path'))
             del self.media_files[index]
             self.refresh_media_list()
+            self.show_media_preview()
     
     def clear_all_media(self):
         """
@@ -634,7 +948,9 @@ class PropertyWizard:
         """
         if messagebox.askyesno("Clear Media", "Remove all media files?"):
             self.media_files.clear()
+            self._media_paths.clear()
             self.refresh_media_list()
+            self.show_media_preview()
     
     def validate_media(self) -> bool:
         """
@@ -653,13 +969,16 @@ class PropertyWizard:
         self.property_data['media_files'] = self.media_files.copy()
     
     # Step 3: Property Features
-    def create_features_step(self):
+    def create_features_step(self, step_frame):
         """
         Create property features step
+        
+        Args:
+            step_frame: Frame to build the step into
         """
         # Scrollable frame
-        canvas = tk.Canvas(self.content_frame)
-        scrollbar = ttk.Scrollbar(self.content_frame, orient="vertical", command=canvas.yview)
+        canvas = tk.Canvas(step_frame)
+        scrollbar = ttk.Scrollbar(step_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
         
         scrollable_frame.bind(
@@ -685,6 +1004,7 @@ class PropertyWizard:
         
         # Get dynamic features based on property type and transaction type
         features = self.get_dynamic_features()
+        self._shown_features = features
         
         # Create checkboxes in grid
         for i, feature in enumerate(features):
@@ -741,55 +1061,10 @@ class PropertyWizard:
         Returns:
             List[str]: Appropriate features for the property
         """
-        property_type = self.property_data.get('property_type', '').lower()
-        transaction_type = self.property_data.get('transaction_type', '').lower()
-        
-        # Base features for all properties
-        base_features = ['Parking', 'Garage', 'Elevator', 'Security System']
-        
-        # Features for residential properties
-        residential_features = [
-            'Air Conditioning', 'Heating', 'Fireplace', 'Balcony', 'Terrace', 
-            'Garden', 'Swimming Pool'
-        ]
-        
-        # Features specific to rental properties
-        rental_features = [
-            'Furnished', 'Washing Machine', 'Dishwasher', 'WiFi Internet', 
-            'Television', 'Utilities Included', 'Pets Allowed', 'Smoking Allowed'
-        ]
-        
-        # Features specific to sale properties
-        sale_features = [
-            'New Construction', 'Recently Renovated', 'Investment Property', 
-            'Mortgage Available'
-        ]
-        
-        # Features for commercial properties
-        commercial_features = [
-            'Conference Room', 'Reception Area', 'Kitchen Facilities', 
-            'Storage Space', 'Loading Dock', 'Handicap Accessible'
-        ]
-        
-        # Start with base features
-        features = base_features.copy()
-        
-        # Add residential features for non-commercial properties
-        if property_type not in ['commercial', 'office', 'warehouse']:
-            features.extend(residential_features)
-        
-        # Add commercial features for commercial properties
-        if property_type in ['commercial', 'office', 'warehouse']:
-            features.extend(commercial_features)
-        
-        # Add transaction-specific features
-        if 'rent' in transaction_type or 'location' in transaction_type:
-            features.extend(rental_features)
-        elif 'sale' in transaction_type or 'vente' in transaction_type:
-            features.extend(sale_features)
-        
-        # Remove duplicates and sort
-        return sorted(list(set(features)))
+        return list(_compute_features(
+            self.property_data.get('property_type', '').lower(),
+            self.property_data.get('transaction_type', '').lower()
+        ))
     
     def validate_features(self) -> bool:
         """
@@ -818,11 +1093,14 @@ class PropertyWizard:
         })
     
     # Step 4: Location & Neighborhood
-    def create_location_step(self):
+    def create_location_step(self, step_frame):
         """
         Create location step
+        
+        Args:
+            step_frame: Frame to build the step into
         """
-        main_frame = ttk.Frame(self.content_frame)
+        main_frame = ttk.Frame(step_frame)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         # Address section
@@ -902,11 +1180,14 @@ class PropertyWizard:
         })
     
     # Step 5: Advanced Options
-    def create_advanced_step(self):
+    def create_advanced_step(self, step_frame):
         """
         Create advanced options step
+        
+        Args:
+            step_frame: Frame to build the step into
         """
-        main_frame = ttk.Frame(self.content_frame)
+        main_frame = ttk.Frame(step_frame)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         # Website options
@@ -998,13 +1279,16 @@ class PropertyWizard:
         })
     
     # Step 6: Review & Create
-    def create_review_step(self):
+    def create_review_step(self, step_frame):
         """
         Create review step
+        
+        Args:
+            step_frame: Frame to build the step into
         """
         # Scrollable frame
-        canvas = tk.Canvas(self.content_frame)
-        scrollbar = ttk.Scrollbar(self.content_frame, orient="vertical", command=canvas.yview)
+        canvas = tk.Canvas(step_frame)
+        scrollbar = ttk.Scrollbar(step_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
         
         scrollable_frame.bind(
@@ -1110,12 +1394,12 @@ class PropertyWizard:
                 font=('Segoe UI', 9)
             ).pack(anchor=tk.W)
     
-    def validate_property_data(self) -> tuple[bool, str]:
+    def validate_property_data(self) -> Tuple[bool, str]:
         """
         Validate all property data before creation
         
         Returns:
-            tuple[bool, str]: (is_valid, error_message)
+            Tuple[bool, str]: (is_valid, error_message)
         """
         errors = []
         
@@ -13,7 +13,8 @@ from pathlib import Path
 
 # Add the project root to Python path
 project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 try:
     from gui.main_window import MainWindow
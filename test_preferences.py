@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test script for the preferences dialog settings handling
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from unittest import mock
+from pathlib import Path
+
+from gui import preferences_dialog
+from gui.preferences_dialog import PreferencesDialog, _DEFAULT_SETTINGS
+
+def test_numeric_entry_validation():
+    """
+    Test that numeric preference entries only accept ASCII digits
+    """
+    print("Testing numeric entry validation...")
+    
+    # The validation callback does not need a built dialog
+    dialog = PreferencesDialog.__new__(PreferencesDialog)
+    
+    assert dialog._is_int("") is True
+    assert dialog._is_int("1920") is True
+    assert dialog._is_int("²") is False
+    assert dialog._is_int("١٢") is False
+    assert dialog._is_int("-1") is False
+    print("✓ Only empty values and ASCII digits are accepted")
+
+def test_settings_round_trip():
+    """
+    Test saving and loading settings with each available JSON backend
+    """
+    print("Testing settings round trip...")
+    
+    # Settings are written by every backend and read back by every backend
+    backends = [False]
+    if preferences_dialog.ORJSON_AVAILABLE:
+        backends.append(True)
+    else:
+        print("⚠ orjson not installed, testing the json backend only")
+    
+    # Use a throwaway settings file so the application settings are untouched
+    temp_dir = tempfile.TemporaryDirectory()
+    settings_file = Path(temp_dir.name) / "data" / "settings.json"
+    
+    dialog = PreferencesDialog.__new__(PreferencesDialog)
+    dialog.on_settings_changed = None
+    
+    try:
+        with mock.patch.object(preferences_dialog, "_SETTINGS_FILE", settings_file):
+            # A missing file yields the defaults
+            assert dialog.load_settings() == _DEFAULT_SETTINGS
+            print("✓ Missing settings file loads the defaults")
+            
+            for write_orjson in backends:
+                for read_orjson in backends:
+                    dialog.settings = dict(_DEFAULT_SETTINGS, language="fr", max_backups=3,
+                                           backup_directory=str(Path(temp_dir.name) / "Sauvegardes été"))
+                    
+                    with mock.patch.object(preferences_dialog, "ORJSON_AVAILABLE", write_orjson):
+                        assert dialog.save_settings() is True
+                    with mock.patch.object(preferences_dialog, "ORJSON_AVAILABLE", read_orjson):
+                        assert dialog.load_settings() == dialog.settings
+                    
+                    assert not settings_file.with_suffix(".json.tmp").exists()
+            print(f"✓ Settings round trip through {len(backends)} JSON backend(s)")
+        
+        # A settings file that cannot be written is reported and not recorded as saved
+        blocker = Path(temp_dir.name) / "blocker"
+        blocker.write_text("")
+        with mock.patch.object(preferences_dialog, "_SETTINGS_FILE", blocker / "settings.json"), \
+             mock.patch.object(preferences_dialog.messagebox, "showerror") as showerror:
+            assert dialog.save_settings() is False
+            assert showerror.called
+        print("✓ Failed save is reported")
+        
+        print("\n🎉 All preferences tests passed!")
+    
+    finally:
+        temp_dir.cleanup()
+
+if __name__ == "__main__":
+    try:
+        test_numeric_entry_validation()
+        test_settings_round_trip()
+    except AssertionError as e:
+        print(f"✗ Preferences test failed: {e}")
+        sys.exit(1)
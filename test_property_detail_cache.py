@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test script for the property detail view cache of the property manager interface
+"""
+
+import sys
+import os
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+import tkinter as tk
+from tkinter import ttk
+from unittest import mock
+from pathlib import Path
+
+from core.database import DatabaseManager
+
+def _wait_until(root, condition, timeout=5.0):
+    """
+    Process Tk events until condition() is true or the timeout expires
+    """
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        root.update()
+        time.sleep(0.01)
+    return True
+
+def test_property_detail_cache():
+    """
+    Test that selecting a property again reuses its cached detail view
+    """
+    print("Testing property detail cache...")
+    
+    # The interface pulls in the wizard and media handling, which need Pillow
+    pytest.importorskip("PIL")
+    from core.property_manager import PropertyManager
+    from gui.components import property_manager_interface
+    
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        pytest.skip(f"No display available: {e}")
+    root.withdraw()
+    
+    # Use a throwaway database so the application data is untouched
+    temp_dir = tempfile.TemporaryDirectory()
+    db_manager = DatabaseManager(Path(temp_dir.name) / "test.db")
+    db_manager.initialize_database()
+    property_manager = PropertyManager(db_manager)
+    
+    # Count the detail fetches that reach the property manager
+    fetched = []
+    get_property_by_id = property_manager.get_property_by_id
+    def counting_get_property_by_id(property_id):
+        fetched.append(property_id)
+        return get_property_by_id(property_id)
+    property_manager.get_property_by_id = counting_get_property_by_id
+    
+    errors = []
+    try:
+        first_id = property_manager.create_property({'title': 'Maison familiale', 'property_type': 'House', 'city': 'Lyon'})
+        second_id = property_manager.create_property({'title': 'Studio centre', 'property_type': 'Studio', 'city': 'Paris'})
+        print(f"✓ Created test properties {first_id} and {second_id}")
+        
+        # Building a detail view must not fail (errors would leave it uncached)
+        with mock.patch.object(property_manager_interface.messagebox, 'showerror',
+                               side_effect=lambda title, message: errors.append(message)):
+            parent = ttk.Frame(root)
+            parent.pack()
+            interface = property_manager_interface.PropertyManagerInterface(parent, property_manager, None)
+            
+            interface.load_property_details(first_id)
+            assert _wait_until(root, lambda: first_id in interface._detail_cache or errors), "first view not built"
+            assert not errors, errors
+            first_view = interface._detail_cache[first_id][0]
+            print("✓ Detail view built and cached")
+            
+            interface.load_property_details(second_id)
+            assert _wait_until(root, lambda: second_id in interface._detail_cache or errors), "second view not built"
+            assert not errors, errors
+            
+            # Selecting the first property again shows the cached view without a fetch
+            interface.load_property_details(first_id)
+            root.update()
+            assert fetched == [first_id, second_id], fetched
+            assert interface._current_detail is first_view
+            assert interface.selected_property_data['title'] == 'Maison familiale'
+            print("✓ Second selection served from the detail cache")
+        
+        print("\n🎉 All property detail cache tests passed!")
+    
+    finally:
+        root.destroy()
+        db_manager.close()
+        temp_dir.cleanup()
+
+if __name__ == "__main__":
+    try:
+        test_property_detail_cache()
+    except AssertionError as e:
+        print(f"✗ Property detail cache test failed: {e}")
+        sys.exit(1)
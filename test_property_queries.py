@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test script for the SQL property list queries (filters, sorting and paging)
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.database import DatabaseManager, casefold
+from pathlib import Path
+
+def test_property_queries():
+    """
+    Test get_properties_page and count_properties
+    """
+    print("Testing property list queries...")
+    
+    # Use a throwaway database so the application data is untouched
+    temp_dir = tempfile.TemporaryDirectory()
+    db_manager = DatabaseManager(Path(temp_dir.name) / "test.db")
+    db_manager.initialize_database()
+    
+    test_properties = [
+        {'title': 'Élégant appartement', 'property_type': 'Apartment', 'price': 320000, 'city': 'Évry', 'status': 'published'},
+        {'title': 'Maison familiale', 'property_type': 'House', 'price': 450000, 'city': 'Lyon', 'status': 'draft'},
+        {'title': 'Studio centre', 'property_type': 'Studio', 'price': 150000, 'city': 'Paris', 'status': 'draft'},
+        {'title': 'Loft industriel', 'property_type': 'Loft', 'price': 600000, 'city': 'Paris', 'status': 'published'},
+        {'title': 'Villa avec piscine', 'property_type': 'Villa', 'price': 900000, 'city': 'Nice', 'status': 'archived'},
+        {'title': 'écurie rénovée', 'property_type': 'House', 'price': 100000, 'city': 'Caen', 'status': 'draft'}
+    ]
+    
+    try:
+        ids = [db_manager.create_property(data) for data in test_properties]
+        print(f"✓ Created {len(ids)} test properties")
+        
+        # Accented search matches regardless of case
+        results = db_manager.get_properties_page({'search': 'évry'})
+        assert [r['title'] for r in results] == ['Élégant appartement'], results
+        assert db_manager.count_properties({'search': 'ÉLÉGANT'}) == 1
+        assert db_manager.count_properties({'city': 'ÉVRY'}) == 1
+        print("✓ Accented search is case-insensitive")
+        
+        # Exact-match and range filters
+        assert db_manager.count_properties({'property_type': 'house'}) == 2
+        assert db_manager.count_properties({'status': 'PUBLISHED'}) == 2
+        assert db_manager.count_properties({'min_price': 300000, 'max_price': 600000}) == 3
+        assert db_manager.count_properties({'city': 'paris', 'min_price': 200000}) == 1
+        assert db_manager.count_properties() == len(test_properties)
+        print("✓ Type, status, price and city filters applied")
+        
+        # Paging returns consecutive, non-overlapping slices
+        ordered = db_manager.get_properties_page(sort_column='price', sort_direction='asc')
+        assert [r['price'] for r in ordered] == sorted(p['price'] for p in test_properties)
+        first_page = db_manager.get_properties_page(sort_column='price', sort_direction='asc', limit=4, offset=0)
+        last_page = db_manager.get_properties_page(sort_column='price', sort_direction='asc', limit=4, offset=4)
+        assert first_page + last_page == ordered
+        assert len(last_page) == 2
+        print("✓ Paging with LIMIT/OFFSET")
+        
+        # Unknown sort columns and directions fall back instead of reaching SQL
+        fallback = db_manager.get_properties_page(sort_column='price; DROP TABLE properties', sort_direction='sideways')
+        default = db_manager.get_properties_page()
+        assert fallback == default
+        assert db_manager.count_properties() == len(test_properties)
+        print("✓ Unknown sort column falls back to updated_at")
+        
+        # Text columns sort with the same case folding as Python's casefold()
+        # ("écurie" comes before "Élégant", unlike with NOCASE)
+        for direction in ('asc', 'desc'):
+            titles = [r['title'] for r in db_manager.get_properties_page(sort_column='title', sort_direction=direction)]
+            assert titles == sorted(titles, key=casefold, reverse=direction == 'desc'), titles
+        print("✓ Text sorting matches casefold() order")
+        
+        # Sorted pages walk an index instead of sorting in a temporary B-tree
+        conn = db_manager.connect()
+        for sort_column, index_name in (('updated_at', 'idx_properties_updated'),
+                                        ('price', 'idx_properties_price'),
+                                        ('city', 'idx_properties_city_casefold'),
+                                        ('property_type', 'idx_properties_type_casefold')):
+            for direction in ('asc', 'desc'):
+                query, params = db_manager._build_properties_page_query(None, sort_column, direction, 50, 0)
+                plan = " ".join(row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {query}", params))
+                assert index_name in plan and "TEMP B-TREE" not in plan, (sort_column, direction, plan)
+        print("✓ Sorted pages use the property list indexes")
+        
+        print("\n🎉 All property query tests passed!")
+    
+    finally:
+        db_manager.close()
+        temp_dir.cleanup()
+
+if __name__ == "__main__":
+    try:
+        test_property_queries()
+    except AssertionError as e:
+        print(f"✗ Property query test failed: {e}")
+        sys.exit(1)
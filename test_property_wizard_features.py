@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Test script for the feature lists offered by the property wizard
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+def test_property_wizard_features():
+    """
+    Test _compute_features against the feature lists of the original wizard
+    """
+    print("Testing property wizard features...")
+    
+    # The wizard module needs Pillow for its media step
+    pytest.importorskip("PIL")
+    from gui.property_wizard import _compute_features
+    
+    # Base, commercial and rental features, sorted without duplicates
+    expected = [
+        'Conference Room', 'Dishwasher', 'Elevator', 'Furnished', 'Garage',
+        'Handicap Accessible', 'Kitchen Facilities', 'Loading Dock', 'Parking',
+        'Pets Allowed', 'Reception Area', 'Security System', 'Smoking Allowed',
+        'Storage Space', 'Television', 'Utilities Included', 'Washing Machine',
+        'WiFi Internet'
+    ]
+    assert list(_compute_features('office', 'rent')) == expected
+    print("✓ Office for rent gets base, commercial and rental features")
+    
+    # Base, residential and sale features, sorted without duplicates
+    expected = [
+        'Air Conditioning', 'Balcony', 'Elevator', 'Fireplace', 'Garage', 'Garden',
+        'Heating', 'Investment Property', 'Mortgage Available', 'New Construction',
+        'Parking', 'Recently Renovated', 'Security System', 'Swimming Pool', 'Terrace'
+    ]
+    assert list(_compute_features('house', 'vente')) == expected
+    print("✓ House for sale gets base, residential and sale features")
+    
+    print("\n🎉 All property wizard feature tests passed!")
+
+if __name__ == "__main__":
+    try:
+        test_property_wizard_features()
+    except AssertionError as e:
+        print(f"✗ Property wizard feature test failed: {e}")
+        sys.exit(1)